@@ -0,0 +1,104 @@
+# accounts/authentication.py
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from accounts.tokens import (
+    acurrent_claims_version,
+    current_claims_version,
+    stale_claims,
+)
+
+
+class ClaimsUser(TokenUser):
+    """
+    The request user rebuilt from a claims token: enough for scoping and
+    permission checks (``pk``, ``role``, ``company_id``), with no User row.
+    Code that needs the model instance loads it by ``pk``.
+    """
+
+    def __init__(self, token):
+        super().__init__(token)
+        self.role = token["role"]
+        self.company_id = token["company_id"]
+
+    def __str__(self):
+        return f"ClaimsUser {self.id}"
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` that trusts the claims stamped by
+    ``ClaimsRefreshToken``. A request costs one cache read to confirm the
+    token's ``claims_version`` is current; only a cache miss reaches the
+    database. Tokens without the claims fall back to loading the user.
+    """
+
+    def get_user(self, validated_token):
+        if "claims_version" not in validated_token:
+            return super().get_user(validated_token)
+
+        current = current_claims_version(self.user_id(validated_token))
+        return self.claims_user(validated_token, current)
+
+    def user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    def claims_user(self, validated_token, current):
+        if current is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if validated_token["claims_version"] != current:
+            raise stale_claims()
+        return ClaimsUser(validated_token)
+
+
+class AsyncJWTAuthentication(ClaimsJWTAuthentication):
+    """
+    ``ClaimsJWTAuthentication`` with awaitable counterparts for async views.
+    Token parsing and validation are pure CPU; the version check and the
+    user lookup go through the async cache and ORM.
+    """
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user_id = self.user_id(validated_token)
+        if "claims_version" in validated_token:
+            current = await acurrent_claims_version(user_id)
+            return self.claims_user(validated_token, current)
+
+        try:
+            user = await self.user_model.objects.aget(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
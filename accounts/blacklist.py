@@ -0,0 +1,137 @@
+# accounts/blacklist.py
+"""
+Housekeeping for simplejwt's token blacklist.
+
+Every refresh rotates the refresh token, which leaves an OutstandingToken
+and a BlacklistedToken row behind for the token's 60-day lifetime.
+``prune_expired_tokens`` deletes the expired ones in chunks, and
+``BlacklistFilter`` keeps a per-process bloom filter of blacklisted jtis so
+checking a valid token usually needs no query.
+"""
+import math
+import threading
+import time
+from hashlib import blake2b
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+class BloomFilter:
+    """
+    A fixed-size bloom filter over strings: no false negatives, false
+    positives at about ``error_rate`` until ``capacity`` items are added.
+    """
+
+    def __init__(self, capacity, error_rate):
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.size = max(bits, 8)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def positions(self, item):
+        # Double hashing: h1 + i*h2 behaves like k independent hashes.
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self.positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self.positions(item)
+        )
+
+
+class BlacklistFilter:
+    """
+    Bloom filter of blacklisted jtis, loaded from the database and topped up
+    with the rows added since (by id) at most every ``sync_seconds``. It is
+    rebuilt every ``rebuild_seconds`` so pruned tokens stop taking up bits.
+
+    A token blacklisted by another process may not be in the filter yet
+    (until the next sync, or the next rebuild if its row committed out of id
+    order). That is safe because rotation re-checks on write:
+    ``ClaimsRefreshToken.blacklist`` rejects a token whose blacklist row
+    already exists, so a replayed refresh token still fails.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.last_id = 0
+        self.synced_at = self.built_at = 0.0
+
+    def might_contain(self, jti):
+        self.sync()
+        return jti in self.bloom
+
+    def add(self, jti):
+        self.sync()
+        with self.lock:
+            self.bloom.add(jti)
+
+    def sync(self):
+        now = time.monotonic()
+        if self.bloom is not None and now - self.synced_at < self.config["sync_seconds"]:
+            return
+        with self.lock:
+            if self.bloom is None or now - self.built_at >= self.config["rebuild_seconds"]:
+                self.bloom = BloomFilter(self.config["capacity"], self.config["error_rate"])
+                self.last_id = 0
+                self.built_at = now
+            rows = (
+                BlacklistedToken.objects.filter(id__gt=self.last_id)
+                .order_by()
+                .values_list("id", "token__jti")
+            )
+            for pk, jti in rows.iterator(chunk_size=10_000):
+                self.bloom.add(jti)
+                self.last_id = max(self.last_id, pk)
+            self.synced_at = now
+
+
+_filter = None
+
+
+def blacklist_filter():
+    """The process-wide BlacklistFilter, or None when it is disabled."""
+    global _filter
+    config = settings.TOKEN_BLACKLIST_BLOOM_FILTER
+    if not config:
+        return None
+    if _filter is None or _filter.config is not config:
+        _filter = BlacklistFilter(config)
+    return _filter
+
+
+def prune_expired_tokens(batch_size=1000, pause=0.0):
+    """
+    Delete expired outstanding tokens and their blacklist rows, ``batch_size``
+    tokens per statement so the tables are never locked for long, sleeping
+    ``pause`` seconds between batches. Returns the number of tokens deleted.
+    """
+    now = timezone.now()
+    deleted = 0
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now)
+            .order_by()
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        # The blacklist rows go with them in one cascading DELETE.
+        OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+        if pause:
+            time.sleep(pause)
@@ -0,0 +1,37 @@
+# accounts/hashers.py
+"""
+Password hashers whose cost comes from settings.
+
+``PASSWORD_HASHER`` picks the one new passwords use; ``check_password``
+re-hashes a password on the next successful login whenever it was stored
+with another hasher or with other cost parameters, so retuning needs no
+migration.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with the cost from settings. Django's default (8 lanes, 100 MiB)
+    is sized for a dedicated auth server; one lane and a smaller memory cost
+    keep a login on one core of a shared API worker.
+    """
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2["time_cost"]
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2["memory_cost"]
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2["parallelism"]
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from accounts.blacklist import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired outstanding refresh tokens and their blacklist rows "
+        "in batches. Safe to run from cron while the API is serving."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Tokens deleted per statement.",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches.",
+        )
+
+    def handle(self, *args, **options):
+        deleted = prune_expired_tokens(options["batch_size"], options["pause"])
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} expired tokens."))
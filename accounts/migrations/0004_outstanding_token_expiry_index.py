@@ -0,0 +1,22 @@
+from django.db import migrations
+
+# simplejwt's OutstandingToken has no index on expires_at, which is what
+# `manage.py prune_tokens` selects on. The table belongs to a third-party
+# app, so the index is created with plain SQL rather than in model state.
+INDEX = "accounts_outstanding_expires_idx"
+TABLE = "token_blacklist_outstandingtoken"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_user_claims_version"),
+        ("token_blacklist", "0012_alter_outstandingtoken_user"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            f"CREATE INDEX IF NOT EXISTS {INDEX} ON {TABLE} (expires_at)",
+            f"DROP INDEX IF EXISTS {INDEX}",
+        ),
+    ]
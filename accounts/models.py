@@ -1,8 +1,37 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.contrib.auth.models import UserManager as AuthUserManager
+from django.db import models, transaction
+from django.db.models import F
 from core.models import Company
 
 
+# update() keywords that change a claim stamped into tokens.
+CLAIM_FIELDS = {"role", "company", "company_id", "is_active"}
+
+
+class UserQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        # save() bumps claims_version when a claim changes; bulk updates of
+        # those fields (e.g. deactivating users) must make tokens stale too.
+        if not CLAIM_FIELDS & kwargs.keys():
+            return super().update(**kwargs)
+
+        from accounts.tokens import republish_claims_versions
+
+        ids = list(self.values_list("pk", flat=True))
+        kwargs.setdefault("claims_version", F("claims_version") + 1)
+        with transaction.atomic(using=self.db):
+            rows = self.model._base_manager.using(self.db).filter(pk__in=ids).update(
+                **kwargs
+            )
+            transaction.on_commit(lambda: republish_claims_versions(ids), using=self.db)
+        return rows
+
+
+class UserManager(AuthUserManager.from_queryset(UserQuerySet)):
+    pass
+
+
 class User(AbstractUser):
     class Role(models.TextChoices):
         ADMIN = "ADMIN", "Admin"
@@ -14,6 +43,47 @@ class User(AbstractUser):
     company = models.ForeignKey(
         Company, null=True, blank=True, on_delete=models.SET_NULL, related_name="users"
     )
+    # Stamped into access tokens (accounts.tokens); bumped whenever a claim
+    # the API authorizes on changes, which makes older tokens stale.
+    claims_version = models.PositiveIntegerField(default=0, editable=False)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]  # keep username for Django admin convenience
+
+    tracked_fields = ("role", "company_id", "is_active")
+
+    objects = UserManager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        instance._loaded_values = {
+            name: loaded[name]
+            for name in cls.tracked_fields
+            if name in loaded and loaded[name] is not models.DEFERRED
+        }
+        return instance
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, "_loaded_values", None)
+        changed = loaded is not None and any(
+            name in loaded and loaded[name] != getattr(self, name)
+            for name in self.tracked_fields
+        )
+        if changed:
+            self.claims_version += 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "claims_version"}
+        super().save(*args, **kwargs)
+
+        self._loaded_values = {name: getattr(self, name) for name in self.tracked_fields}
+        if changed:
+            from accounts.tokens import publish_claims_version
+
+            transaction.on_commit(
+                lambda pk=self.pk, version=self.claims_version: publish_claims_version(
+                    pk, version
+                )
+            )
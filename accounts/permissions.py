@@ -1,17 +1,39 @@
 # accounts/permissions.py
-from rest_framework.permissions import BasePermission, SAFE_METHODS
+from rest_framework.permissions import BasePermission, IsAuthenticated, SAFE_METHODS
+
+from accounts.scope import get_scope, object_company_id
 
 
 class IsAdmin(BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == "ADMIN"
+        return request.user.is_authenticated and get_scope(request).is_admin
 
 
 class IsManager(BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == "MANAGER"
+        return request.user.is_authenticated and get_scope(request).is_manager
 
 
 class IsEmployee(BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == "EMPLOYEE"
+        return request.user.is_authenticated and get_scope(request).is_employee
+
+
+class ScopedPermission(IsAuthenticated):
+    """
+    Authenticated access limited to the user's tenant.
+
+    Objects are checked by company id only; views whose model reaches its
+    company through a relation set ``scope_company_attr`` (e.g.
+    ``"employee.company_id"``) and select that relation in their queryset.
+    """
+
+    def has_permission(self, request, view):
+        if not super().has_permission(request, view):
+            return False
+        get_scope(request)
+        return True
+
+    def has_object_permission(self, request, view, obj):
+        attr = getattr(view, "scope_company_attr", "company_id")
+        return get_scope(request).can_access(object_company_id(obj, attr))
@@ -0,0 +1,80 @@
+# accounts/scope.py
+from operator import attrgetter
+
+from rest_framework.exceptions import PermissionDenied
+
+
+class Scope:
+    """
+    A user's tenant scope, resolved once per request by ``get_scope``.
+
+    Every check works on ids (``company_id``, ``user_id``) so enforcing the
+    scope never loads a related Company or User row.
+    """
+
+    __slots__ = ("role", "company_id", "user_id")
+
+    def __init__(self, role, company_id, user_id):
+        self.role = role
+        self.company_id = company_id
+        self.user_id = user_id
+
+    @classmethod
+    def for_user(cls, user):
+        if not user or not user.is_authenticated:
+            return cls(None, None, None)
+        return cls(user.role, user.company_id, user.pk)
+
+    def __repr__(self):
+        return f"<Scope {self.role} company={self.company_id} user={self.user_id}>"
+
+    @property
+    def is_admin(self):
+        return self.role == "ADMIN"
+
+    @property
+    def is_manager(self):
+        return self.role == "MANAGER"
+
+    @property
+    def is_employee(self):
+        return self.role == "EMPLOYEE"
+
+    def filter(self, queryset, company_field="company_id"):
+        """Restrict ``queryset`` to the user's company; admins see everything."""
+        if self.is_admin:
+            return queryset
+        if self.company_id is None:
+            return queryset.none()
+        return queryset.filter(**{company_field: self.company_id})
+
+    def filter_own(self, queryset, user_field, company_field="company_id"):
+        """Like ``filter()``, but employees only see rows linked to themselves."""
+        queryset = self.filter(queryset, company_field)
+        if self.is_employee:
+            queryset = queryset.filter(**{user_field: self.user_id})
+        return queryset
+
+    def can_access(self, company_id):
+        return self.is_admin or (
+            self.company_id is not None and company_id == self.company_id
+        )
+
+    def check_company(self, company_id, message):
+        if not self.can_access(company_id):
+            raise PermissionDenied(message)
+
+
+def get_scope(request):
+    """Return the request's Scope, resolving it on first use."""
+    http_request = getattr(request, "_request", request)
+    scope = getattr(http_request, "rbac_scope", None)
+    if scope is None:
+        scope = Scope.for_user(request.user)
+        http_request.rbac_scope = scope
+    return scope
+
+
+def object_company_id(obj, attr="company_id"):
+    """Read the owning company id of ``obj`` through a dotted attribute path."""
+    return attrgetter(attr)(obj)
@@ -46,7 +46,8 @@ class RegisterSerializer(serializers.ModelSerializer):
 
         # If Manager creates a user, restrict company
         elif user.role == User.Role.MANAGER:
-            validated_data["company"] = user.company
+            validated_data.pop("company", None)
+            validated_data["company_id"] = user.company_id
 
         # Admin can assign freely
 
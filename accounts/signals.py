@@ -0,0 +1,14 @@
+# accounts/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import User
+from .tokens import republish_claims_versions
+
+
+@receiver(post_delete, sender=User)
+def revoke_claims_on_delete(sender, instance, using, **kwargs):
+    # Without this the cached claims_version keeps the deleted user's
+    # tokens valid until it expires.
+    transaction.on_commit(lambda pk=instance.pk: republish_claims_versions([pk]), using=using)
@@ -0,0 +1,9 @@
+# accounts/tasks.py
+from jobs.queue import task
+
+from .blacklist import prune_expired_tokens
+
+
+@task("accounts.prune_tokens")
+def prune_tokens(batch_size=1000, pause=0.0):
+    return {"deleted": prune_expired_tokens(batch_size, pause)}
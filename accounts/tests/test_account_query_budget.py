@@ -0,0 +1,32 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_login_query_budget(make_org, api_client, assert_query_budget):
+    org = make_org(1)
+    response = assert_query_budget(
+        api_client,
+        "post",
+        "/accounts/api/login/",
+        2,
+        data={"email_or_username": org.admin.email, "password": "pass"},
+        format="json",
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_register_query_budget(api_client, assert_query_budget):
+    response = assert_query_budget(
+        api_client,
+        "post",
+        "/accounts/api/register/",
+        3,
+        data={
+            "email": "new@corp.com",
+            "password": "Secret-pass-123",
+            "password2": "Secret-pass-123",
+        },
+        format="json",
+    )
+    assert response.status_code == 201
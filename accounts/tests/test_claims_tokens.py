@@ -0,0 +1,199 @@
+# accounts/tests/test_claims_tokens.py
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, UntypedToken
+
+from accounts.models import User
+from accounts.tokens import ClaimsRefreshToken
+
+COMPANIES = "/core/api/companies/"
+
+
+def login(api_client, user):
+    response = api_client.post(
+        "/accounts/api/login/",
+        {"email_or_username": user.email, "password": "pass"},
+        format="json",
+    )
+    assert response.status_code == 200
+    return response.data["data"]
+
+
+def bearer(api_client, token):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return api_client
+
+
+def user_queries(ctx):
+    return [q["sql"] for q in ctx.captured_queries if '"accounts_user"' in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_login_issues_claims(make_org, api_client):
+    org = make_org(1)
+    tokens = login(api_client, org.manager)
+
+    claims = UntypedToken(tokens["access"])
+    assert claims["role"] == "MANAGER"
+    assert claims["company_id"] == org.company.id
+    assert claims["claims_version"] == 0
+
+
+@pytest.mark.django_db
+def test_register_issues_claims(api_client):
+    response = api_client.post(
+        "/accounts/api/register/",
+        {"email": "new@corp.com", "password": "Secret-1", "password2": "Secret-1"},
+        format="json",
+    )
+    claims = UntypedToken(response.data["data"]["tokens"]["access"])
+    assert claims["role"] == "EMPLOYEE"
+    assert claims["company_id"] is None
+
+
+@pytest.mark.django_db
+def test_claims_token_skips_user_query(make_org, api_client):
+    org = make_org(1)
+    client = bearer(api_client, login(api_client, org.manager)["access"])
+    client.get(COMPANIES)  # first request loads the version into the cache
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(f"{COMPANIES}?page=1")
+    assert response.status_code == 200
+    assert user_queries(ctx) == []
+
+
+@pytest.mark.django_db
+def test_version_cache_miss_costs_one_query(make_org, api_client):
+    org = make_org(1)
+    client = bearer(api_client, login(api_client, org.manager)["access"])
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(COMPANIES)
+    assert response.status_code == 200
+    assert len(user_queries(ctx)) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_role_change_makes_token_stale_until_refresh(make_org, api_client):
+    org = make_org(1)
+    tokens = login(api_client, org.manager)
+    client = bearer(api_client, tokens["access"])
+    assert client.get(COMPANIES).status_code == 200
+
+    org.manager.role = "EMPLOYEE"
+    org.manager.save()
+
+    response = client.get(COMPANIES)
+    assert response.status_code == 401
+    assert response.data["code"] == "token_stale"
+
+    client.credentials()
+    refreshed = client.post(
+        "/accounts/api/auth/token/refresh/", {"refresh": tokens["refresh"]}, format="json"
+    )
+    assert refreshed.status_code == 200
+    claims = UntypedToken(refreshed.data["access"])
+    assert (claims["role"], claims["claims_version"]) == ("EMPLOYEE", 1)
+    assert bearer(client, refreshed.data["access"]).get(COMPANIES).status_code == 200
+
+
+@pytest.mark.django_db(transaction=True)
+def test_untracked_change_keeps_token_valid(make_org, api_client):
+    org = make_org(1)
+    client = bearer(api_client, login(api_client, org.manager)["access"])
+
+    org.manager.first_name = "Renamed"
+    org.manager.save()
+
+    assert client.get(COMPANIES).status_code == 200
+
+
+@pytest.mark.django_db(transaction=True)
+def test_deactivated_user_is_rejected(make_org, api_client):
+    org = make_org(1)
+    tokens = login(api_client, org.manager)
+
+    org.manager.is_active = False
+    org.manager.save()
+
+    assert bearer(api_client, tokens["access"]).get(COMPANIES).status_code == 401
+    api_client.credentials()
+    refreshed = api_client.post(
+        "/accounts/api/auth/token/refresh/", {"refresh": tokens["refresh"]}, format="json"
+    )
+    assert refreshed.status_code == 401
+
+
+@pytest.mark.django_db(transaction=True)
+def test_deleted_user_is_rejected(make_org, api_client):
+    org = make_org(1)
+    access = login(api_client, org.manager)["access"]
+    client = bearer(api_client, access)
+    assert client.get(COMPANIES).status_code == 200  # version now cached
+
+    org.manager.delete()
+
+    assert client.get(COMPANIES).status_code == 401
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_updates_make_tokens_stale(make_org, api_client):
+    org = make_org(1)
+    manager = bearer(APIClient(), login(api_client, org.manager)["access"])
+    admin = bearer(APIClient(), login(api_client, org.admin)["access"])
+    assert manager.get(COMPANIES).status_code == 200
+    assert admin.get(COMPANIES).status_code == 200
+
+    User.objects.filter(pk=org.manager.pk).update(is_active=False)
+    User.objects.filter(pk=org.admin.pk).update(role="MANAGER")
+    User.objects.filter(pk=org.admin.pk).update(first_name="Untracked")
+
+    assert manager.get(COMPANIES).status_code == 401
+    response = admin.get(COMPANIES)
+    assert response.status_code == 401
+    assert response.data["code"] == "token_stale"
+    assert User.objects.get(pk=org.admin.pk).claims_version == 1
+
+
+@pytest.mark.django_db
+def test_claims_scope_matches_database_user(make_org, api_client):
+    org = make_org(2)
+    other = make_org(2)
+    client = bearer(api_client, login(api_client, org.employee_user)["access"])
+
+    me = client.get("/core/api/employees/me/")
+    assert me.data["data"]["id"] == org.employees[0].id
+    denied = client.get(f"/core/api/employees/{other.employees[0].id}/")
+    assert denied.status_code == 404
+
+
+@pytest.mark.django_db
+def test_plain_access_token_still_loads_user(make_org, api_client):
+    org = make_org(1)
+    client = bearer(api_client, AccessToken.for_user(org.manager))
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(COMPANIES)
+    assert response.status_code == 200
+    assert len(user_queries(ctx)) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_path_checks_claims_version(make_org):
+    org = make_org(1)
+    access = str(ClaimsRefreshToken.for_user(org.manager).access_token)
+    get = async_to_sync(AsyncClient().get)
+    headers = {"Authorization": f"Bearer {access}"}
+    assert get(f"/async{COMPANIES}", headers=headers).status_code == 200
+
+    org.manager.company = None
+    org.manager.save()
+
+    response = get(f"/async{COMPANIES}", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["code"] == "token_stale"
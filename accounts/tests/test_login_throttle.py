@@ -0,0 +1,131 @@
+# accounts/tests/test_login_throttle.py
+import threading
+import time
+
+import pytest
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from accounts.throttling import LoginIPThrottle
+
+LOGIN = "/accounts/api/login/"
+
+
+def attempt(api_client, account, password="wrong", **extra):
+    return api_client.post(
+        LOGIN, {"email_or_username": account, "password": password}, format="json", **extra
+    )
+
+
+@pytest.fixture
+def rates(settings):
+    settings.LOGIN_THROTTLE_RATES = {"login_ip": "6/min", "login_account": "3/min"}
+
+
+@pytest.mark.django_db
+def test_account_bucket_turns_away_guesses_before_hashing(make_org, api_client, rates):
+    org = make_org(1)
+    for _ in range(3):
+        assert attempt(api_client, org.manager.email).status_code == 401
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = attempt(api_client, org.manager.email.upper(), password="pass")
+    assert response.status_code == 429
+    assert int(response["Retry-After"]) > 0
+    assert ctx.captured_queries == []
+
+    # Another account from the same address still has its own bucket.
+    assert attempt(api_client, org.admin.email, password="pass").status_code == 200
+
+
+@pytest.mark.django_db
+def test_ip_bucket_spans_accounts(make_org, api_client, rates):
+    make_org(1)
+    for n in range(6):
+        assert attempt(api_client, f"user{n}@nowhere.com").status_code == 401
+    assert attempt(api_client, "fresh@nowhere.com").status_code == 429
+    other_ip = attempt(api_client, "fresh@nowhere.com", REMOTE_ADDR="10.0.0.9")
+    assert other_ip.status_code == 401
+
+    # A forged X-Forwarded-For does not buy a fresh bucket.
+    spoofed = attempt(api_client, "fresh@nowhere.com", HTTP_X_FORWARDED_FOR="10.9.9.9")
+    assert spoofed.status_code == 429
+
+
+def test_concurrent_burst_spends_each_token_once(rates, monkeypatch):
+    request = RequestFactory().post("/accounts/api/login/", REMOTE_ADDR="10.1.1.1")
+    # caches[] hands each thread its own instance; patch them all.
+    backend = type(LoginIPThrottle().cache)
+    get = backend.get
+
+    def slow_get(*args, **kwargs):
+        # Widen the read-modify-write window.
+        value = get(*args, **kwargs)
+        time.sleep(0.01)
+        return value
+
+    monkeypatch.setattr(backend, "get", slow_get)
+    allowed = []
+    barrier = threading.Barrier(12)
+
+    def login():
+        throttle = LoginIPThrottle()
+        barrier.wait()
+        allowed.append(throttle.allow_request(request, None))
+
+    threads = [threading.Thread(target=login) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert allowed.count(True) == 6
+
+
+@pytest.mark.django_db
+def test_bucket_refills_over_time(make_org, api_client, rates, monkeypatch):
+    org = make_org(1)
+    clock = [1_000_000.0]
+    monkeypatch.setattr("accounts.throttling.time.time", lambda: clock[0])
+    for _ in range(3):
+        attempt(api_client, org.manager.email)
+    assert attempt(api_client, org.manager.email).status_code == 429
+
+    clock[0] += 20  # one attempt's worth at 3/min
+    assert attempt(api_client, org.manager.email, password="pass").status_code == 200
+    assert attempt(api_client, org.manager.email).status_code == 429
+
+
+@pytest.mark.django_db
+def test_token_endpoint_shares_the_account_bucket(make_org, api_client, rates):
+    org = make_org(1)
+    for _ in range(3):
+        attempt(api_client, org.manager.email)
+    response = api_client.post(
+        "/accounts/api/auth/token/",
+        {"email": org.manager.email, "password": "pass"},
+        format="json",
+    )
+    assert response.status_code == 429
+
+
+@pytest.mark.django_db
+def test_login_rehashes_to_the_preferred_hasher(make_org, api_client, settings):
+    org = make_org(1)
+    assert org.manager.password.startswith("md5$")
+    settings.PASSWORD_HASHERS = [
+        "accounts.hashers.TunedPBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ]
+    settings.PASSWORD_PBKDF2_ITERATIONS = 1000
+
+    assert attempt(api_client, org.manager.email, password="pass").status_code == 200
+    org.manager.refresh_from_db()
+    assert org.manager.password.startswith("pbkdf2_sha256$1000$")
+
+    # Retuning the cost upgrades the stored hash on the next login as well.
+    settings.PASSWORD_PBKDF2_ITERATIONS = 1200
+    assert attempt(api_client, org.manager.email, password="pass").status_code == 200
+    org.manager.refresh_from_db()
+    assert org.manager.password.startswith("pbkdf2_sha256$1200$")
+    assert org.manager.claims_version == 0
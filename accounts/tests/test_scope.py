@@ -0,0 +1,55 @@
+import pytest
+from django.test import RequestFactory
+from accounts.scope import Scope, get_scope
+from core.models import Employee
+
+
+@pytest.mark.django_db
+def test_scope_is_resolved_once_per_request(make_org):
+    org = make_org(1)
+    request = RequestFactory().get("/")
+    request.user = org.manager
+
+    scope = get_scope(request)
+    request.user = org.admin
+
+    assert get_scope(request) is scope
+    assert (scope.role, scope.company_id, scope.user_id) == (
+        "MANAGER",
+        org.company.pk,
+        org.manager.pk,
+    )
+
+
+@pytest.mark.django_db
+def test_scope_filters_by_company_and_own_rows(make_org):
+    org = make_org(2)
+    other = make_org(2)
+
+    manager = Scope.for_user(org.manager)
+    employee = Scope.for_user(org.employee_user)
+    admin = Scope.for_user(org.admin)
+    nobody = Scope("MANAGER", None, 99)
+
+    assert set(manager.filter(Employee.objects.all())) == set(org.employees)
+    assert list(employee.filter_own(Employee.objects.all(), "user_id")) == [org.employees[0]]
+    assert admin.filter(Employee.objects.all()).count() == 4
+    assert not nobody.filter(Employee.objects.all()).exists()
+    assert manager.can_access(org.company.pk)
+    assert not manager.can_access(other.company.pk)
+
+
+@pytest.mark.django_db
+def test_cross_tenant_objects_are_hidden(make_org, api_client):
+    org = make_org(1)
+    other = make_org(1)
+
+    api_client.force_authenticate(org.manager)
+    assert api_client.get(f"/core/api/employees/{other.employees[0].pk}/").status_code == 404
+    assert api_client.patch(
+        f"/core/api/projects/{other.projects[0].pk}/", {"name": "x"}, format="json"
+    ).status_code == 404
+
+    api_client.force_authenticate(org.employee_user)
+    response = api_client.get("/reviews/api/reviews/")
+    assert [row["employee"] for row in response.data["data"]] == [org.employees[0].pk]
@@ -0,0 +1,112 @@
+# accounts/tests/test_token_blacklist.py
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from accounts.blacklist import BloomFilter
+from accounts.tokens import ClaimsRefreshToken
+
+REFRESH = "/accounts/api/auth/token/refresh/"
+
+
+@pytest.fixture
+def bloom(settings):
+    settings.TOKEN_BLACKLIST_BLOOM_FILTER = {
+        "capacity": 1000,
+        "error_rate": 0.001,
+        "sync_seconds": 3600,
+        "rebuild_seconds": 3600,
+    }
+
+
+def blacklist_lookups(ctx):
+    return [
+        q["sql"] for q in ctx.captured_queries
+        if q["sql"].startswith("SELECT") and "token_blacklist_blacklistedtoken" in q["sql"]
+    ]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    added = [f"jti-{n}" for n in range(5000)]
+    for jti in added:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in added)
+    false_positives = sum(f"other-{n}" in bloom for n in range(5000))
+    assert false_positives < 150
+
+
+@pytest.mark.django_db
+def test_valid_refresh_skips_blacklist_lookup(make_org, api_client, bloom):
+    org = make_org(1)
+    ClaimsRefreshToken.for_user(org.admin).blacklist()  # warm the filter
+    refresh = str(ClaimsRefreshToken.for_user(org.manager))
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.post(REFRESH, {"refresh": refresh}, format="json")
+    assert response.status_code == 200
+    assert blacklist_lookups(ctx) == []
+
+
+@pytest.mark.django_db
+def test_reused_refresh_token_is_rejected(make_org, api_client, bloom):
+    org = make_org(1)
+    refresh = str(ClaimsRefreshToken.for_user(org.manager))
+    assert api_client.post(REFRESH, {"refresh": refresh}, format="json").status_code == 200
+
+    replay = api_client.post(REFRESH, {"refresh": refresh}, format="json")
+    assert replay.status_code == 401
+
+
+@pytest.mark.django_db
+def test_reuse_is_caught_when_the_filter_missed_it(make_org, api_client, bloom):
+    org = make_org(1)
+    ClaimsRefreshToken.for_user(org.admin).blacklist()  # filter synced, won't resync
+    token = ClaimsRefreshToken.for_user(org.manager)
+    # Blacklisted by "another process": the filter here never saw it.
+    BlacklistedToken.objects.create(token=OutstandingToken.objects.get(jti=token["jti"]))
+
+    replay = api_client.post(REFRESH, {"refresh": str(token)}, format="json")
+    assert replay.status_code == 401
+    assert BlacklistedToken.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_disabled_filter_checks_the_database(make_org, api_client, settings):
+    settings.TOKEN_BLACKLIST_BLOOM_FILTER = None
+    org = make_org(1)
+    refresh = str(ClaimsRefreshToken.for_user(org.manager))
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.post(REFRESH, {"refresh": refresh}, format="json")
+    assert response.status_code == 200
+    assert len(blacklist_lookups(ctx)) >= 1
+
+
+@pytest.mark.django_db
+def test_prune_tokens_deletes_expired_in_batches(make_org, capsys):
+    org = make_org(1)
+    live = ClaimsRefreshToken.for_user(org.manager)
+    expired = []
+    for _ in range(5):
+        token = ClaimsRefreshToken.for_user(org.manager)
+        token.blacklist()
+        expired.append(token["jti"])
+    OutstandingToken.objects.filter(jti__in=expired).update(
+        expires_at=timezone.now() - timedelta(days=1)
+    )
+
+    call_command("prune_tokens", "--batch-size", "2")
+
+    assert "Pruned 5 expired tokens" in capsys.readouterr().out
+    assert list(OutstandingToken.objects.values_list("jti", flat=True)) == [live["jti"]]
+    assert not BlacklistedToken.objects.exists()
@@ -0,0 +1,104 @@
+# accounts/throttling.py
+"""
+Token-bucket throttles for the login endpoint.
+
+Each bucket holds up to ``N`` attempts and refills at ``N`` per period
+(``LOGIN_THROTTLE_RATES``, e.g. ``"5/min"``), so a client may burst ``N``
+attempts and then sustain the rate. Buckets live in the cache as
+``(tokens, updated_at)``. A rejected attempt costs one cache read and never
+reaches the password hasher; an accepted one updates the bucket under a
+short ``cache.add`` lock, so a concurrent burst cannot spend a token twice.
+"""
+import time
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+# Seconds a bucket lock may be held (it outlives a crashed holder by this
+# much), and how long an attempt waits for it before being turned away.
+LOCK_TIMEOUT = 1
+LOCK_WAIT = 0.5
+
+
+def parse_rate(rate):
+    """``"5/min"`` -> ``(5, 60)``: capacity and the seconds to refill it."""
+    count, period = rate.split("/")
+    return int(count), PERIODS[period[0]]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    scope = None
+
+    def __init__(self):
+        self.capacity, self.period = parse_rate(settings.LOGIN_THROTTLE_RATES[self.scope])
+        self.cache = caches[settings.LOGIN_THROTTLE_CACHE_ALIAS]
+        self.retry_after = None
+
+    def get_key(self, request):
+        raise NotImplementedError(".get_key() must be overridden")
+
+    def allow_request(self, request, view):
+        key = self.get_key(request)
+        if key is None:
+            return True
+        key = f"throttle:{self.scope}:{key}"
+
+        # Other attempts only ever take tokens, so a bucket that looks empty
+        # without the lock is empty: reject on the plain read.
+        if not self.has_token(key):
+            return False
+        if not self.acquire(key):
+            self.retry_after = LOCK_WAIT
+            return False
+        try:
+            if not self.has_token(key):
+                return False
+            self.cache.set(key, (self.tokens - 1, self.now), self.period)
+            return True
+        finally:
+            self.cache.delete(f"{key}:lock")
+
+    def has_token(self, key):
+        self.now = now = time.time()
+        tokens, updated_at = self.cache.get(key, (self.capacity, now))
+        rate = self.capacity / self.period
+        self.tokens = tokens = min(self.capacity, tokens + (now - updated_at) * rate)
+        if tokens < 1:
+            self.retry_after = (1 - tokens) / rate
+            return False
+        return True
+
+    def acquire(self, key):
+        deadline = time.monotonic() + LOCK_WAIT
+        while not self.cache.add(f"{key}:lock", 1, LOCK_TIMEOUT):
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def wait(self):
+        return self.retry_after
+
+
+class LoginIPThrottle(TokenBucketThrottle):
+    scope = "login_ip"
+
+    def get_key(self, request):
+        # REMOTE_ADDR, or X-Forwarded-For behind REST_FRAMEWORK["NUM_PROXIES"]
+        # trusted proxies; a client cannot pick its own bucket.
+        return self.get_ident(request)
+
+
+class LoginAccountThrottle(TokenBucketThrottle):
+    scope = "login_account"
+
+    def get_key(self, request):
+        # LoginView takes email_or_username, the simplejwt views email.
+        account = request.data.get("email_or_username") or request.data.get("email")
+        if not isinstance(account, str) or not account:
+            return None
+        # Hashed: cache keys must stay short and free of whitespace.
+        return md5(account.strip().lower().encode()).hexdigest()
@@ -0,0 +1,197 @@
+# accounts/tokens.py
+"""
+JWTs that carry the claims the API authorizes on.
+
+``ClaimsRefreshToken`` stamps ``role``, ``company_id`` and ``claims_version``
+into the token so ``ClaimsJWTAuthentication`` can build the request user
+without loading the User row. A user's ``claims_version`` goes up whenever
+their role, company or active flag changes; the current version lives in
+the cache and tokens stamped with an older one are rejected. Deleted and
+deactivated users have ``REVOKED`` cached instead, so their tokens stop
+working at once rather than when the cached version expires.
+"""
+from django.conf import settings
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from accounts.blacklist import blacklist_filter
+
+CLAIMS = ("role", "company_id", "claims_version")
+PREFIX = "auth:claims"
+# Cached for deleted or inactive users; no token carries it.
+REVOKED = -1
+
+
+def get_cache():
+    return caches[settings.AUTH_CLAIMS_CACHE_ALIAS]
+
+
+def claims_version_key(user_id):
+    return f"{PREFIX}:{user_id}"
+
+
+def publish_claims_version(user_id, version):
+    """Make ``version`` the one tokens for ``user_id`` must carry."""
+    get_cache().set(
+        claims_version_key(user_id), version, settings.AUTH_CLAIMS_CACHE_TIMEOUT
+    )
+
+
+def republish_claims_versions(user_ids):
+    """
+    Re-read the versions of ``user_ids`` from the database and cache them,
+    ``REVOKED`` for users that are gone or inactive. Run on commit after a
+    write the model's ``save()`` does not see: a delete or a bulk update.
+    """
+    from accounts.models import User
+
+    current = dict(
+        User.objects.filter(pk__in=user_ids, is_active=True).values_list(
+            "pk", "claims_version"
+        )
+    )
+    get_cache().set_many(
+        {claims_version_key(pk): current.get(pk, REVOKED) for pk in user_ids},
+        settings.AUTH_CLAIMS_CACHE_TIMEOUT,
+    )
+
+
+def remember_claims_version(user_id, version):
+    # add(), not set(): a version read from the database before a concurrent
+    # change committed must not overwrite the one that change published.
+    get_cache().add(
+        claims_version_key(user_id), version, settings.AUTH_CLAIMS_CACHE_TIMEOUT
+    )
+
+
+def claims_version_query(user_id):
+    from accounts.models import User
+
+    return User.objects.filter(pk=user_id, is_active=True).values_list(
+        "claims_version", flat=True
+    )
+
+
+def current_claims_version(user_id):
+    """
+    The version tokens for ``user_id`` must carry, or None for a deleted or
+    inactive user. Read from the cache; a miss loads it from the database.
+    """
+    version = get_cache().get(claims_version_key(user_id))
+    if version is None:
+        version = claims_version_query(user_id).first()
+        if version is not None:
+            remember_claims_version(user_id, version)
+    return None if version == REVOKED else version
+
+
+async def acurrent_claims_version(user_id):
+    cache = get_cache()
+    key = claims_version_key(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        version = await claims_version_query(user_id).afirst()
+        if version is not None:
+            await cache.aadd(key, version, settings.AUTH_CLAIMS_CACHE_TIMEOUT)
+    return None if version == REVOKED else version
+
+
+def stale_claims():
+    return AuthenticationFailed(
+        "Token claims are out of date; refresh the token.", code="token_stale"
+    )
+
+
+class ClaimsAccessToken(AccessToken):
+    pass
+
+
+class ClaimsRefreshToken(RefreshToken):
+    access_token_class = ClaimsAccessToken
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token.stamp(user)
+        return token
+
+    def stamp(self, user):
+        """(Re)write the authorization claims from ``user``."""
+        for claim in CLAIMS:
+            self[claim] = getattr(user, claim)
+
+    def check_blacklist(self):
+        bloom = blacklist_filter()
+        if bloom is not None and not bloom.might_contain(self[api_settings.JTI_CLAIM]):
+            return
+        super().check_blacklist()
+
+    def blacklist(self):
+        """
+        Blacklist this token, failing if it already was: the write itself is
+        the reuse check, so a replayed refresh token is caught even when the
+        bloom filter has not seen its blacklisting yet.
+        """
+        jti = self[api_settings.JTI_CLAIM]
+        token, _ = OutstandingToken.objects.get_or_create(
+            jti=jti,
+            defaults={"token": str(self), "expires_at": datetime_from_epoch(self["exp"])},
+        )
+        try:
+            with transaction.atomic():
+                blacklisted = BlacklistedToken.objects.create(token=token)
+        except IntegrityError:
+            raise TokenError("Token is blacklisted")
+        bloom = blacklist_filter()
+        if bloom is not None:
+            bloom.add(jti)
+        return blacklisted, True
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = ClaimsRefreshToken
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh that re-reads the user, so an access token minted from an old
+    refresh token carries the user's current claims rather than copies of
+    the stale ones.
+    """
+
+    token_class = ClaimsRefreshToken
+
+    def validate(self, attrs):
+        from accounts.models import User
+
+        refresh = self.token_class(attrs["refresh"])
+        user = User.objects.filter(
+            pk=refresh[api_settings.USER_ID_CLAIM], is_active=True
+        ).first()
+        if user is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        refresh.stamp(user)
+
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+
+        return data
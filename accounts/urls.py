@@ -1,10 +1,15 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from .throttling import LoginAccountThrottle, LoginIPThrottle
 from .views import LoginView, RegisterView
 
 urlpatterns = [
     path("api/login/", LoginView.as_view(), name="login"),
     path("api/register/", RegisterView.as_view(), name="login"),
-    path("api/auth/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
+    path(
+        "api/auth/token/",
+        TokenObtainPairView.as_view(throttle_classes=[LoginIPThrottle, LoginAccountThrottle]),
+        name="token_obtain_pair",
+    ),
     path("api/auth/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
 ]
@@ -2,7 +2,8 @@ from django.shortcuts import render
 from accounts.models import User
 from accounts.serializers import RegisterSerializer
 from config.response import CustomResponse
-from rest_framework_simplejwt.tokens import RefreshToken
+from accounts.throttling import LoginAccountThrottle, LoginIPThrottle
+from accounts.tokens import ClaimsRefreshToken
 from rest_framework import status, generics
 from rest_framework.views import APIView
 
@@ -20,7 +21,7 @@ class RegisterView(generics.CreateAPIView):
         if serializer.is_valid():
             user = serializer.save()
 
-            refresh = RefreshToken.for_user(user)
+            refresh = ClaimsRefreshToken.for_user(user)
             access_token = str(refresh.access_token)
 
             return CustomResponse(
@@ -50,6 +51,10 @@ class RegisterView(generics.CreateAPIView):
 
 
 class LoginView(APIView):
+    # Checked before the password is hashed, so a burst of guesses is
+    # turned away for the price of a cache read.
+    throttle_classes = [LoginIPThrottle, LoginAccountThrottle]
+
     def post(self, request):
         email_or_username = request.data.get("email_or_username")
         password = request.data.get("password")
@@ -79,7 +84,7 @@ class LoginView(APIView):
             )
 
         # Tokens & data
-        refresh = RefreshToken.for_user(user)
+        refresh = ClaimsRefreshToken.for_user(user)
         access_token = str(refresh.access_token)
 
         return CustomResponse(
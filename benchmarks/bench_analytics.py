@@ -0,0 +1,59 @@
+"""
+Time the workforce analytics for one company.
+
+    python -m benchmarks.bench_analytics [--employees 200000] [--repeat 20]
+
+"before" pulls every employee's department, designation, hire date and
+project count and aggregates in Python, which is what the front-end did
+through the list endpoint (minus the HTTP). "after" is
+core.analytics.workforce_stats: GROUP BY queries plus percentiles over the
+per-hire-date histogram.
+"""
+import argparse
+from collections import Counter
+from datetime import date
+
+from benchmarks.common import format_timing, measure, seed, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django("bench_analytics.sqlite3")
+    from django.db.models import Count
+
+    from core.analytics import np, workforce_stats
+    from core.models import Employee
+
+    company_ids, _ = seed(employees=args.employees, projects=args.employees // 10)
+    employees = Employee.objects.filter(company_id=company_ids[0])
+    today = date.today()
+
+    def client_side():
+        rows = employees.annotate(load=Count("projects")).values_list(
+            "department_id", "designation", "hired_on", "load"
+        )
+        departments, designations, loads, tenure = Counter(), Counter(), Counter(), []
+        for department_id, designation, hired_on, load in rows:
+            departments[department_id] += 1
+            designations[designation] += 1
+            loads[load] += 1
+            if hired_on:
+                tenure.append((today - hired_on).days)
+        tenure.sort()
+        return [tenure[int(p * (len(tenure) - 1))] for p in (0.5, 0.9, 0.95)]
+
+    print(f"numpy {'available' if np is not None else 'missing: pure-Python percentiles'}")
+    print(f"company size: {employees.count()} employees")
+    for label, fn in {
+        "client-side aggregation": client_side,
+        "workforce_stats": lambda: workforce_stats(employees),
+    }.items():
+        print(format_timing(label, measure(fn, repeat=args.repeat, warmup=2)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compare the API's hot queries with and without the composite indexes.
+
+    python -m benchmarks.bench_indexes [--employees 200000] [--repeat 200]
+
+Seeds a scratch SQLite database, then for each query prints the EXPLAIN
+plan and p50/p99 latency with the composite indexes dropped ("before")
+and recreated ("after").
+"""
+import argparse
+
+from benchmarks.common import format_timing, measure, seed, setup_django
+
+
+def access_paths(company_id, department_id):
+    from django.db.models import Q
+
+    from core.models import Employee, Project
+    from reviews.models import EmployeeReview
+
+    return {
+        "employee company+dept+designation": lambda: Employee.objects.filter(
+            company_id=company_id, department_id=department_id, designation="Engineer"
+        ).order_by("id")[:50],
+        "employee company order by name": lambda: Employee.objects.filter(
+            company_id=company_id
+        ).order_by("name", "id")[:50],
+        "employee company order by hired_on": lambda: Employee.objects.filter(
+            company_id=company_id
+        ).order_by("hired_on", "id")[:50],
+        "employee keyset name (admin)": lambda: Employee.objects.filter(
+            Q(name__gte="Employee 0010000")
+            & (Q(name__gt="Employee 0010000") | Q(id__gt=0))
+        ).order_by("name", "id")[:50],
+        "project company+start_date range": lambda: Project.objects.filter(
+            company_id=company_id,
+            start_date__gte="2015-01-01",
+            start_date__lte="2015-06-30",
+        ).order_by("start_date", "id")[:50],
+        "project company+end_date": lambda: Project.objects.filter(
+            company_id=company_id, end_date__gte="2020-01-01"
+        ).order_by("end_date", "id")[:50],
+        "review company+stage": lambda: EmployeeReview.objects.filter(
+            employee__company_id=company_id, current_stage="UNDER_APPROVAL"
+        ).order_by("id")[:50],
+    }
+
+
+def composite_indexes():
+    from django.apps import apps
+
+    for model in apps.get_models():
+        if model._meta.app_label in ("core", "reviews"):
+            for index in model._meta.indexes:
+                yield model, index
+
+
+def run(label, queries, repeat):
+    print(f"\n=== {label} ===")
+    for name, build in queries.items():
+        print(f"\n-- {name}")
+        print(build().explain())
+        print(format_timing(name, measure(lambda: list(build()), repeat=repeat)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    parser.add_argument("--projects", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django("bench_indexes.sqlite3")
+    from django.db import connection
+
+    company_ids, department_ids = seed(employees=args.employees, projects=args.projects)
+    queries = access_paths(company_ids[0], department_ids[0])
+    indexes = list(composite_indexes())
+
+    with connection.schema_editor() as editor:
+        for model, index in indexes:
+            editor.remove_index(model, index)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    run("before (FK indexes only)", queries, args.repeat)
+
+    with connection.schema_editor() as editor:
+        for model, index in indexes:
+            editor.add_index(model, index)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    run("after (composite indexes)", queries, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
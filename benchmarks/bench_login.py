@@ -0,0 +1,94 @@
+"""
+Measure logins/sec per core through LoginView for each hasher setting.
+
+    python -m benchmarks.bench_login [--repeat 50]
+
+Runs single-threaded, so 1000 / mean ms is the throughput of one core.
+"before" is Django's stock PBKDF2 (1,000,000 iterations); "after" rows are
+the tuned hashers from accounts/hashers.py (argon2 needs argon2-cffi and
+is skipped without it) and a credential-stuffing burst that the login
+token buckets turn away before any hashing.
+"""
+import argparse
+import importlib.util
+
+from benchmarks.common import format_timing, measure, setup_django
+
+STOCK_PBKDF2 = "django.contrib.auth.hashers.PBKDF2PasswordHasher"
+SCENARIOS = [
+    ("before: stock PBKDF2 (1M iterations)", [STOCK_PBKDF2], {}),
+    (
+        "after: argon2id t=2 m=19MiB p=1",
+        ["accounts.hashers.TunedArgon2PasswordHasher"],
+        {"PASSWORD_ARGON2": {"time_cost": 2, "memory_cost": 19456, "parallelism": 1}},
+    ),
+    (
+        "after: PBKDF2 600k iterations",
+        ["accounts.hashers.TunedPBKDF2PasswordHasher"],
+        {"PASSWORD_PBKDF2_ITERATIONS": 600_000},
+    ),
+]
+UNTHROTTLED = {"login_ip": "1000000/s", "login_account": "1000000/s"}
+
+
+def login(client, user):
+    def run():
+        response = client.post(
+            "/accounts/api/login/",
+            {"email_or_username": user.email, "password": "bench-pass"},
+            format="json",
+        )
+        assert response.status_code in (200, 429), response.status_code
+
+    return run
+
+
+def report(label, timing):
+    print(f"{format_timing(label, timing)}  {1000 / timing['mean']:9.1f} logins/s/core")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django("bench_login.sqlite3")
+    from django.contrib.auth import get_user_model
+    from django.core.cache import cache
+    from django.test.utils import override_settings
+    from rest_framework.test import APIClient
+
+    User = get_user_model()
+    user, _ = User.objects.get_or_create(
+        email="bench-login@example.com", defaults={"username": "bench-login"}
+    )
+    client = APIClient()
+
+    for label, hashers, extra in SCENARIOS:
+        if "Argon2" in hashers[0] and importlib.util.find_spec("argon2") is None:
+            print(f"{label:<40} skipped: pip install argon2-cffi")
+            continue
+        with override_settings(
+            PASSWORD_HASHERS=hashers, LOGIN_THROTTLE_RATES=UNTHROTTLED, **extra
+        ):
+            user.set_password("bench-pass")
+            user.save(update_fields=["password"])
+            report(label, measure(login(client, user), repeat=args.repeat, warmup=2))
+
+    # A burst against one account: after the bucket's five attempts every
+    # request is a 429 that never reaches the hasher.
+    cache.clear()
+    with override_settings(
+        PASSWORD_HASHERS=[STOCK_PBKDF2],
+        LOGIN_THROTTLE_RATES={"login_ip": "1000000/s", "login_account": "5/min"},
+    ):
+        user.set_password("bench-pass")
+        user.save(update_fields=["password"])
+        report(
+            "after: throttled burst (stock PBKDF2)",
+            measure(login(client, user), repeat=args.repeat * 20, warmup=5),
+        )
+
+
+if __name__ == "__main__":
+    main()
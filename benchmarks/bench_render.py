@@ -0,0 +1,53 @@
+"""
+Time building and rendering a max-size (100-row) employee page.
+
+    python -m benchmarks.bench_render [--repeat 500]
+
+Serializes one page with EmployeeSerializer once, then times wrapping it
+in CustomResponse and rendering the envelope with DRF's JSONRenderer
+("before") and config.renderers.FastJSONRenderer ("after").
+"""
+import argparse
+
+from benchmarks.common import format_timing, measure, seed, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    setup_django("bench_render.sqlite3")
+    from rest_framework.renderers import JSONRenderer
+
+    from config.pagination import CustomPagination
+    from config.renderers import FastJSONRenderer, orjson
+    from config.response import CustomResponse
+    from core.models import Employee
+    from core.serializers import EmployeeSerializer
+
+    seed(employees=args.employees, projects=args.employees // 10)
+    rows = list(Employee.objects.order_by("id")[: CustomPagination.max_page_size])
+    data = EmployeeSerializer(rows, many=True).data
+    pagination = {"next": None, "previous": None, "per_page": len(rows)}
+
+    def envelope():
+        return CustomResponse(data, status=200, pagination=pagination).data
+
+    body = envelope()
+    stock, fast = JSONRenderer(), FastJSONRenderer()
+    timings = {
+        "serializer (100 rows)": lambda: EmployeeSerializer(rows, many=True).data,
+        "CustomResponse envelope": envelope,
+        "render: DRF JSONRenderer": lambda: stock.render(body),
+        "render: FastJSONRenderer": lambda: fast.render(body),
+    }
+    print(f"orjson {'available' if orjson else 'missing: FastJSONRenderer falls back'}")
+    print(f"page size: {len(stock.render(body))} bytes")
+    for label, fn in timings.items():
+        print(format_timing(label, measure(fn, repeat=args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
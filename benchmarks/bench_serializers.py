@@ -0,0 +1,64 @@
+"""
+Rows per second for serializing list pages.
+
+    python -m benchmarks.bench_serializers [--repeat 200]
+
+Times one max-size (100-row) page of employees and of projects through the
+ModelSerializer the endpoints used before ("before": model instances, plus
+the assigned_employees prefetch for projects) and through the
+config.rows.RowSerializer plans the list endpoints use now ("after":
+``.values()`` rows, plus one through-table query for projects). Both
+include the queries.
+"""
+import argparse
+
+from benchmarks.common import format_timing, measure, seed, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django("bench_serializers.sqlite3")
+    from django.db.models import Prefetch
+
+    from config.pagination import CustomPagination
+    from core.models import Employee, Project
+    from core.serializers import (
+        EmployeeRowSerializer,
+        EmployeeSerializer,
+        ProjectRowSerializer,
+        ProjectSerializer,
+    )
+
+    seed(employees=args.employees, projects=args.employees // 10)
+    size = CustomPagination.max_page_size
+    employees = Employee.objects.order_by("id")
+    projects = Project.objects.prefetch_related(
+        Prefetch("assigned_employees", queryset=Employee.objects.only("id").order_by("id"))
+    ).order_by("id")
+
+    def rows(row_serializer_class, queryset):
+        row_serializer = row_serializer_class()
+        return row_serializer.serialize(row_serializer.values(queryset)[:size])
+
+    cases = {
+        "employees: EmployeeSerializer": lambda: EmployeeSerializer(
+            employees[:size], many=True
+        ).data,
+        "employees: EmployeeRowSerializer": lambda: rows(EmployeeRowSerializer, employees),
+        "projects: ProjectSerializer": lambda: ProjectSerializer(
+            projects[:size], many=True
+        ).data,
+        "projects: ProjectRowSerializer": lambda: rows(ProjectRowSerializer, projects),
+    }
+    for label, fn in cases.items():
+        assert len(fn()) == size, label
+        timing = measure(fn, repeat=args.repeat)
+        print(format_timing(label, timing), f"{size / (timing['p50'] / 1000):,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Shared helpers for the scripts in ``benchmarks/``.
+
+Run benchmarks from the repository root so ``config.settings`` and the
+``.env`` it reads are found, e.g. ``python -m benchmarks.bench_indexes``.
+Each script works on a throwaway SQLite file, never on ``db.sqlite3``.
+"""
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+
+def setup_django(db_name="benchmark.sqlite3", migrate=True):
+    """Configure Django against a scratch database in the temp directory."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    from django.conf import settings
+
+    path = os.path.join(tempfile.gettempdir(), db_name)
+    settings.DATABASES["default"]["NAME"] = path
+    settings.DEBUG = False
+
+    import django
+
+    django.setup()
+    if migrate:
+        from django.core.management import call_command
+
+        call_command("migrate", verbosity=0)
+    return path
+
+
+def seed(companies=10, departments=10, employees=20_000, projects=2_000, batch=5_000):
+    """
+    Bulk-load a synthetic org (skipping signals) and rebuild the counters.
+    Returns ``(company ids, department ids)``.
+    """
+    from core.counters import rebuild_counters
+    from core.models import Company, Department, Employee, Project
+    from reviews.models import EmployeeReview
+
+    if Company.objects.exists():
+        return (
+            list(Company.objects.values_list("id", flat=True)),
+            list(Department.objects.values_list("id", flat=True)),
+        )
+
+    company_objs = Company.objects.bulk_create(
+        [Company(name=f"Company {c}") for c in range(companies)]
+    )
+    dept_objs = Department.objects.bulk_create(
+        [
+            Department(company=company, name=f"Dept {d}")
+            for company in company_objs
+            for d in range(departments)
+        ]
+    )
+
+    designations = ["Engineer", "Manager", "Analyst", "Designer", "Support"]
+    start = date(2010, 1, 1)
+    rows = []
+    for i in range(employees):
+        dept = dept_objs[i % len(dept_objs)]
+        rows.append(
+            Employee(
+                company_id=dept.company_id,
+                department=dept,
+                name=f"Employee {i:07d}",
+                email=f"employee{i}@example.com",
+                mobile=f"0100{i:07d}",
+                designation=designations[i % len(designations)],
+                hired_on=None if i % 50 == 0 else start + timedelta(days=i % 5000),
+            )
+        )
+        if len(rows) >= batch:
+            Employee.objects.bulk_create(rows)
+            rows = []
+    Employee.objects.bulk_create(rows)
+
+    project_rows = []
+    for i in range(projects):
+        dept = dept_objs[i % len(dept_objs)]
+        begin = start + timedelta(days=(i * 7) % 5000)
+        project_rows.append(
+            Project(
+                company_id=dept.company_id,
+                department=dept,
+                name=f"Project {i:06d}",
+                start_date=begin,
+                end_date=begin + timedelta(days=30 + i % 300),
+            )
+        )
+    Project.objects.bulk_create(project_rows, batch_size=batch)
+
+    stages = [choice for choice, _ in EmployeeReview.Stage.choices]
+    employee_ids = list(Employee.objects.values_list("id", flat=True))
+    reviews = [
+        EmployeeReview(employee_id=pk, current_stage=stages[n % len(stages)])
+        for n, pk in enumerate(employee_ids)
+    ]
+    EmployeeReview.objects.bulk_create(reviews, batch_size=batch)
+
+    rebuild_counters()
+    return [c.id for c in company_objs], [d.id for d in dept_objs]
+
+
+def measure(fn, repeat=200, warmup=5):
+    """Run ``fn`` ``repeat`` times and return ``{"p50": ms, "p99": ms, "mean": ms}``."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - begin) * 1000)
+    samples.sort()
+    return {
+        "p50": samples[len(samples) // 2],
+        "p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        "mean": statistics.fmean(samples),
+    }
+
+
+def format_timing(label, timing):
+    return (
+        f"{label:<40} p50={timing['p50']:8.3f}ms  p99={timing['p99']:8.3f}ms"
+        f"  mean={timing['mean']:8.3f}ms"
+    )
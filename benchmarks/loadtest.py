@@ -0,0 +1,183 @@
+"""
+Load-test the read endpoints on the WSGI stack and on the async (ASGI) path.
+
+    pip install uvicorn gunicorn
+    python -m benchmarks.loadtest [--concurrency 256] [--duration 20] [--workers 4]
+
+Seeds a scratch database, mints a JWT for a manager and starts, in turn,
+
+* ``gunicorn config.wsgi`` serving the DRF views (``/core/api/...``), and
+* ``uvicorn config.asgi`` serving their async twins (``/async/core/api/...``),
+
+each with the same number of worker processes. A stdlib asyncio client then
+holds ``--concurrency`` keep-alive connections open against every endpoint
+and reports requests/s, error count and p50/p99 latency. Use ``--url`` to
+point the client at servers you started yourself instead.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+from benchmarks.common import seed, setup_django
+
+ENDPOINTS = [
+    "/core/api/companies/",
+    "/core/api/departments/",
+    "/core/api/employees/?per_page=50",
+    "/core/api/employees/?per_page=50&cursor=",
+    "/core/api/employees/me/",
+    "/core/api/projects/?per_page=50",
+    "/reviews/api/reviews/?per_page=50&cursor=",
+]
+
+SERVERS = {
+    "wsgi": (
+        ["gunicorn", "config.wsgi:application", "--workers", "{workers}",
+         "--bind", "127.0.0.1:{port}", "--log-level", "warning"],
+        "",
+    ),
+    "asgi": (
+        ["uvicorn", "config.asgi:application", "--workers", "{workers}",
+         "--port", "{port}", "--log-level", "warning", "--no-access-log"],
+        "/async",
+    ),
+}
+
+
+def prepare(employees):
+    from django.contrib.auth import get_user_model
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from core.models import Employee
+
+    path = setup_django("loadtest.sqlite3")
+    companies, _ = seed(employees=employees, projects=employees // 10)
+    User = get_user_model()
+    manager, _ = User.objects.get_or_create(
+        email="loadtest@example.com",
+        defaults={"username": "loadtest", "role": "MANAGER", "company_id": companies[0]},
+    )
+    employee = Employee.objects.filter(company_id=companies[0]).first()
+    Employee.objects.filter(pk=employee.pk).update(user=manager)
+    return path, str(AccessToken.for_user(manager))
+
+
+async def fetch(reader, writer, host, path, token):
+    writer.write(
+        (
+            f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Authorization: Bearer {token}\r\nConnection: keep-alive\r\n\r\n"
+        ).encode()
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def client(base, path, token, deadline, samples, errors):
+    parts = urlsplit(base)
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port)
+    try:
+        while time.perf_counter() < deadline:
+            begin = time.perf_counter()
+            status = await fetch(reader, writer, parts.netloc, path, token)
+            samples.append((time.perf_counter() - begin) * 1000)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run_load(base, path, token, concurrency, duration):
+    samples, errors = [], []
+    deadline = time.perf_counter() + duration
+    results = await asyncio.gather(
+        *(client(base, path, token, deadline, samples, errors) for _ in range(concurrency)),
+        return_exceptions=True,
+    )
+    errors.extend(r for r in results if isinstance(r, Exception))
+    samples.sort()
+    if not samples:
+        return {"rps": 0.0, "p50": 0.0, "p99": 0.0, "errors": len(errors)}
+    return {
+        "rps": len(samples) / duration,
+        "p50": samples[len(samples) // 2],
+        "p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        "errors": len(errors),
+    }
+
+
+def start_server(kind, workers, port, db_path):
+    command, _ = SERVERS[kind]
+    env = dict(
+        os.environ,
+        DJANGO_SETTINGS_MODULE="benchmarks.server_settings",
+        BENCH_DB=db_path,
+        # Measure the views themselves, not the sync path's response cache.
+        RESPONSE_CACHE_TIMEOUT="0",
+    )
+    args = [part.format(workers=workers, port=port) for part in command]
+    process = subprocess.Popen(args, env=env)
+    time.sleep(3)
+    if process.poll() is not None:
+        sys.exit(f"{args[0]} exited; is it installed?")
+    return process
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--employees", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--url", action="append", metavar="KIND=BASE",
+        help="benchmark running servers instead, e.g. asgi=http://127.0.0.1:8000/async",
+    )
+    args = parser.parse_args()
+
+    db_path, token = prepare(args.employees)
+    targets = dict(url.split("=", 1) for url in args.url or [])
+
+    for kind in ("wsgi", "asgi"):
+        process = None
+        if targets:
+            if kind not in targets:
+                continue
+            base = targets[kind]
+        else:
+            process = start_server(kind, args.workers, args.port, db_path)
+            base = f"http://127.0.0.1:{args.port}{SERVERS[kind][1]}"
+        try:
+            print(f"\n{kind.upper()} ({base}), concurrency={args.concurrency}")
+            for path in ENDPOINTS:
+                stats = asyncio.run(
+                    run_load(base, path, token, args.concurrency, args.duration)
+                )
+                print(
+                    f"  {path:<45} {stats['rps']:9.1f} req/s  p50={stats['p50']:8.2f}ms"
+                    f"  p99={stats['p99']:8.2f}ms  errors={stats['errors']}"
+                )
+        finally:
+            if process is not None:
+                process.send_signal(signal.SIGTERM)
+                process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""
+Settings for servers started by ``benchmarks.loadtest``: the project
+settings pointed at the benchmark database named by ``BENCH_DB``.
+"""
+import os
+
+from config.settings import *  # noqa: F401,F403
+from config.settings import DATABASES
+
+DATABASES["default"]["NAME"] = os.environ["BENCH_DB"]
+DEBUG = False
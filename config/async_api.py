@@ -0,0 +1,142 @@
+# config/async_api.py
+"""
+Async read path for the hot GET endpoints.
+
+``AsyncReadView`` serves ``list``/``retrieve`` for an existing viewset on
+Django's async view machinery: authentication, scoping, filtering,
+pagination and serialization are the viewset's own, only the queries run
+on the async ORM. Under ASGI these views never block the event loop on a
+worker thread except for filter validation that looks rows up.
+"""
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.urls import path
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.request import Request
+
+from accounts.authentication import AsyncJWTAuthentication
+from config.renderers import dumps
+from config.response import envelope
+
+
+def json_response(payload, status=200, headers=None):
+    return HttpResponse(
+        dumps(payload), status=status, headers=headers, content_type="application/json"
+    )
+
+
+def error_response(exc, request):
+    detail = exc.detail
+    payload = detail if isinstance(detail, (list, dict)) else {"detail": detail}
+    headers = None
+    if exc.status_code == 401:
+        authenticator = request.authenticators[0]
+        headers = {"WWW-Authenticate": authenticator.authenticate_header(request)}
+    return json_response(payload, status=exc.status_code, headers=headers)
+
+
+class AsyncReadView(View):
+    viewset_class = None
+    basename = None
+    action = "list"
+    # False for viewsets whose retrieve returns the bare serializer data.
+    retrieve_envelope = True
+
+    http_method_names = ["get", "head", "options"]
+
+    async def get(self, request, *args, **kwargs):
+        drf_request = Request(request, authenticators=[AsyncJWTAuthentication()])
+        try:
+            await self.authenticate(drf_request)
+            view = self.get_viewset(drf_request, kwargs)
+            view.check_permissions(drf_request)
+            payload = await getattr(self, self.action)(view, drf_request, **kwargs)
+        except APIException as exc:
+            return error_response(exc, drf_request)
+        if isinstance(payload, HttpResponse):
+            return payload
+        return json_response(payload)
+
+    async def authenticate(self, request):
+        authenticator = request.authenticators[0]
+        result = await authenticator.aauthenticate(request)
+        if result is None:
+            # Mark authentication as done so DRF never retries it synchronously.
+            request._authenticator = None
+            request._not_authenticated()
+            return
+        request._authenticator = authenticator
+        request.user, request.auth = result
+
+    def get_viewset(self, request, kwargs):
+        return self.viewset_class(
+            request=request,
+            args=(),
+            kwargs=kwargs,
+            format_kwarg=None,
+            action=self.action,
+            basename=self.basename,
+            detail=self.action == "retrieve",
+        )
+
+    async def filter_queryset(self, view, request, queryset):
+        # Filter validation may look rows up (``?company=1``); without query
+        # parameters the backends only build the queryset.
+        if request.query_params:
+            return await sync_to_async(view.filter_queryset)(queryset)
+        return view.filter_queryset(queryset)
+
+    async def list(self, view, request):
+        get_list_queryset = getattr(view, "get_list_queryset", view.get_queryset)
+        queryset = await self.filter_queryset(view, request, get_list_queryset())
+        row_serializer_class = getattr(view, "row_serializer_class", None)
+        if row_serializer_class is not None:
+            row_serializer = row_serializer_class(view.get_serializer_context())
+            queryset = row_serializer.values(queryset)
+
+        paginator = view.paginator
+        page = None
+        if paginator is not None:
+            page = await paginator.apaginate_queryset(queryset, request, view=view)
+        paginated = page is not None
+        if not paginated:
+            page = [item async for item in queryset]
+        if row_serializer_class is not None:
+            data = await row_serializer.aserialize(page)
+        else:
+            data = view.get_serializer(page, many=True).data
+        if not paginated:
+            return envelope(data, 200, "Success")
+        return envelope(data, 200, "Success", paginator.get_pagination_meta())
+
+    async def retrieve(self, view, request, pk):
+        queryset = await self.filter_queryset(view, request, view.get_queryset())
+        try:
+            instance = await queryset.aget(pk=pk)
+        except queryset.model.DoesNotExist:
+            raise NotFound()
+        view.check_object_permissions(request, instance)
+        data = view.get_serializer(instance).data
+        return envelope(data, 200, "Success") if self.retrieve_envelope else data
+
+
+def read_routes(prefix, viewset_class, basename, retrieve_envelope=True):
+    """``path()`` entries for the async list and retrieve of one viewset."""
+    return [
+        path(
+            f"{prefix}/",
+            AsyncReadView.as_view(viewset_class=viewset_class, basename=basename),
+            name=f"async-{basename}-list",
+        ),
+        path(
+            f"{prefix}/<int:pk>/",
+            AsyncReadView.as_view(
+                viewset_class=viewset_class,
+                basename=basename,
+                action="retrieve",
+                retrieve_envelope=retrieve_envelope,
+            ),
+            name=f"async-{basename}-detail",
+        ),
+    ]
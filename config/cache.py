@@ -0,0 +1,164 @@
+# config/cache.py
+import time
+from datetime import date
+from functools import wraps
+from hashlib import md5
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import parse_http_date_safe
+
+from accounts.scope import get_scope
+from config.conditional import not_modified, set_validators
+from config.response import CustomResponse
+
+PREFIX = "resp"
+GENERATION_KEY = f"{PREFIX}:generation"
+
+
+def get_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def version_key(company_id):
+    # Admins read across companies, so they share one version that every
+    # write bumps; everybody else is keyed to their own company.
+    return f"{PREFIX}:v:{company_id or 'all'}"
+
+
+def get_versions(company_id):
+    """
+    Return ``(generation, version)`` in one round trip. Missing keys are
+    seeded from the clock so a version evicted from the cache can never
+    come back at a value that old entries were stored under.
+    """
+    cache = get_cache()
+    keys = [GENERATION_KEY, version_key(company_id)]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns())
+            found[key] = cache.get(key)
+    return found[GENERATION_KEY], found[keys[1]]
+
+
+def _incr(keys):
+    cache = get_cache()
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Not seeded yet; the next reader starts from a fresh version.
+            pass
+
+
+def bump_versions(company_ids):
+    """
+    Invalidate cached reads for ``company_ids`` and for admins. The bump
+    runs now and again on commit, so a reader that re-caches the old rows
+    while the transaction is still open is invalidated as well.
+    """
+    keys = [version_key(None)] + [version_key(pk) for pk in set(company_ids) if pk]
+    _incr(keys)
+    transaction.on_commit(lambda: _incr(keys))
+
+
+def invalidate_all():
+    _incr([GENERATION_KEY])
+    transaction.on_commit(lambda: _incr([GENERATION_KEY]))
+
+
+def record(name, outcome):
+    cache = get_cache()
+    key = f"{PREFIX}:stats:{name}:{outcome}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1):
+            cache.incr(key)
+
+
+def cache_stats(names):
+    """Hit/miss totals per viewset basename, shared by every process."""
+    cache = get_cache()
+    keys = [f"{PREFIX}:stats:{name}:{outcome}" for name in names for outcome in ("hit", "miss")]
+    found = cache.get_many(keys)
+    stats = {}
+    for name in names:
+        hits = found.get(f"{PREFIX}:stats:{name}:hit", 0)
+        misses = found.get(f"{PREFIX}:stats:{name}:miss", 0)
+        total = hits + misses
+        stats[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else None,
+        }
+    return stats
+
+
+def response_cache_key(view, request):
+    scope = get_scope(request)
+    generation, version = get_versions(None if scope.is_admin else scope.company_id)
+    owner = scope.user_id if scope.is_employee else ""
+    params = urlencode(sorted(request.query_params.lists()), doseq=True)
+    digest = md5(f"{request.path}?{params}".encode()).hexdigest()
+    # The date is part of the key because some fields (days_employed) are
+    # derived from it.
+    return (
+        f"{PREFIX}:{view.basename}:{scope.role}:{scope.company_id}:{owner}:"
+        f"{generation}:{version}:{date.today().isoformat()}:{digest}"
+    )
+
+
+def cache_response(method):
+    """
+    Serve a viewset's ``list``/``retrieve`` from the response cache. Only
+    200 responses are stored, together with their ``ETag``/``Last-Modified``
+    so a hit can still answer 304; hits are rebuilt as ``CustomResponse``
+    and marked with ``X-Cache: HIT``.
+    """
+
+    @wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        if not settings.RESPONSE_CACHE_TIMEOUT:
+            return method(self, request, *args, **kwargs)
+
+        cache = get_cache()
+        key = response_cache_key(self, request)
+        cached = cache.get(key)
+        if cached is not None:
+            record(self.basename, "hit")
+            validators = cached["validators"]
+            response = validators and not_modified(request, *validators)
+            if not response:
+                response = CustomResponse(status=200, **cached["body"])
+                if validators:
+                    set_validators(response, *validators)
+            response["X-Cache"] = "HIT"
+            return response
+
+        record(self.basename, "miss")
+        response = method(self, request, *args, **kwargs)
+        if response.status_code == 200:
+            validators = None
+            if response.has_header("ETag"):
+                validators = (
+                    response["ETag"],
+                    parse_http_date_safe(response.get("Last-Modified", "")),
+                )
+            body = {
+                "data": response.data["data"],
+                "message": response.data["message"],
+                "pagination": response.data.get("pagination"),
+            }
+            cache.set(
+                key,
+                {"body": body, "validators": validators},
+                settings.RESPONSE_CACHE_TIMEOUT,
+            )
+        response["X-Cache"] = "MISS"
+        return response
+
+    return wrapper
@@ -0,0 +1,120 @@
+# config/conditional.py
+from datetime import date, datetime, time
+from functools import wraps
+from hashlib import md5
+
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from accounts.scope import get_scope
+from config.pagination import KeysetPagination
+
+
+def list_validators(view, request):
+    """ETag/Last-Modified for a list: ``Max(updated_at)`` and count within scope."""
+    get_list_queryset = getattr(view, "get_list_queryset", view.get_queryset)
+    queryset = view.filter_queryset(get_list_queryset())
+    paginator = view.paginator
+    if (
+        isinstance(paginator, KeysetPagination)
+        and paginator.cursor_query_param in request.query_params
+    ):
+        return page_validators(
+            view, request, paginator.keyset_queryset(queryset, request, view)
+        )
+
+    stats = queryset.order_by().aggregate(
+        last_modified=Max("updated_at"), count=Count("pk")
+    )
+    # Lets CustomPagination skip its own COUNT(*).
+    view.list_count = stats["count"]
+    return build_validators(view, request, stats["last_modified"], stats["count"])
+
+
+def page_validators(view, request, queryset):
+    """
+    ETag for a keyset page from its own rows (and the look-ahead row), so
+    cursor pages stay free of a scope-wide COUNT(*). There is no
+    Last-Modified: without a count, ``updated_at`` cannot see deletes.
+    """
+    rows = list(queryset.values_list("pk", "updated_at"))
+    etag, _ = build_validators(view, request, None, rows)
+    return etag, None
+
+
+def object_validators(view, request, instance):
+    return build_validators(view, request, instance.updated_at, 1)
+
+
+def build_validators(view, request, last_modified, state):
+    scope = get_scope(request)
+    parts = [
+        view.basename,
+        scope.role,
+        scope.company_id,
+        scope.user_id,
+        request.get_full_path(),
+        last_modified.isoformat() if last_modified else "",
+        state,
+    ]
+    if getattr(view, "conditional_daily", False):
+        # Part of the representation is derived from today's date.
+        today = date.today()
+        parts.append(today.isoformat())
+        midnight = timezone.make_aware(datetime.combine(today, time.min))
+        last_modified = max(last_modified, midnight) if last_modified else midnight
+
+    etag = quote_etag(md5("|".join(map(str, parts)).encode()).hexdigest())
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return etag, timestamp
+
+
+def not_modified(request, etag, timestamp):
+    """Return a 304 response when the request's validators still match, else None."""
+    response = get_conditional_response(
+        request._request, etag=etag, last_modified=timestamp
+    )
+    if response is not None:
+        set_validators(response, etag, timestamp)
+    return response
+
+
+def set_validators(response, etag, timestamp):
+    response["ETag"] = etag
+    if timestamp is not None:
+        response["Last-Modified"] = http_date(timestamp)
+    # Bodies depend on who is asking; clients must revalidate every time.
+    patch_vary_headers(response, ["Authorization"])
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_response(method):
+    """
+    Answer ``If-None-Match``/``If-Modified-Since`` on a viewset's ``list``
+    or ``retrieve`` with a 304 before anything is serialized, and stamp
+    ``ETag``/``Last-Modified`` on 200 responses.
+    """
+
+    @wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        if method.__name__ == "retrieve":
+            instance = self.get_object()
+            # The view's retrieve calls get_object() again; reuse this one.
+            self.get_object = lambda: instance
+            etag, timestamp = object_validators(self, request, instance)
+        else:
+            etag, timestamp = list_validators(self, request)
+
+        response = not_modified(request, etag, timestamp)
+        if response is not None:
+            return response
+
+        response = method(self, request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, etag, timestamp)
+        return response
+
+    return wrapper
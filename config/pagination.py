@@ -1,3 +1,10 @@
+import base64
+import json
+
+from django.core import exceptions
+from django.core.paginator import InvalidPage, Paginator as DjangoPaginator
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
@@ -7,6 +14,36 @@ class CustomPagination(PageNumberPagination):
     page_size_query_param = "per_page"
     max_page_size = 100
 
+    def paginate_queryset(self, queryset, request, view=None):
+        # Conditional GETs already counted the list (config/conditional.py).
+        self.known_count = getattr(view, "list_count", None)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """``paginate_queryset`` for async views, on the async ORM."""
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.known_count = await queryset.acount()
+        paginator = self.django_paginator_class(queryset, page_size)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(
+                self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            )
+        self.request = request
+        self.page.object_list = [item async for item in self.page.object_list]
+        return self.page.object_list
+
+    def django_paginator_class(self, queryset, page_size):
+        paginator = DjangoPaginator(queryset, page_size)
+        if self.known_count is not None:
+            paginator.count = self.known_count
+        return paginator
+
     def get_pagination_meta(self):
         return {
             "first_page": 1,
@@ -15,3 +52,196 @@ class CustomPagination(PageNumberPagination):
             "per_page": self.page.paginator.per_page,
             "total_count": self.page.paginator.count,
         }
+
+
+class KeysetPagination(CustomPagination):
+    """
+    CustomPagination with an opt-in keyset (cursor) mode.
+
+    Requests without a ``cursor`` query parameter keep the page-number
+    behaviour. Passing ``?cursor=`` (empty for the first page) switches to
+    keyset paging on ``(ordering field, id)``: no ``COUNT(*)`` and no
+    ``OFFSET`` scan, so deep pages cost the same as the first one.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    unsupported_ordering_message = (
+        "Cursor pages need a field ordering; pass ?ordering= (e.g. with ?search=) "
+        "or page by number."
+    )
+
+    keyset = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            self.keyset = False
+            return super().paginate_queryset(queryset, request, view)
+        return self.keyset_page(list(self.keyset_queryset(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            self.keyset = False
+            return await super().apaginate_queryset(queryset, request, view)
+        queryset = self.keyset_queryset(queryset, request, view)
+        return self.keyset_page([item async for item in queryset])
+
+    def keyset_queryset(self, queryset, request, view):
+        """The ordered, filtered ``per_page + 1`` slice for the requested cursor."""
+        self.keyset = True
+        self.request = request
+        self.page = None
+        self.per_page = self.get_page_size(request) or self.page_size
+        self.field, self.descending = self.get_keyset_ordering(queryset, view)
+
+        model_field = queryset.model._meta.get_field(self.field) if self.field else None
+        cursor = self.decode_cursor(
+            request.query_params[self.cursor_query_param], model_field
+        )
+        self.cursor = cursor
+        self.reverse = reverse = bool(cursor and cursor.get("r"))
+
+        self.nullable = bool(model_field and model_field.null)
+        queryset = queryset.order_by(
+            *self.get_keyset_order_by(self.descending != reverse, reverse)
+        )
+        if cursor:
+            queryset = queryset.filter(self.get_keyset_filter(cursor, reverse))
+        return queryset[: self.per_page + 1]
+
+    def keyset_page(self, results):
+        has_more = len(results) > self.per_page
+        results = results[: self.per_page]
+
+        if self.reverse:
+            results.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, self.cursor is not None
+
+        self.next_cursor = (
+            self.encode_cursor(results[-1], reverse=False)
+            if has_next and results
+            else None
+        )
+        self.previous_cursor = (
+            self.encode_cursor(results[0], reverse=True)
+            if has_previous and results
+            else None
+        )
+        return results
+
+    def get_keyset_ordering(self, queryset, view):
+        """
+        Return ``(field, descending)`` for the leading ordering term, falling
+        back to the view's default ordering. ``field`` is None when the page
+        is ordered by primary key only. Expression orderings, such as search
+        relevance, cannot be encoded in a cursor and are rejected rather than
+        silently paged in id order.
+        """
+        ordering = list(queryset.query.order_by) or list(
+            getattr(view, "ordering", None) or []
+        )
+        term = ordering[0] if ordering else "id"
+        if not isinstance(term, str):
+            raise ValidationError(
+                {self.cursor_query_param: self.unsupported_ordering_message}
+            )
+
+        descending = term.startswith("-")
+        name = term.lstrip("-")
+        if name in ("id", "pk"):
+            return None, descending
+        return name, descending
+
+    def get_keyset_order_by(self, descending, nulls_first):
+        direction = "desc" if descending else "asc"
+        order_by = [getattr(F("id"), direction)()]
+        if self.field:
+            nulls = {}
+            if self.nullable:
+                nulls = {"nulls_first": True} if nulls_first else {"nulls_last": True}
+            order_by.insert(0, getattr(F(self.field), direction)(**nulls))
+        return order_by
+
+    def get_keyset_filter(self, cursor, reverse):
+        # Rows sort as (field, id) with NULLs last; walking backwards flips
+        # the comparison and visits the NULL block first.
+        after = "lt" if self.descending != reverse else "gt"
+        value, pk = cursor.get("v"), cursor["id"]
+        field = self.field
+
+        if not field:
+            return Q(**{f"id__{after}": pk})
+
+        if value is None:
+            condition = Q(**{f"{field}__isnull": True, f"id__{after}": pk})
+            if reverse and self.nullable:
+                condition |= Q(**{f"{field}__isnull": False})
+            return condition
+
+        # The redundant leading range lets the (field, id) index seek to
+        # the cursor instead of scanning from the start.
+        bound = f"{after}e"
+        condition = Q(**{f"{field}__{bound}": value}) & (
+            Q(**{f"{field}__{after}": value}) | Q(**{f"id__{after}": pk})
+        )
+        if self.nullable and not reverse:
+            condition |= Q(**{f"{field}__isnull": True})
+        return condition
+
+    def encode_cursor(self, item, reverse):
+        # Pages are model instances, or .values() rows for row serializers.
+        if isinstance(item, dict):
+            payload = {"id": item["id"]}
+            value = item.get(self.field)
+        else:
+            payload = {"id": item.pk}
+            value = item.serializable_value(self.field) if self.field else None
+        if self.field:
+            payload["v"] = value.isoformat() if hasattr(value, "isoformat") else value
+        if reverse:
+            payload["r"] = 1
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, value, field=None):
+        """
+        Parse a cursor, converting its ``v`` with the ordering ``field`` so
+        a forged value fails here rather than in the seek query.
+        """
+        if not value:
+            return None
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            cursor = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            cursor["id"] = int(cursor["id"])
+            if field is not None and cursor.get("v") is not None:
+                cursor["v"] = field.to_python(cursor["v"])
+        except (TypeError, ValueError, KeyError, exceptions.ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def get_pagination_meta(self):
+        if not self.keyset:
+            return super().get_pagination_meta()
+        return {
+            "first_page": None,
+            "last_page": None,
+            "current_page": None,
+            "per_page": self.per_page,
+            "total_count": None,
+            "next_cursor": self.next_cursor,
+            "previous_cursor": self.previous_cursor,
+        }
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response(
+            {
+                "next_cursor": self.next_cursor,
+                "previous_cursor": self.previous_cursor,
+                "results": data,
+            }
+        )
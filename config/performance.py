@@ -0,0 +1,330 @@
+# config/performance.py
+"""
+Per-request performance instrumentation.
+
+``PerformanceMiddleware`` records, for every request, the resolved view,
+the wall time, the number and total time of database queries, the time
+spent rendering the response body after the view returned, and its size.
+Serializer work done inside the view (``serializer.data``) is part of the
+request time, not the render time. The numbers
+go into in-process histograms keyed by ``(view, method)``, served to admins
+as JSON by ``MetricsView`` and as Prometheus text by ``PrometheusMetricsView``.
+Histograms are per process: scrape each worker, or sum across them.
+
+Requests slower than ``PERFORMANCE_SLOW_REQUEST_MS`` are written to the
+``performance`` logger with their slowest queries and the project code
+that issued them. Finding that code walks the stack, so it is only done
+for queries that are slow themselves, once the request is past the slow
+threshold, or for the ``PERFORMANCE_CALL_SITE_SAMPLE_RATE`` share of
+requests.
+"""
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+from rest_framework.views import APIView
+
+from accounts.permissions import IsAdmin
+from config.response import CustomResponse
+
+logger = logging.getLogger("performance")
+
+SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERIES = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+BYTES = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# name -> (buckets, help); the order is the order of the exposition.
+METRICS = {
+    "request_seconds": (SECONDS, "Wall time from the first middleware to the last."),
+    "db_queries": (QUERIES, "Database queries per request."),
+    "db_seconds": (SECONDS, "Time spent in database queries per request."),
+    "response_render_seconds": (
+        SECONDS,
+        "Time spent rendering the response body after the view returned.",
+    ),
+    "response_bytes": (BYTES, "Size of the response body."),
+}
+
+PROJECT_ROOT = str(settings.BASE_DIR) + os.sep
+MAX_RECORDED_QUERIES = 500
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # the last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Estimate the q-quantile by interpolating inside its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, in_bucket in enumerate(self.counts):
+            if seen + in_bucket >= rank and in_bucket:
+                lower = self.bounds[index - 1] if index else 0
+                if index == len(self.bounds):
+                    return lower
+                upper = self.bounds[index]
+                return lower + (upper - lower) * (rank - seen) / in_bucket
+            seen += in_bucket
+        return self.bounds[-1]
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.series = {}
+
+    def observe(self, view, method, values):
+        with self.lock:
+            series = self.series.get((view, method))
+            if series is None:
+                series = self.series[(view, method)] = {
+                    name: Histogram(buckets) for name, (buckets, _) in METRICS.items()
+                }
+            for name, value in values.items():
+                series[name].observe(value)
+
+    def reset(self):
+        with self.lock:
+            self.series.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return [
+                {
+                    "view": view,
+                    "method": method,
+                    **{name: hist.snapshot() for name, hist in series.items()},
+                }
+                for (view, method), series in sorted(self.series.items())
+            ]
+
+    def prometheus(self):
+        lines = []
+        with self.lock:
+            for name, (_, help_text) in METRICS.items():
+                metric = f"http_{name}"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+                for (view, method), series in sorted(self.series.items()):
+                    hist = series[name]
+                    labels = f'view="{view}",method="{method}"'
+                    cumulative = 0
+                    for bound, in_bucket in zip(
+                        (*hist.bounds, "+Inf"), hist.counts
+                    ):
+                        cumulative += in_bucket
+                        lines.append(
+                            f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}'
+                        )
+                    lines.append(f"{metric}_sum{{{labels}}} {hist.sum}")
+                    lines.append(f"{metric}_count{{{labels}}} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+class RequestRecorder:
+    __slots__ = (
+        "queries",
+        "query_count",
+        "db_seconds",
+        "render_started",
+        "slow_query",
+        "slow_after",
+        "sampled",
+    )
+
+    def __init__(self, started):
+        self.queries = []
+        self.query_count = 0
+        self.db_seconds = 0.0
+        self.render_started = None
+        self.slow_query = settings.PERFORMANCE_SLOW_QUERY_MS / 1000
+        self.slow_after = started + settings.PERFORMANCE_SLOW_REQUEST_MS / 1000
+        self.sampled = random.random() < settings.PERFORMANCE_CALL_SITE_SAMPLE_RATE
+
+    def wants_call_site(self, elapsed, now):
+        return self.sampled or elapsed >= self.slow_query or now >= self.slow_after
+
+
+current_recorder = ContextVar("performance_recorder", default=None)
+
+
+def call_site():
+    """``file:line in function`` of the innermost project frame."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(PROJECT_ROOT)
+            and "site-packages" not in filename
+            and filename != __file__
+        ):
+            relative = filename[len(PROJECT_ROOT):]
+            return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "?"
+
+
+def record_query(execute, sql, params, many, context):
+    recorder = current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        now = time.perf_counter()
+        elapsed = now - started
+        recorder.query_count += 1
+        recorder.db_seconds += elapsed
+        if len(recorder.queries) < MAX_RECORDED_QUERIES:
+            site = call_site() if recorder.wants_call_site(elapsed, now) else "?"
+            recorder.queries.append((elapsed, sql, site))
+
+
+def install_query_recorder(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+# Connections opened later (e.g. the async ORM's worker thread) get the
+# wrapper from the signal; ones already open in this thread from __call__.
+connection_created.connect(install_query_recorder)
+
+
+def view_name(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        # Unresolved paths share one series so 404 scans can't add labels.
+        return "<unresolved>"
+    return match.view_name or match._func_path
+
+
+class PerformanceMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        for connection in connections.all():
+            install_query_recorder(connection)
+        started = time.perf_counter()
+        recorder = RequestRecorder(started)
+        token = current_recorder.set(recorder)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        self.finish(request, response, recorder, started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        recorder = RequestRecorder(started)
+        token = current_recorder.set(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        self.finish(request, response, recorder, started)
+        return response
+
+    def process_template_response(self, request, response):
+        # Called just before DRF renders the Response. Serializers already
+        # ran inside the view, so the span from here until our __call__
+        # returns is render time only (encoding the body), not serialization.
+        recorder = current_recorder.get()
+        if recorder is not None:
+            recorder.render_started = time.perf_counter()
+        return response
+
+    def finish(self, request, response, recorder, started):
+        finished = time.perf_counter()
+        elapsed = finished - started
+        render = finished - recorder.render_started if recorder.render_started else 0.0
+        size = len(response.content) if not response.streaming else 0
+        view = view_name(request)
+        registry.observe(
+            view,
+            request.method,
+            {
+                "request_seconds": elapsed,
+                "db_queries": recorder.query_count,
+                "db_seconds": recorder.db_seconds,
+                "response_render_seconds": render,
+                "response_bytes": size,
+            },
+        )
+        if elapsed * 1000 >= settings.PERFORMANCE_SLOW_REQUEST_MS:
+            log_slow_request(request, response, view, elapsed, recorder)
+
+
+def log_slow_request(request, response, view, elapsed, recorder):
+    slowest = sorted(recorder.queries, key=lambda query: query[0], reverse=True)
+    lines = [
+        f"{request.method} {request.get_full_path()} -> {response.status_code} "
+        f"[{view}] {elapsed * 1000:.1f}ms, {recorder.query_count} queries "
+        f"in {recorder.db_seconds * 1000:.1f}ms"
+    ]
+    for seconds, sql, site in slowest[: settings.PERFORMANCE_SLOW_REQUEST_QUERIES]:
+        lines.append(f"  {seconds * 1000:8.2f}ms  {site}\n      {sql[:2000]}")
+    logger.warning("\n".join(lines))
+
+
+class MetricsView(APIView):
+    """Per-view request histograms of this process, for admins."""
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        return CustomResponse(data=registry.snapshot(), status=200)
+
+
+class PrometheusMetricsView(APIView):
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        return HttpResponse(
+            registry.prometheus(), content_type="text/plain; version=0.0.4"
+        )
@@ -1,6 +1,48 @@
 from rest_framework.response import Response
 
 
+def envelope(data, status, message, pagination=None):
+    """The body every API response shares (also used by the async views)."""
+    custom_data = {
+        "status_code": int(status) if status else None,
+        "data": data,
+        "message": message,
+    }
+
+    # ✅ Add pagination info inside response body
+    if pagination:
+        custom_data["pagination"] = pagination
+    return custom_data
+
+
+NON_FIELD_KEYS = ("non_field_errors", "detail", "details")
+
+
+def dict_error_message(errors):
+    for key in errors:
+        if key in NON_FIELD_KEYS:
+            message = errors[key]
+            return message[0] if isinstance(message, list) else message
+    message = errors[next(iter(errors))]
+    if isinstance(message, list):
+        return message[0]
+    return message if isinstance(message, str) else str(message)
+
+
+def error_message(data):
+    """
+    The message for an error response: the first non-field error if there
+    is one, else the first field's first error.
+    """
+    if isinstance(data, list):
+        data = data[0]
+        if not isinstance(data, dict):
+            return data if isinstance(data, str) else str(data)
+    if isinstance(data, dict):
+        return dict_error_message(data)
+    return str(data)
+
+
 class CustomResponse(Response):
     def __init__(
         self,
@@ -13,64 +55,15 @@ class CustomResponse(Response):
         content_type=None,
         pagination=None,  # ✅ keep here if you want, but don’t pass to super()
     ):
-        non_field_keys = ["non_field_errors", "detail", "details"]
-
         if status and status < 400:
-            message = message if message else "Success"
-        else:
-            if not message:
-                if isinstance(data, dict):
-                    for key in data:
-                        if key in non_field_keys:
-                            message = data[key]
-                            if isinstance(message, list):
-                                message = message[0]
-                            break
-                    else:
-                        error_key = next(iter(data))
-                        error_message = data[error_key]
-                        if isinstance(error_message, list):
-                            message = error_message[0]
-                        elif isinstance(error_message, str):
-                            message = error_message
-                        else:
-                            message = str(error_message)
-                elif isinstance(data, list):
-                    error_message = data[0]
-                    if isinstance(error_message, dict):
-                        for key in error_message:
-                            if key in non_field_keys:
-                                message = error_message[key]
-                                if isinstance(message, list):
-                                    message = message[0]
-                                break
-                        else:
-                            error_key = next(iter(error_message))
-                            message = error_message[error_key]
-                            if isinstance(message, list):
-                                message = message[0]
-                            elif not isinstance(message, str):
-                                message = str(message)
-                    elif isinstance(error_message, str):
-                        message = error_message
-                    else:
-                        message = str(error_message)
-                else:
-                    message = str(data)
-                data = {}
-
-        custom_data = {
-            "status_code": int(status) if status else None,
-            "data": data,
-            "message": message,
-        }
-
-        # ✅ Add pagination info inside response body
-        if pagination:
-            custom_data["pagination"] = pagination
+            # Success responses, the common case, never look at error shapes.
+            message = message or "Success"
+        elif not message:
+            message = error_message(data)
+            data = {}
 
         super().__init__(
-            custom_data,
+            envelope(data, status, message, pagination),
             status=status,
             template_name=template_name,
             headers=headers,
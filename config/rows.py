@@ -0,0 +1,127 @@
+# config/rows.py
+"""
+Read-only list serialization straight from ``.values()`` rows.
+
+A ``RowSerializer`` mirrors a DRF ``ModelSerializer``: on first use it
+compiles the serializer's fields into a plan of ``(name, column, convert)``
+entries, and afterwards turns each row dict into the same output without
+model instances, field binding or per-row ``get_attribute`` calls. Values
+keep ``None`` as ``None`` and otherwise go through the DRF field's own
+``to_representation``; plain string and integer fields pass through, which
+is all that method would do to them.
+
+Many-to-many primary keys come from one query on the through table;
+``aserialize()`` runs it on the async ORM.
+``SerializerMethodField``\\s are computed by ``get_<name>(value)`` on the
+row serializer from the column named in ``method_sources``.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+
+
+class RowSerializer:
+    serializer_class = None
+    # SerializerMethodField name -> the column its get_<name>() receives.
+    method_sources = {}
+
+    _plans = {}
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.plan, self.many, self.columns = self.compile()
+
+    @classmethod
+    def compile(cls):
+        if cls not in cls._plans:
+            cls._plans[cls] = cls.build_plan()
+        return cls._plans[cls]
+
+    @classmethod
+    def build_plan(cls):
+        model = cls.serializer_class.Meta.model
+        plan, many, columns = [], [], ["id"]
+        for name, field in cls.serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if isinstance(field, serializers.SerializerMethodField):
+                column, convert = cls.method_sources[name], f"get_{name}"
+            elif isinstance(field, serializers.ManyRelatedField):
+                many.append((name, model._meta.get_field(field.source)))
+                plan.append((name, None, None))
+                continue
+            elif "." in field.source or field.source == "*":
+                raise ImproperlyConfigured(
+                    f"{cls.__name__} cannot read {name!r} (source {field.source!r}) "
+                    "from a values() row."
+                )
+            else:
+                column = model._meta.get_field(field.source).attname
+                if isinstance(
+                    field,
+                    (
+                        serializers.PrimaryKeyRelatedField,
+                        serializers.CharField,
+                        serializers.IntegerField,
+                    ),
+                ):
+                    convert = None
+                else:
+                    convert = field.to_representation
+            plan.append((name, column, convert))
+            if column not in columns:
+                columns.append(column)
+        return tuple(plan), tuple(many), tuple(columns)
+
+    def values(self, queryset):
+        """``queryset`` as the row dicts ``serialize()`` takes."""
+        return queryset.prefetch_related(None).values(*self.columns)
+
+    def serialize(self, rows):
+        rows = list(rows)
+        related = {
+            name: self.group(self.links(field, rows)) for name, field in self.many
+        }
+        return self.build(rows, related)
+
+    async def aserialize(self, rows):
+        rows = list(rows)
+        related = {}
+        for name, field in self.many:
+            related[name] = self.group([link async for link in self.links(field, rows)])
+        return self.build(rows, related)
+
+    def build(self, rows, related):
+        plan = [
+            (name, column, getattr(self, convert) if isinstance(convert, str) else convert)
+            for name, column, convert in self.plan
+        ]
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, convert in plan:
+                if column is None:
+                    item[name] = related[name].get(row["id"], [])
+                    continue
+                value = row[column]
+                item[name] = value if convert is None or value is None else convert(value)
+            data.append(item)
+        return data
+
+    def links(self, field, rows):
+        """``(row id, related pk)`` pairs for ``rows``, ordered by related pk."""
+        target = field.m2m_reverse_name()
+        return (
+            field.remote_field.through.objects.filter(**self.link_filter(field, rows))
+            .order_by(target)
+            .values_list(field.m2m_column_name(), target)
+        )
+
+    def link_filter(self, field, rows):
+        """Through-table filter; override to select by something other than ids."""
+        return {f"{field.m2m_column_name()}__in": [row["id"] for row in rows]}
+
+    def group(self, links):
+        grouped = {}
+        for owner, pk in links:
+            grouped.setdefault(owner, []).append(pk)
+        return grouped
@@ -37,19 +37,77 @@ INSTALLED_APPS = [
     "accounts",
     "core",
     "reviews",
+    "jobs",
 ]
 
 AUTH_USER_MODEL = "accounts.User"  # Custom User model
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.ClaimsJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Reverse proxies in front of the app. Client IPs (login throttling)
+    # come from REMOTE_ADDR, or from X-Forwarded-For this many hops back;
+    # left unset, DRF would trust whatever the client puts in the header.
+    "NUM_PROXIES": env.int("NUM_PROXIES", default=0),
+}
+
+# Bulk employee import (POST /core/api/employees/import/)
+EMPLOYEE_IMPORT_BATCH_SIZE = env.int("EMPLOYEE_IMPORT_BATCH_SIZE", default=1000)
+EMPLOYEE_IMPORT_MAX_BATCH_SIZE = 5000
+EMPLOYEE_IMPORT_MAX_ERRORS = 1000
+
+# Project assignments (POST /core/api/projects/<id>/assign/ and unassign/)
+PROJECT_ASSIGNMENT_MAX_IDS = 10000
+
+# Streaming exports (GET <list>/export/)
+EXPORT_CHUNK_SIZE = 2000
+
+# POST /reviews/api/reviews/bulk_transition/
+REVIEW_BULK_MAX_IDS = 5000
+
+# Window for manage.py refresh_review_analytics (schedule it, e.g. hourly).
+REVIEW_ANALYTICS_WINDOW_DAYS = env.int("REVIEW_ANALYTICS_WINDOW_DAYS", default=90)
+# Reviews scheduled within this many days get a reminder from the
+# reviews.send_review_reminders job (queue it daily: manage.py enqueue_job).
+REVIEW_REMINDER_DAYS = 1
+
+# Background jobs (jobs/queue.py, manage.py run_jobs). A failed job is
+# retried after 10s, 20s, 40s ... capped at the max, until it has run
+# JOBS_MAX_ATTEMPTS times. Running jobs whose worker has not checked in for
+# JOBS_STALE_SECONDS are handed back to the queue.
+JOBS_MAX_ATTEMPTS = env.int("JOBS_MAX_ATTEMPTS", default=3)
+JOBS_RETRY_BACKOFF_SECONDS = 10
+JOBS_RETRY_BACKOFF_MAX_SECONDS = 3600
+JOBS_STALE_SECONDS = env.int("JOBS_STALE_SECONDS", default=900)
+JOBS_POLL_SECONDS = 1.0
+JOBS_WORKER_PROCESSES = env.int("JOBS_WORKER_PROCESSES", default=os.cpu_count() or 1)
+# Uploads handed to background imports, under the default storage.
+JOBS_UPLOAD_DIR = "job-uploads"
+
+# ?search= on employees/projects; None picks the index backend for the
+# database vendor (see core/search.py), or a dotted path to override it.
+SEARCH_BACKEND = None
+
+# Response cache for the core read endpoints (config/cache.py). Point
+# CACHE_URL at a shared backend (e.g. redis://) in production; locmem is
+# per process.
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://employee-task"),
 }
+RESPONSE_CACHE_ALIAS = "default"
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=300)
+# Company snapshots are keyed by the company's cache version, so any write
+# under the company invalidates them; the timeout only bounds memory.
+COMPANY_SNAPSHOT_CACHE_TIMEOUT = env.int("COMPANY_SNAPSHOT_CACHE_TIMEOUT", default=3600)
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=30),
@@ -57,9 +115,27 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": False,
+    "TOKEN_OBTAIN_SERIALIZER": "accounts.tokens.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "accounts.tokens.ClaimsTokenRefreshSerializer",
 }
 
+# Per-process bloom filter in front of the refresh token blacklist
+# (accounts/blacklist.py); None disables it. ~1.8 MB at these numbers.
+# Prune expired tokens with `manage.py prune_tokens`.
+TOKEN_BLACKLIST_BLOOM_FILTER = {
+    "capacity": env.int("TOKEN_BLACKLIST_BLOOM_CAPACITY", default=1_000_000),
+    "error_rate": 0.001,
+    "sync_seconds": 5,
+    "rebuild_seconds": 3600,
+}
+
+# Current token claims versions (accounts.tokens); a miss costs one query.
+AUTH_CLAIMS_CACHE_ALIAS = "default"
+AUTH_CLAIMS_CACHE_TIMEOUT = env.int("AUTH_CLAIMS_CACHE_TIMEOUT", default=300)
+
 MIDDLEWARE = [
+    # Outermost, so its timings cover the whole middleware stack.
+    "config.performance.PerformanceMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -110,6 +186,13 @@ LOGGING = {
             "filename": os.path.join(BASE_DIR, "error.log"),
             "formatter": "verbose",
         },
+        "performance": {
+            "level": "WARNING",
+            "class": "logging.FileHandler",
+            "filename": os.path.join(BASE_DIR, "performance.log"),
+            "formatter": "verbose",
+            "delay": True,
+        },
     },
     "loggers": {
         "django": {
@@ -117,9 +200,31 @@ LOGGING = {
             "level": "ERROR",
             "propagate": True,
         },
+        "performance": {
+            "handlers": ["performance"],
+            "level": "WARNING",
+            "propagate": True,
+        },
+        "jobs": {
+            "handlers": ["file"],
+            "level": "WARNING",
+            "propagate": True,
+        },
     },
 }
 
+# Request instrumentation (config/performance.py): requests slower than this
+# are logged to performance.log with their slowest queries and call sites.
+PERFORMANCE_SLOW_REQUEST_MS = env.int("PERFORMANCE_SLOW_REQUEST_MS", default=500)
+PERFORMANCE_SLOW_REQUEST_QUERIES = 10
+# Which queries get their call site in that log: walking the stack costs on
+# every query, so only for queries this slow, for requests already past the
+# threshold, and for a sampled share of requests.
+PERFORMANCE_SLOW_QUERY_MS = env.int("PERFORMANCE_SLOW_QUERY_MS", default=50)
+PERFORMANCE_CALL_SITE_SAMPLE_RATE = env.float(
+    "PERFORMANCE_CALL_SITE_SAMPLE_RATE", default=0.01
+)
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
@@ -142,6 +247,35 @@ DATABASES = {
 # }
 
 
+# Password hashing (accounts/hashers.py). PASSWORD_HASHER picks the hasher
+# for new passwords; the rest still verify older hashes, which are upgraded
+# on the next successful login. "argon2" needs the argon2-cffi package.
+PASSWORD_HASHER = env("PASSWORD_HASHER", default="pbkdf2")
+_PASSWORD_HASHERS = {
+    "pbkdf2": "accounts.hashers.TunedPBKDF2PasswordHasher",
+    "argon2": "accounts.hashers.TunedArgon2PasswordHasher",
+    "scrypt": "django.contrib.auth.hashers.ScryptPasswordHasher",
+}
+PASSWORD_HASHERS = [
+    _PASSWORD_HASHERS[PASSWORD_HASHER],
+    *(path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER),
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+PASSWORD_PBKDF2_ITERATIONS = env.int("PASSWORD_PBKDF2_ITERATIONS", default=1_000_000)
+PASSWORD_ARGON2 = {
+    "time_cost": env.int("PASSWORD_ARGON2_TIME_COST", default=2),
+    "memory_cost": env.int("PASSWORD_ARGON2_MEMORY_COST", default=19456),  # KiB
+    "parallelism": env.int("PASSWORD_ARGON2_PARALLELISM", default=1),
+}
+
+# Token buckets for the login endpoints (accounts/throttling.py): a client
+# may burst N attempts, then N per period.
+LOGIN_THROTTLE_CACHE_ALIAS = "default"
+LOGIN_THROTTLE_RATES = {
+    "login_ip": env("LOGIN_THROTTLE_IP_RATE", default="30/min"),
+    "login_account": env("LOGIN_THROTTLE_ACCOUNT_RATE", default="5/min"),
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
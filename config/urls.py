@@ -16,6 +16,7 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path,include
+from config.performance import MetricsView, PrometheusMetricsView
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularRedocView,
@@ -27,6 +28,16 @@ urlpatterns = [
     path("accounts/", include("accounts.urls")),
     path("core/api/", include("core.urls")),
     path("reviews/api/", include("reviews.urls")),
+    path("jobs/api/", include("jobs.urls")),
+    # Async read path; route these to the ASGI workers (config/asgi.py).
+    path("async/core/api/", include("core.async_urls")),
+    path("async/reviews/api/", include("reviews.async_urls")),
+    path("api/metrics/", MetricsView.as_view(), name="metrics"),
+    path(
+        "api/metrics/prometheus/",
+        PrometheusMetricsView.as_view(),
+        name="metrics-prometheus",
+    ),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
         "api/docs/",
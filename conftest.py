@@ -0,0 +1,132 @@
+import pytest
+from datetime import date
+from types import SimpleNamespace
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings, tmp_path_factory):
+    """
+    Put the SQLite test database in a file so threads in concurrency tests
+    share it; an in-memory database is private to one connection.
+    """
+    from django.conf import settings
+
+    database = settings.DATABASES["default"]
+    if database["ENGINE"] == "django.db.backends.sqlite3":
+        database.setdefault("TEST", {})["NAME"] = str(
+            tmp_path_factory.mktemp("db") / "test.sqlite3"
+        )
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hasher(settings):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    from django.core.cache import cache
+
+    cache.clear()
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def assert_query_budget():
+    """
+    Return ``check(client, method, path, budget, **kwargs)``: performs the
+    request and fails when it issues more than ``budget`` queries, listing
+    the SQL so the offending N+1 is obvious in the CI log.
+    """
+
+    def check(client, method, path, budget, **kwargs):
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(client, method)(path, **kwargs)
+        assert response.status_code < 500, response.content
+        executed = len(ctx.captured_queries)
+        assert executed <= budget, (
+            f"{method.upper()} {path} ran {executed} queries (budget {budget}):\n"
+            + "\n".join(q["sql"] for q in ctx.captured_queries)
+        )
+        return response
+
+    return check
+
+
+@pytest.fixture
+def make_org(db):
+    """
+    Build a company with ``size`` employees, projects and reviews, plus an
+    admin, a manager and an employee user linked to the first employee.
+    """
+    from django.contrib.auth import get_user_model
+    from core.models import Company, Department, Employee, Project
+    from reviews.models import EmployeeReview
+
+    User = get_user_model()
+    counter = {"n": 0}
+
+    def build(size=3, name=None):
+        counter["n"] += 1
+        tag = name or f"org{counter['n']}"
+        company = Company.objects.create(name=tag)
+        department = Department.objects.create(company=company, name="IT")
+        employees = [
+            Employee.objects.create(
+                company=company,
+                department=department,
+                name=f"Employee {i}",
+                email=f"emp{i}@{tag}.com",
+                mobile="0100000000",
+                designation="Dev",
+                hired_on=date(2024, 1, 1),
+            )
+            for i in range(size)
+        ]
+        projects = []
+        for i in range(size):
+            project = Project.objects.create(
+                company=company,
+                department=department,
+                name=f"Project {i}",
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 12, 31),
+            )
+            project.assigned_employees.set(employees[:3])
+            projects.append(project)
+        reviews = [EmployeeReview.objects.create(employee=emp) for emp in employees]
+
+        admin = User.objects.create_user(
+            email=f"admin@{tag}.com", password="pass", role="ADMIN",
+            username=f"admin_{tag}", company=company,
+        )
+        manager = User.objects.create_user(
+            email=f"manager@{tag}.com", password="pass", role="MANAGER",
+            username=f"manager_{tag}", company=company,
+        )
+        employee_user = User.objects.create_user(
+            email=f"user@{tag}.com", password="pass", role="EMPLOYEE",
+            username=f"user_{tag}", company=company,
+        )
+        employees[0].user = employee_user
+        employees[0].save()
+
+        return SimpleNamespace(
+            company=company,
+            department=department,
+            employees=employees,
+            projects=projects,
+            reviews=reviews,
+            admin=admin,
+            manager=manager,
+            employee_user=employee_user,
+        )
+
+    return build
@@ -0,0 +1,159 @@
+# core/analytics.py
+"""
+Workforce statistics computed next to the data.
+
+Headcount, designation mix and project load are ``GROUP BY`` queries;
+project load groups the join table only.
+Tenure percentiles need the sorted distribution, which SQL makes awkward,
+so the database groups employees by ``hired_on`` and the percentiles come
+from that compact ``(days, employees)`` histogram: a few thousand distinct
+dates however many employees there are. NumPy does the arithmetic when it
+is installed; plain Python is exact and fast enough otherwise.
+"""
+from bisect import bisect_left
+from datetime import date
+from itertools import accumulate
+
+from django.core.exceptions import EmptyResultSet
+from django.db import connection
+from django.db.models import Count
+
+from .models import Department, Employee
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+PERCENTILES = (0.5, 0.9, 0.95)
+
+# Upper bounds in days, exclusive; the last bucket is open-ended.
+TENURE_BUCKETS = ((365, "<1y"), (730, "1-2y"), (1825, "2-5y"), (None, "5y+"))
+
+PROJECT_LOAD_SQL = """
+SELECT load, COUNT(*) FROM ({assignments}) AS per_employee
+GROUP BY load ORDER BY load
+"""
+
+
+def weighted_percentiles(values, weights, percentiles=PERCENTILES):
+    """
+    Nearest-rank percentiles of ``values`` (ascending) repeated ``weights``
+    times: the smallest value whose cumulative share reaches p.
+    """
+    if not values:
+        return [None for _ in percentiles]
+    if np is not None:
+        cumulative = np.cumsum(np.asarray(weights, dtype=np.int64))
+        targets = np.asarray(percentiles) * cumulative[-1]
+        indexes = np.searchsorted(cumulative, targets, side="left").tolist()
+    else:
+        cumulative = list(accumulate(weights))
+        indexes = [bisect_left(cumulative, p * cumulative[-1]) for p in percentiles]
+    return [values[i] for i in indexes]
+
+
+def bucket_counts(values, weights, bounds):
+    """Employees per ``[previous bound, bound)`` bucket; ``None`` is unbounded."""
+    cumulative = [0, *accumulate(weights)]
+    counts, start = [], 0
+    for bound in bounds:
+        end = len(values) if bound is None else bisect_left(values, bound)
+        counts.append(cumulative[end] - cumulative[start])
+        start = end
+    return counts
+
+
+def tenure_stats(employees, today=None):
+    today = today or date.today()
+    histogram = (
+        employees.filter(hired_on__isnull=False)
+        .order_by("-hired_on")
+        .values_list("hired_on")
+        .annotate(n=Count("id"))
+    )
+    days, weights = [], []
+    for hired_on, n in histogram:
+        days.append((today - hired_on).days)
+        weights.append(n)
+
+    known = sum(weights)
+    if np is not None and days:
+        mean = float(np.dot(np.asarray(days, dtype=np.int64), np.asarray(weights)) / known)
+    else:
+        mean = sum(d * w for d, w in zip(days, weights)) / known if known else None
+    percentiles = weighted_percentiles(days, weights)
+    bounds = [bound for bound, _ in TENURE_BUCKETS]
+    return {
+        "known": known,
+        "mean_days": round(mean, 1) if mean is not None else None,
+        "percentiles_days": {
+            f"p{round(p * 100)}": value for p, value in zip(PERCENTILES, percentiles)
+        },
+        "buckets": [
+            {"tenure": label, "employees": count}
+            for (_, label), count in zip(TENURE_BUCKETS, bucket_counts(days, weights, bounds))
+        ],
+    }
+
+
+def project_load(employees, total):
+    """
+    How many of the ``total`` employees are assigned to 0, 1, 2, ...
+    projects. Only the join table is grouped; whoever has no row in it
+    makes up the zero bucket.
+    """
+    Assignment = Employee.projects.through
+    try:
+        inner, params = (
+            Assignment.objects.filter(employee_id__in=employees.values("id"))
+            .values("employee_id")
+            .annotate(load=Count("project_id"))
+            .values("load")
+            .query.sql_with_params()
+        )
+    except EmptyResultSet:
+        # An empty scope (.none()) compiles to no SQL at all.
+        rows = []
+    else:
+        with connection.cursor() as cursor:
+            cursor.execute(PROJECT_LOAD_SQL.format(assignments=inner), params)
+            rows = cursor.fetchall()
+
+    unassigned = total - sum(n for _, n in rows)
+    if unassigned:
+        rows.insert(0, (0, unassigned))
+    return {
+        "mean": round(sum(load * n for load, n in rows) / total, 2) if total else None,
+        "max": rows[-1][0] if rows else None,
+        "distribution": [{"projects": load, "employees": n} for load, n in rows],
+    }
+
+
+def workforce_stats(employees, today=None):
+    """All statistics for the ``employees`` queryset (already scoped and filtered)."""
+    employees = employees.order_by()
+    # Grouped on the (company, department, designation) index alone; the
+    # handful of department names is a second, tiny query.
+    headcount = list(
+        employees.values_list("department_id").annotate(n=Count("id")).order_by("department_id")
+    )
+    names = dict(
+        Department.objects.filter(pk__in=[pk for pk, _ in headcount]).values_list("id", "name")
+    )
+    designations = list(
+        employees.values("designation")
+        .annotate(employees=Count("id"))
+        .order_by("-employees", "designation")
+    )
+    total = sum(n for _, n in headcount)
+    tenure = tenure_stats(employees, today)
+    return {
+        "employees": total,
+        "headcount_by_department": [
+            {"department": pk, "name": names.get(pk), "employees": n} for pk, n in headcount
+        ],
+        "designations": designations,
+        "tenure": {**tenure, "unknown": total - tenure["known"]},
+        "project_load": project_load(employees, total),
+    }
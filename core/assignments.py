@@ -0,0 +1,100 @@
+# core/assignments.py
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models.signals import m2m_changed
+
+from .models import Employee, Project
+
+Assignment = Project.assigned_employees.through
+
+
+class AssignmentError(ValueError):
+    pass
+
+
+def parse_employee_ids(value):
+    """The ``employees`` payload as a set of ints; raises AssignmentError."""
+    if not isinstance(value, list) or not value:
+        raise AssignmentError("A non-empty list of employee ids is required.")
+    # No coercion: int() would turn 1.9, "1" and True into employee 1.
+    if any(type(pk) is not int for pk in value):
+        raise AssignmentError("Employee ids must be integers.")
+    ids = set(value)
+    if len(ids) > settings.PROJECT_ASSIGNMENT_MAX_IDS:
+        raise AssignmentError(
+            f"At most {settings.PROJECT_ASSIGNMENT_MAX_IDS} employees per request."
+        )
+    return ids
+
+
+def check_membership(project, ids):
+    """
+    Raise AssignmentError unless every id is an employee of the project's
+    company; one ``IN`` query however many ids there are.
+    """
+    found = set(
+        Employee.objects.filter(pk__in=ids, company_id=project.company_id).values_list(
+            "pk", flat=True
+        )
+    )
+    missing = sorted(ids - found)
+    if missing:
+        raise AssignmentError(
+            f"Employees {missing} do not exist or do not belong to this project's company."
+        )
+
+
+def send_changed(project, action, pk_set, using):
+    # Raw through-table writes skip the related manager; fire its signal so
+    # cache versions and the project's updated_at move as with add()/remove().
+    for phase in ("pre", "post"):
+        m2m_changed.send(
+            sender=Assignment,
+            instance=project,
+            action=f"{phase}_{action}",
+            reverse=False,
+            model=Employee,
+            pk_set=pk_set,
+            using=using,
+        )
+
+
+def assign_employees(project, ids):
+    """
+    Add ``ids`` to the project's assignments. Only the through rows for the
+    requested ids are read; missing ones are inserted in one bulk insert.
+    Returns the sorted ids that were actually added.
+    """
+    check_membership(project, ids)
+    using = router.db_for_write(Assignment, instance=project)
+    with transaction.atomic(using=using):
+        existing = set(
+            Assignment.objects.using(using)
+            .filter(project_id=project.pk, employee_id__in=ids)
+            .values_list("employee_id", flat=True)
+        )
+        added = ids - existing
+        if added:
+            Assignment.objects.using(using).bulk_create(
+                [Assignment(project_id=project.pk, employee_id=pk) for pk in added],
+                ignore_conflicts=True,
+            )
+            send_changed(project, "add", added, using)
+    return sorted(added)
+
+
+def unassign_employees(project, ids):
+    """
+    Remove ``ids`` from the project's assignments with one ``DELETE ... IN``.
+    Ids that are not assigned are ignored. Returns the sorted ids removed.
+    """
+    using = router.db_for_write(Assignment, instance=project)
+    with transaction.atomic(using=using):
+        links = Assignment.objects.using(using).filter(
+            project_id=project.pk, employee_id__in=ids
+        )
+        removed = set(links.values_list("employee_id", flat=True))
+        if removed:
+            links.delete()
+            send_changed(project, "remove", removed, using)
+    return sorted(removed)
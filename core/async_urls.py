@@ -0,0 +1,18 @@
+from django.urls import path
+from config.async_api import read_routes
+from .async_views import EmployeeMeView
+from .views import (
+    CompanyViewSet,
+    DepartmentViewSet,
+    EmployeeViewSet,
+    ProjectViewSet,
+)
+
+# Async (ASGI) twins of the read endpoints in core.urls.
+urlpatterns = [
+    path("employees/me/", EmployeeMeView.as_view(), name="async-employee-me"),
+    *read_routes("companies", CompanyViewSet, "company"),
+    *read_routes("departments", DepartmentViewSet, "department"),
+    *read_routes("employees", EmployeeViewSet, "employee"),
+    *read_routes("projects", ProjectViewSet, "project"),
+]
@@ -0,0 +1,19 @@
+# core/async_views.py
+from config.async_api import AsyncReadView, json_response
+from config.response import envelope
+from .models import Employee
+from .views import EmployeeViewSet
+
+
+class EmployeeMeView(AsyncReadView):
+    viewset_class = EmployeeViewSet
+    basename = "employee"
+    action = "me"
+
+    async def me(self, view, request):
+        emp = await Employee.objects.filter(user_id=request.user.pk).afirst()
+        if not emp:
+            return json_response(
+                envelope({}, 404, "No employee record found."), status=404
+            )
+        return envelope(view.get_serializer(emp).data, 200, "Success")
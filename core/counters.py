@@ -0,0 +1,82 @@
+# core/counters.py
+from collections import defaultdict
+
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Company, Department, Employee, Project
+from .timeline import tighten_span_bounds
+
+# child model -> [(foreign key attname, parent model, counter field)]
+COUNTERS = {
+    Department: [("company_id", Company, "departments_count")],
+    Employee: [
+        ("company_id", Company, "employees_count"),
+        ("department_id", Department, "employees_count"),
+    ],
+    Project: [
+        ("company_id", Company, "projects_count"),
+        ("department_id", Department, "projects_count"),
+    ],
+}
+
+
+def apply_deltas(deltas):
+    """
+    Apply ``{(parent model, parent pk, counter field): delta}`` as one
+    ``UPDATE ... SET field = field + delta`` per parent row. ``updated_at``
+    moves with the counters so conditional GETs see the change.
+    """
+    rows = defaultdict(dict)
+    for (model, pk, field), delta in deltas.items():
+        if pk is not None and delta:
+            rows[(model, pk)][field] = F(field) + delta
+
+    now = timezone.now()
+    for (model, pk), updates in rows.items():
+        model.objects.filter(pk=pk).update(updated_at=now, **updates)
+
+
+def _child_count(child, fk):
+    counts = (
+        child.objects.filter(**{fk: OuterRef("pk")})
+        .order_by()
+        .values(fk)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def counter_expressions(parent):
+    """Return ``{counter field: expression}`` computing each counter of ``parent``."""
+    expressions = {}
+    for child, counters in COUNTERS.items():
+        for attname, model, field in counters:
+            if model is parent:
+                expressions[field] = _child_count(child, attname[: -len("_id")])
+    return expressions
+
+
+def find_drift():
+    """Yield ``(instance, field, stored, actual)`` for every counter that is off."""
+    for parent in (Company, Department):
+        expressions = counter_expressions(parent)
+        queryset = parent.objects.annotate(
+            **{f"actual_{field}": expr for field, expr in expressions.items()}
+        )
+        for obj in queryset.iterator(chunk_size=2000):
+            for field in expressions:
+                stored, actual = getattr(obj, field), getattr(obj, f"actual_{field}")
+                if stored != actual:
+                    yield obj, field, stored, actual
+
+
+def rebuild_counters():
+    """Recompute every stored counter from the child tables, one UPDATE per parent table."""
+    for parent in (Company, Department):
+        parent.objects.update(**counter_expressions(parent))
+
+    # Company.max_project_days only grows between rebuilds; tighten it.
+    tighten_span_bounds()
@@ -0,0 +1,39 @@
+# core/filters.py
+from django_filters import rest_framework as filters
+
+from accounts.scope import get_scope
+
+from .models import Project
+from .timeline import overlapping, span_bound
+
+
+class DateWindowFilter(filters.BaseRangeFilter, filters.DateFilter):
+    """``?param=2025-01-01,2025-03-31``: two dates, inclusive."""
+
+
+class ProjectFilter(filters.FilterSet):
+    active_between = DateWindowFilter(
+        method="filter_active",
+        help_text="Projects running on any day of FROM,TO (inclusive).",
+    )
+    active_on = filters.DateFilter(
+        method="filter_active", help_text="Projects running on this date."
+    )
+
+    class Meta:
+        model = Project
+        fields = [
+            "company",
+            "department",
+            "start_date",
+            "end_date",
+            "assigned_employees",
+        ]
+
+    def filter_active(self, queryset, name, value):
+        begin, end = value if isinstance(value, list) else (value, value)
+        if begin > end:
+            return queryset.none()
+        scope = get_scope(self.request)
+        bound = span_bound(None if scope.is_admin else scope.company_id)
+        return overlapping(queryset, begin, end, bound)
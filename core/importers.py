@@ -0,0 +1,249 @@
+# core/importers.py
+import csv
+import io
+import json
+from collections import Counter
+from datetime import date
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from config.cache import bump_versions
+
+from .counters import apply_deltas
+from .models import Company, Department, Employee
+
+IMPORT_FIELDS = [
+    "company",
+    "department",
+    "name",
+    "email",
+    "mobile",
+    "address",
+    "designation",
+    "hired_on",
+]
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+JSONL_TYPES = ("jsonl", "ndjson", "json")
+
+
+def upload_type(upload, file_type=None):
+    """The upload's format, from ``file_type`` or the file extension."""
+    file_type = (file_type or upload.name.rsplit(".", 1)[-1]).lower()
+    if file_type != "csv" and file_type not in JSONL_TYPES:
+        raise ImportFormatError("Upload a .csv or .jsonl file.")
+    return file_type
+
+
+def iter_rows(upload, file_type=None):
+    """
+    Yield ``(row number, dict or None)`` from a CSV or JSONL upload, reading
+    it line by line. A ``None`` row means the line was not valid JSON.
+    """
+    file_type = upload_type(upload, file_type)
+    stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    try:
+        yield from parse_rows(stream, file_type)
+    except UnicodeDecodeError as exc:
+        raise ImportFormatError(f"The file is not UTF-8 encoded ({exc.reason}).")
+    except csv.Error as exc:
+        raise ImportFormatError(f"The file is not valid CSV ({exc}).")
+
+
+def parse_rows(stream, file_type):
+    if file_type == "csv":
+        for number, row in enumerate(csv.DictReader(stream), start=1):
+            yield number, row
+    else:
+        number = 0
+        for line in stream:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield number, row if isinstance(row, dict) else None
+
+
+class EmployeeImporter:
+    """
+    Streams employee rows into the database in ``bulk_create`` batches.
+
+    Company and department ids are resolved against a lookup table loaded
+    once up front, so validating a row never touches the database; email
+    uniqueness is checked with one ``IN`` query per batch.
+    """
+
+    def __init__(self, scope, batch_size=None, max_errors=None):
+        self.batch_size = batch_size or settings.EMPLOYEE_IMPORT_BATCH_SIZE
+        self.max_errors = max_errors or settings.EMPLOYEE_IMPORT_MAX_ERRORS
+
+        departments = scope.filter(Department.objects.all())
+        companies = scope.filter(Company.objects.all(), "id")
+        self.department_company = dict(departments.values_list("id", "company_id"))
+        self.company_ids = set(companies.values_list("id", flat=True))
+
+        self.seen_emails = set()
+        self.total = self.created = self.failed = 0
+        self.errors = []
+        self.stopped = None
+
+    def run(self, rows):
+        """
+        Import ``rows`` and return the report. An ``ImportFormatError`` on
+        the first row is raised; a later one stops the import, keeping the
+        rows read before it, and is reported as ``stopped``.
+        """
+        batch = []
+        try:
+            for number, row in rows:
+                self.total += 1
+                employee = self.clean(number, row)
+                if employee is None:
+                    continue
+                batch.append((number, employee))
+                if len(batch) >= self.batch_size:
+                    self.flush(batch)
+                    batch = []
+        except ImportFormatError as exc:
+            if not self.total:
+                raise
+            self.stopped = {"after_row": self.total, "reason": str(exc)}
+        if batch:
+            self.flush(batch)
+        return self.report()
+
+    def report(self):
+        return {
+            "total_rows": self.total,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+            "stopped": self.stopped,
+        }
+
+    def add_error(self, number, errors):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": number, "errors": errors})
+
+    def clean(self, number, row):
+        if row is None:
+            self.add_error(number, {"row": "Invalid JSON object."})
+            return None
+
+        data = {
+            key: ("" if row.get(key) is None else str(row.get(key)).strip())
+            for key in IMPORT_FIELDS
+        }
+        errors = {}
+
+        for key, max_length in (("name", 255), ("mobile", 30), ("designation", 255)):
+            if not data[key]:
+                errors[key] = "This field is required."
+            elif len(data[key]) > max_length:
+                errors[key] = f"Ensure this field has no more than {max_length} characters."
+
+        email = data["email"]
+        try:
+            validate_email(email)
+        except ValidationError:
+            errors["email"] = "Enter a valid email address."
+        else:
+            if email in self.seen_emails:
+                errors["email"] = "Duplicate email in this file."
+
+        hired_on = None
+        if data["hired_on"]:
+            try:
+                hired_on = date.fromisoformat(data["hired_on"])
+            except ValueError:
+                errors["hired_on"] = "Date has wrong format. Use YYYY-MM-DD."
+
+        department_id = company_id = None
+        if not data["department"]:
+            errors["department"] = "This field is required."
+        else:
+            try:
+                department_id = int(data["department"])
+                company_id = int(data["company"]) if data["company"] else None
+            except ValueError:
+                errors["department"] = "Company and department must be ids."
+            else:
+                department_company = self.department_company.get(department_id)
+                if department_company is None:
+                    errors["department"] = "Invalid department."
+                elif company_id is None:
+                    company_id = department_company
+                elif company_id not in self.company_ids:
+                    errors["company"] = "Invalid company."
+                elif department_company != company_id:
+                    errors["department"] = (
+                        "Department must belong to the selected company."
+                    )
+
+        if errors:
+            self.add_error(number, errors)
+            return None
+
+        self.seen_emails.add(email)
+        return Employee(
+            company_id=company_id,
+            department_id=department_id,
+            name=data["name"],
+            email=email,
+            mobile=data["mobile"],
+            address=data["address"],
+            designation=data["designation"],
+            hired_on=hired_on,
+        )
+
+    def flush(self, batch):
+        taken = set(
+            Employee.objects.filter(
+                email__in=[employee.email for _, employee in batch]
+            ).values_list("email", flat=True)
+        )
+        pending = []
+        for number, employee in batch:
+            if employee.email in taken:
+                self.add_error(number, {"email": "Employee with this email already exists."})
+            else:
+                pending.append((number, employee))
+
+        try:
+            self.save([employee for _, employee in pending])
+        except IntegrityError:
+            # Lost a race with a concurrent writer; retry row by row so only
+            # the conflicting rows are reported.
+            for number, employee in pending:
+                try:
+                    self.save([employee])
+                except IntegrityError:
+                    self.add_error(number, {"email": "Employee with this email already exists."})
+
+    def save(self, employees):
+        if not employees:
+            return
+        # bulk_create skips post_save, so counters and cached reads are
+        # handled here.
+        deltas = Counter()
+        for employee in employees:
+            deltas[(Company, employee.company_id, "employees_count")] += 1
+            deltas[(Department, employee.department_id, "employees_count")] += 1
+
+        with transaction.atomic():
+            Employee.objects.bulk_create(employees, batch_size=self.batch_size)
+            apply_deltas(deltas)
+            bump_versions({employee.company_id for employee in employees})
+        self.created += len(employees)
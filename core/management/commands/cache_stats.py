@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from config.cache import cache_stats
+from core.urls import router
+
+
+class Command(BaseCommand):
+    help = "Show response cache hits and misses per endpoint."
+
+    def handle(self, *args, **options):
+        names = [basename for _, _, basename in router.registry]
+        for name, stats in cache_stats(names).items():
+            ratio = stats["hit_ratio"]
+            self.stdout.write(
+                f"{name}: hits={stats['hits']} misses={stats['misses']} "
+                f"hit_ratio={'-' if ratio is None else f'{ratio:.2%}'}"
+            )
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from config.cache import invalidate_all
+from core.counters import find_drift, rebuild_counters
+
+
+class Command(BaseCommand):
+    help = "Verify or rebuild the stored Company/Department counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report counters that drifted; exit with status 1 if any did.",
+        )
+
+    def handle(self, *args, **options):
+        drift = list(find_drift())
+        for obj, field, stored, actual in drift:
+            self.stdout.write(
+                f"{obj._meta.label} {obj.pk} {field}: stored={stored} actual={actual}"
+            )
+
+        if options["check"]:
+            if drift:
+                self.stderr.write(self.style.ERROR(f"{len(drift)} counter(s) drifted."))
+                raise SystemExit(1)
+            self.stdout.write(self.style.SUCCESS("All counters are consistent."))
+            return
+
+        with transaction.atomic():
+            rebuild_counters()
+            invalidate_all()
+        self.stdout.write(
+            self.style.SUCCESS(f"Counters rebuilt ({len(drift)} corrected).")
+        )
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.5 on 2026-10-18 09:31
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Company = apps.get_model("core", "Company")
+    Department = apps.get_model("core", "Department")
+    Employee = apps.get_model("core", "Employee")
+    Project = apps.get_model("core", "Project")
+
+    def count(model, fk):
+        rows = (
+            model.objects.filter(**{fk: OuterRef("pk")})
+            .order_by()
+            .values(fk)
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+    Company.objects.update(
+        departments_count=count(Department, "company"),
+        employees_count=count(Employee, "company"),
+        projects_count=count(Project, "company"),
+    )
+    Department.objects.update(
+        employees_count=count(Employee, "department"),
+        projects_count=count(Project, "department"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='departments_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='employees_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='projects_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='employees_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='projects_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,84 @@
+# Full-text indexes backing core.search.FullTextSearchFilter. The SQL is
+# vendor specific, so each backend gets its own statements and any other
+# database keeps the plain icontains search.
+
+from django.db import migrations
+
+INDEXES = {
+    "core_employee": ["name", "email", "mobile", "designation"],
+    "core_project": ["name", "description"],
+}
+
+
+def sqlite_forwards(table, columns):
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', "
+        f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END",
+        # Only re-index when a searchable column changes.
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def sqlite_backwards(table, columns):
+    fts = f"{table}_fts"
+    return [f"DROP TRIGGER IF EXISTS {fts}_{s}" for s in ("ai", "ad", "au")] + [
+        f"DROP TABLE IF EXISTS {fts}"
+    ]
+
+
+def postgres_forwards(table, columns):
+    document = " || ' ' || ".join(f'coalesce("{table}"."{c}", \'\')' for c in columns)
+    return [
+        f"CREATE INDEX {table}_search_idx ON {table} "
+        f"USING GIN (to_tsvector('simple', {document}))"
+    ]
+
+
+def postgres_backwards(table, columns):
+    return [f"DROP INDEX IF EXISTS {table}_search_idx"]
+
+
+def sqlite_has_fts5(cursor):
+    cursor.execute("PRAGMA compile_options")
+    return any("FTS5" in row[0] for row in cursor.fetchall())
+
+
+def run(builders):
+    def operation(apps, schema_editor):
+        connection = schema_editor.connection
+        build = builders.get(connection.vendor)
+        if build is None:
+            return
+        with connection.cursor() as cursor:
+            if connection.vendor == "sqlite" and not sqlite_has_fts5(cursor):
+                return
+            for table, columns in INDEXES.items():
+                for statement in build(table, columns):
+                    cursor.execute(statement)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_api_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run({"sqlite": sqlite_forwards, "postgresql": postgres_forwards}),
+            run({"sqlite": sqlite_backwards, "postgresql": postgres_backwards}),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-18 10:21
+
+from django.db import migrations, models
+from django.db.models import F, Max
+
+
+def backfill_max_project_days(apps, schema_editor):
+    Company = apps.get_model("core", "Company")
+    Project = apps.get_model("core", "Project")
+
+    rows = (
+        Project.objects.order_by()
+        .values("company_id")
+        .annotate(longest=Max(F("end_date") - F("start_date")))
+    )
+    for row in rows:
+        Company.objects.filter(pk=row["company_id"]).update(
+            max_project_days=max(row["longest"].days, 0)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='max_project_days',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_max_project_days, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,50 @@
 # core/models.py
-from django.db import models
+
+from datetime import date
+
+from django.db import models, router, transaction
 from django.conf import settings
 
 
+class TrackedFieldsModel(models.Model):
+    """
+    Remembers the database values of ``tracked_fields`` so post_save handlers
+    can tell when a row moved between parents, and wraps save() in a
+    transaction so those handlers commit or roll back with the row itself.
+    """
+
+    tracked_fields = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        instance._loaded_values = {
+            name: loaded[name]
+            for name in cls.tracked_fields
+            if name in loaded and loaded[name] is not models.DEFERRED
+        }
+        return instance
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
+
 class Company(models.Model):
     name = models.CharField(max_length=255, unique=True)
+    # Maintained by core.signals; rebuild with `manage.py rebuild_counters`.
+    departments_count = models.IntegerField(default=0, editable=False)
+    employees_count = models.IntegerField(default=0, editable=False)
+    projects_count = models.IntegerField(default=0, editable=False)
+    # Upper bound on the length in days of any of its projects. core.signals
+    # only ever raises it; `manage.py rebuild_counters` tightens it again.
+    # Overlap filters use it to bound their start_date range scan.
+    max_project_days = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -12,20 +52,28 @@ class Company(models.Model):
         return self.name
 
 
-class Department(models.Model):
+class Department(TrackedFieldsModel):
     company = models.ForeignKey(
         Company, on_delete=models.CASCADE, related_name="departments"
     )
     name = models.CharField(max_length=255)
+    employees_count = models.IntegerField(default=0, editable=False)
+    projects_count = models.IntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    tracked_fields = ("company_id",)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "name"], name="core_dept_company_name_idx"),
+        ]
 
     def __str__(self):
         return f"{self.company.name} / {self.name}"
 
 
-class Employee(models.Model):
+class Employee(TrackedFieldsModel):
     company = models.ForeignKey(
         Company, on_delete=models.CASCADE, related_name="employees"
     )
@@ -48,19 +96,33 @@ class Employee(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    tracked_fields = ("company_id", "department_id")
+
+    class Meta:
+        # Mirror the API's access paths: RBAC company filter + filterset
+        # fields, and (ordering field, id) for keyset pagination.
+        indexes = [
+            models.Index(
+                fields=["company", "department", "designation"],
+                name="core_emp_co_dept_desig_idx",
+            ),
+            models.Index(fields=["company", "name", "id"], name="core_emp_co_name_idx"),
+            models.Index(fields=["company", "hired_on", "id"], name="core_emp_co_hired_idx"),
+            models.Index(fields=["name", "id"], name="core_emp_name_idx"),
+            models.Index(fields=["hired_on", "id"], name="core_emp_hired_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
     @property
     def days_employed(self):
-        from datetime import date
-
         if not self.hired_on:
             return None
         return (date.today() - self.hired_on).days
 
 
-class Project(models.Model):
+class Project(TrackedFieldsModel):
     company = models.ForeignKey(
         Company, on_delete=models.CASCADE, related_name="projects"
     )
@@ -77,5 +139,20 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    tracked_fields = ("company_id", "department_id", "start_date", "end_date")
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["company", "start_date", "id"], name="core_proj_co_start_idx"
+            ),
+            models.Index(fields=["company", "end_date", "id"], name="core_proj_co_end_idx"),
+            models.Index(fields=["company", "name", "id"], name="core_proj_co_name_idx"),
+        ]
+
     def __str__(self):
         return self.name
+
+    @property
+    def span_days(self):
+        return (self.end_date - self.start_date).days
@@ -0,0 +1,156 @@
+# core/search.py
+import re
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import F
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+from rest_framework import filters
+
+# model label -> (index table, indexed columns); the indexes themselves are
+# created and kept in sync by core/migrations/0004_search_indexes.py.
+SEARCH_INDEXES = {
+    "core.Employee": ("core_employee_fts", ["name", "email", "mobile", "designation"]),
+    "core.Project": ("core_project_fts", ["name", "description"]),
+}
+
+RANK_ANNOTATION = "search_rank"
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(terms):
+    return [token for term in terms for token in TOKEN_RE.findall(term)]
+
+
+class IContainsBackend:
+    """DRF's stock behaviour: OR of ``icontains`` per field, AND across terms."""
+
+    def search(self, search_filter, queryset, view, request, terms):
+        return filters.SearchFilter.filter_queryset(
+            search_filter, request, queryset, view
+        )
+
+
+class SQLiteFTSBackend:
+    """
+    Matches against an FTS5 external-content table kept current by triggers.
+    Every token is a prefix query, so ``sar`` finds ``Sara``; ranking is bm25.
+    """
+
+    def __init__(self):
+        self.available = {}
+
+    def has_index(self, connection, table):
+        key = (connection.alias, table)
+        if key not in self.available:
+            self.available[key] = table in connection.introspection.table_names()
+        return self.available[key]
+
+    def search(self, search_filter, queryset, view, request, terms):
+        connection = connections[queryset.db]
+        table, _ = SEARCH_INDEXES[queryset.model._meta.label]
+        if not self.has_index(connection, table):
+            return IContainsBackend().search(search_filter, queryset, view, request, terms)
+
+        tokens = tokenize(terms)
+        if not tokens:
+            return queryset.none()
+        match = " ".join('"%s"*' % token for token in tokens)
+
+        qn = connection.ops.quote_name
+        base = qn(queryset.model._meta.db_table)
+        fts = qn(table)
+        ids = RawSQL(f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", (match,))
+        # bm25() is lower-is-better; negate it so every backend ranks descending.
+        rank = RawSQL(
+            f"SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH %s AND rowid = {base}.id",
+            (match,),
+        )
+        return queryset.filter(pk__in=ids).annotate(**{RANK_ANNOTATION: rank})
+
+
+class PostgresFullTextBackend:
+    """
+    ``tsvector`` prefix matching over the indexed columns. The document
+    expression matches the GIN index built by the migration verbatim.
+    """
+
+    @staticmethod
+    def document(connection, model, fields):
+        qn = connection.ops.quote_name
+        table = qn(model._meta.db_table)
+        columns = " || ' ' || ".join(
+            f"coalesce({table}.{qn(field)}, '')" for field in fields
+        )
+        return f"to_tsvector('simple', {columns})"
+
+    def search(self, search_filter, queryset, view, request, terms):
+        connection = connections[queryset.db]
+        _, fields = SEARCH_INDEXES[queryset.model._meta.label]
+        tokens = tokenize(terms)
+        if not tokens:
+            return queryset.none()
+        tsquery = " & ".join(f"{token}:*" for token in tokens)
+
+        document = self.document(connection, queryset.model, fields)
+        query = "to_tsquery('simple', %s)"
+        return queryset.annotate(
+            **{RANK_ANNOTATION: RawSQL(f"ts_rank({document}, {query})", (tsquery,))}
+        ).filter(pk__in=RawSQL(
+            f"SELECT id FROM {connection.ops.quote_name(queryset.model._meta.db_table)}"
+            f" WHERE {document} @@ {query}",
+            (tsquery,),
+        ))
+
+
+VENDOR_BACKENDS = {
+    "sqlite": SQLiteFTSBackend,
+    "postgresql": PostgresFullTextBackend,
+}
+
+_backends = {}
+
+
+def get_backend(vendor):
+    """
+    The configured ``SEARCH_BACKEND`` (dotted path), else the index backend
+    for the database vendor, else plain ``icontains``.
+    """
+    if vendor not in _backends:
+        path = settings.SEARCH_BACKEND
+        backend_class = (
+            import_string(path) if path else VENDOR_BACKENDS.get(vendor, IContainsBackend)
+        )
+        _backends[vendor] = backend_class()
+    return _backends[vendor]
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Drop-in replacement for ``SearchFilter`` on models listed in
+    ``SEARCH_INDEXES``: same ``?search=`` parameter, but served from a
+    maintained full-text index and annotated with ``search_rank``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        if queryset.model._meta.label not in SEARCH_INDEXES:
+            return super().filter_queryset(request, queryset, view)
+
+        vendor = connections[queryset.db].vendor
+        return get_backend(vendor).search(self, queryset, view, request, terms)
+
+
+class RankedOrderingFilter(filters.OrderingFilter):
+    """OrderingFilter that keeps relevance order for searches without ``?ordering=``."""
+
+    def filter_queryset(self, request, queryset, view):
+        if RANK_ANNOTATION in queryset.query.annotations and not request.query_params.get(
+            self.ordering_param
+        ):
+            return queryset.order_by(F(RANK_ANNOTATION).desc(), "id")
+        return super().filter_queryset(request, queryset, view)
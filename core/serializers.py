@@ -1,8 +1,13 @@
 # core/serializers.py
+from datetime import date
+
 from rest_framework import serializers
 from django.db.models import Count
 from .models import Company, Department, Employee, Project
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.relations import MANY_RELATION_KWARGS
+from django.core.exceptions import ValidationError as DjangoValidationError
+from config.rows import RowSerializer
 
 
 class CompanySerializer(serializers.ModelSerializer):
@@ -58,10 +63,9 @@ class EmployeeSerializer(serializers.ModelSerializer):
         department = attrs.get("department") or getattr(
             self.instance, "department", None
         )
-        print(company,department)
 
         if company and department:
-            if department.company != company:
+            if department.company_id != company.id:
                 raise serializers.ValidationError(
                     {"department": "Department must belong to the selected company."}
                 )
@@ -72,8 +76,46 @@ class EmployeeSerializer(serializers.ModelSerializer):
         return obj.days_employed
 
 
+class BulkManyRelatedField(serializers.ManyRelatedField):
+    """Resolves a list of primary keys with one ``IN`` query, not one per id."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        child = self.child_relation
+        queryset = child.get_queryset()
+        pk_field = queryset.model._meta.pk
+        pks = []
+        for value in data:
+            if isinstance(value, bool):
+                child.fail("incorrect_type", data_type=type(value).__name__)
+            try:
+                pks.append(pk_field.to_python(value))
+            except DjangoValidationError:
+                child.fail("incorrect_type", data_type=type(value).__name__)
+
+        objects = queryset.in_bulk(pks)
+        for pk in pks:
+            if pk not in objects:
+                child.fail("does_not_exist", pk_value=pk)
+        return [objects[pk] for pk in pks]
+
+
+class BulkPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkManyRelatedField(**list_kwargs)
+
+
 class ProjectSerializer(serializers.ModelSerializer):
-    assigned_employees = serializers.PrimaryKeyRelatedField(
+    assigned_employees = BulkPrimaryKeyRelatedField(
         many=True, queryset=Employee.objects.all()
     )
 
@@ -138,3 +180,32 @@ class ProjectSerializer(serializers.ModelSerializer):
                         )
 
         return data
+
+
+class EmployeeRowSerializer(RowSerializer):
+    """EmployeeSerializer output for list pages, built from ``.values()`` rows."""
+
+    serializer_class = EmployeeSerializer
+    method_sources = {"days_employed": "hired_on"}
+
+    def __init__(self, context=None):
+        super().__init__(context)
+        # One date for the whole page rather than a date.today() per row.
+        self.today = date.today()
+
+    def get_days_employed(self, hired_on):
+        return (self.today - hired_on).days
+
+
+class ProjectRowSerializer(RowSerializer):
+    """ProjectSerializer output for list pages, built from ``.values()`` rows."""
+
+    serializer_class = ProjectSerializer
+
+
+class CompanyRowSerializer(RowSerializer):
+    serializer_class = CompanySerializer
+
+
+class DepartmentRowSerializer(RowSerializer):
+    serializer_class = DepartmentSerializer
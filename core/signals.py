@@ -0,0 +1,117 @@
+# core/signals.py
+from collections import Counter
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from config.cache import bump_versions
+from .counters import COUNTERS, apply_deltas
+from .models import Company, Department, Employee, Project
+from .timeline import widen_span_bound
+
+
+def affected_companies(instance):
+    if isinstance(instance, Company):
+        return {instance.pk}
+    # A move between companies invalidates both; _loaded_values still holds
+    # the old id here because this receiver is connected before the counter
+    # one below, which resets it.
+    loaded = getattr(instance, "_loaded_values", {})
+    return {instance.company_id, loaded.get("company_id")}
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Employee)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Employee)
+@receiver(post_delete, sender=Project)
+def invalidate_cached_reads(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_versions(affected_companies(instance))
+
+
+@receiver(m2m_changed, sender=Project.assigned_employees.through)
+def invalidate_cached_reads_on_assignment(
+    sender, instance, action, reverse, pk_set=None, **kwargs
+):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    bump_versions(affected_companies(instance))
+
+    # Assignments are part of the project representation; move updated_at
+    # so ETags change with them.
+    now = timezone.now()
+    if not reverse:
+        Project.objects.filter(pk=instance.pk).update(updated_at=now)
+        instance.updated_at = now
+    elif pk_set:
+        Project.objects.filter(pk__in=pk_set).update(updated_at=now)
+
+
+@receiver(pre_delete, sender=Employee)
+def touch_projects_on_employee_delete(sender, instance, origin=None, **kwargs):
+    # The cascade removes the employee's assignment rows without sending
+    # m2m_changed; their projects' ETags must still change.
+    if isinstance(origin, Company) or getattr(origin, "model", None) is Company:
+        return
+    Project.objects.filter(
+        pk__in=Project.assigned_employees.through.objects.filter(
+            employee_id=instance.pk
+        ).values("project_id")
+    ).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Project)
+def widen_project_span_bound(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    # Runs before update_counters_on_save, which resets _loaded_values.
+    loaded = getattr(instance, "_loaded_values", {})
+    moved = any(
+        name not in loaded or loaded[name] != getattr(instance, name)
+        for name in ("company_id", "start_date", "end_date")
+    )
+    if created or moved:
+        widen_span_bound(instance.company_id, instance.span_days)
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Employee)
+@receiver(post_save, sender=Project)
+def update_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    loaded = getattr(instance, "_loaded_values", {})
+    deltas = Counter()
+    for attname, parent, field in COUNTERS[sender]:
+        new = getattr(instance, attname)
+        old = None if created else loaded.get(attname, new)
+        if old != new:
+            deltas[(parent, old, field)] -= 1
+            deltas[(parent, new, field)] += 1
+    apply_deltas(deltas)
+
+    instance._loaded_values = {
+        name: getattr(instance, name) for name in sender.tracked_fields
+    }
+
+
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Employee)
+@receiver(post_delete, sender=Project)
+def update_counters_on_delete(sender, instance, origin=None, **kwargs):
+    # Deleting a company cascades to everything below it; there is nothing
+    # left worth counting.
+    if isinstance(origin, Company) or getattr(origin, "model", None) is Company:
+        return
+
+    deltas = Counter()
+    for attname, parent, field in COUNTERS[sender]:
+        deltas[(parent, getattr(instance, attname), field)] -= 1
+    apply_deltas(deltas)
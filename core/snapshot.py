@@ -0,0 +1,109 @@
+# core/snapshot.py
+"""
+The whole org chart of one company in one response.
+
+``build_snapshot`` reads the company, its departments, employees, projects
+and project assignments with five queries, then nests employees and
+projects under their departments through ``department_id`` indexes. Each
+row serializes exactly as on its own list endpoint.
+
+The rendered JSON is cached per company under the response-cache version
+that ``core.signals`` bumps on every write under that company, so a hit
+costs one cache round trip for the versions and one for the blob. The ETag
+is derived from the cache key alone: a revalidation is answered without
+reading, let alone building, the blob.
+"""
+from datetime import date
+from hashlib import md5
+
+from django.conf import settings
+from django.utils.http import quote_etag
+
+from config.cache import PREFIX, get_cache, get_versions
+from config.renderers import dumps
+from config.response import envelope
+
+from .models import Company, Department, Employee, Project
+from .serializers import (
+    CompanyRowSerializer,
+    DepartmentRowSerializer,
+    EmployeeRowSerializer,
+    ProjectRowSerializer,
+)
+
+
+class CompanyProjectRowSerializer(ProjectRowSerializer):
+    """Reads assignments by company with a join instead of a project id list."""
+
+    def __init__(self, company_id, context=None):
+        super().__init__(context)
+        self.company_id = company_id
+
+    def link_filter(self, field, rows):
+        return {f"{field.m2m_field_name()}__company_id": self.company_id}
+
+
+def build_snapshot(company_id):
+    """The nested company tree, or None when the company does not exist."""
+    companies = CompanyRowSerializer()
+    company = companies.serialize(
+        companies.values(Company.objects.filter(pk=company_id))
+    )
+    if not company:
+        return None
+
+    departments = DepartmentRowSerializer()
+    employees = EmployeeRowSerializer()
+    projects = CompanyProjectRowSerializer(company_id)
+    tree = departments.serialize(
+        departments.values(Department.objects.filter(company_id=company_id).order_by("id"))
+    )
+
+    by_department = {}
+    for department in tree:
+        department["employees"] = []
+        department["projects"] = []
+        by_department[department["id"]] = department
+
+    employee_rows = employees.serialize(
+        employees.values(Employee.objects.filter(company_id=company_id).order_by("id"))
+    )
+    project_rows = projects.serialize(
+        projects.values(Project.objects.filter(company_id=company_id).order_by("id"))
+    )
+    for key, rows in (("employees", employee_rows), ("projects", project_rows)):
+        for row in rows:
+            department = by_department.get(row["department"])
+            # Rows pointing at another company's department (only possible
+            # through the admin) stay out of this company's tree.
+            if department is not None:
+                department[key].append(row)
+
+    return {**company[0], "departments": tree}
+
+
+def snapshot_key(company_id):
+    generation, version = get_versions(company_id)
+    # days_employed depends on the date, so the blob does too.
+    return f"{PREFIX}:snapshot:{company_id}:{generation}:{version}:{date.today().isoformat()}"
+
+
+def snapshot_etag(key):
+    return quote_etag(md5(key.encode()).hexdigest())
+
+
+def company_snapshot(company_id, key):
+    """
+    Return the JSON bytes of the company's snapshot envelope stored under
+    ``key``, building and caching it on a miss, or None for an unknown
+    company.
+    """
+    cache = get_cache()
+    blob = cache.get(key)
+    if blob is None:
+        data = build_snapshot(company_id)
+        if data is None:
+            return None
+        blob = dumps(envelope(data, 200, "Success"))
+        cache.set(key, blob, settings.COMPANY_SNAPSHOT_CACHE_TIMEOUT)
+    return blob
@@ -0,0 +1,30 @@
+# core/tasks.py
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from accounts.scope import Scope
+from config.cache import invalidate_all
+from jobs.queue import task
+
+from .counters import rebuild_counters as rebuild
+from .importers import EmployeeImporter, iter_rows
+
+
+@task("core.rebuild_counters")
+def rebuild_counters():
+    with transaction.atomic():
+        rebuild()
+        invalidate_all()
+
+
+# Not retried: a second run would re-import the rows the first one created
+# before failing, and report them as duplicates.
+@task("core.import_employees", max_attempts=1)
+def import_employees(path, scope, file_type=None, batch_size=None):
+    """Run an import queued by ``POST employees/import/`` with ``background``."""
+    importer = EmployeeImporter(Scope(*scope), batch_size=batch_size)
+    try:
+        with default_storage.open(path, "rb") as upload:
+            return importer.run(iter_rows(upload, file_type))
+    finally:
+        default_storage.delete(path)
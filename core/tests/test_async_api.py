@@ -0,0 +1,65 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from accounts.tokens import ClaimsRefreshToken
+
+
+def fetch(user, path):
+    """GET ``path`` on both the DRF view and its async twin."""
+    headers = {}
+    if user is not None:
+        access = ClaimsRefreshToken.for_user(user).access_token
+        headers["Authorization"] = f"Bearer {access}"
+    sync = Client().get(path, headers=headers)
+    asynchronous = async_to_sync(AsyncClient().get)(f"/async{path}", headers=headers)
+    return sync, asynchronous
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "role,path",
+    [
+        ("admin", "/core/api/companies/"),
+        ("manager", "/core/api/departments/?per_page=1&page=1"),
+        ("manager", "/core/api/employees/?ordering=-name&per_page=2"),
+        ("manager", "/core/api/employees/?per_page=2&cursor="),
+        ("employee_user", "/core/api/employees/"),
+        ("employee_user", "/core/api/employees/me/"),
+        ("manager", "/core/api/projects/?search=project&department={department}"),
+        ("manager", "/core/api/projects/{project}/"),
+        ("manager", "/core/api/employees/{employee}/"),
+        ("employee_user", "/reviews/api/reviews/"),
+        ("manager", "/reviews/api/reviews/{review}/"),
+    ],
+)
+def test_async_reads_match_sync_views(make_org, role, path):
+    org = make_org()
+    make_org()
+    path = path.format(
+        department=org.department.id,
+        project=org.projects[1].id,
+        employee=org.employees[2].id,
+        review=org.reviews[1].id,
+    )
+
+    sync, asynchronous = fetch(getattr(org, role), path)
+
+    assert asynchronous.status_code == sync.status_code == 200
+    assert asynchronous.json() == sync.json()
+
+
+@pytest.mark.django_db
+def test_async_reads_enforce_auth_and_scope(make_org):
+    org = make_org()
+    other = make_org()
+
+    _, anonymous = fetch(None, "/core/api/projects/")
+    assert anonymous.status_code == 401
+    assert anonymous["WWW-Authenticate"].startswith("Bearer")
+
+    _, foreign = fetch(org.manager, f"/core/api/projects/{other.projects[0].id}/")
+    assert foreign.status_code == 404
+
+    _, missing = fetch(org.manager, "/core/api/employees/me/")
+    assert missing.status_code == 404
+    assert missing.json()["message"] == "No employee record found."
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from config.cache import get_cache
+from core.models import Company, Department, Employee, Project
+from core.serializers import (
+    CompanySerializer,
+    DepartmentSerializer,
+    EmployeeSerializer,
+    ProjectSerializer,
+)
+from core.snapshot import snapshot_key
+
+
+def snapshot_url(org):
+    return f"/core/api/companies/{org.company.pk}/snapshot/"
+
+
+@pytest.mark.django_db
+def test_snapshot_nests_the_company_tree(make_org, api_client):
+    org = make_org(4)
+    make_org()
+    api_client.force_authenticate(org.manager)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(snapshot_url(org))
+
+    assert response.status_code == 200
+    assert len(ctx.captured_queries) == 5
+    body = json.loads(response.content)
+    assert body["status_code"] == 200 and body["message"] == "Success"
+
+    snapshot = body["data"]
+    employees = Employee.objects.filter(company=org.company).order_by("id")
+    projects = Project.objects.filter(company=org.company).order_by("id")
+    expected = {
+        **CompanySerializer(Company.objects.get(pk=org.company.pk)).data,
+        "departments": [
+            {
+                **DepartmentSerializer(Department.objects.get(pk=org.department.pk)).data,
+                "employees": EmployeeSerializer(employees, many=True).data,
+                "projects": ProjectSerializer(projects, many=True).data,
+            }
+        ],
+    }
+    expected = json.loads(json.dumps(expected, default=str))
+    assert snapshot == expected
+
+
+@pytest.mark.django_db
+def test_snapshot_is_cached_until_a_write_under_the_company(make_org, api_client):
+    org, other = make_org(), make_org()
+    api_client.force_authenticate(org.manager)
+    first = api_client.get(snapshot_url(org))
+
+    with CaptureQueriesContext(connection) as ctx:
+        again = api_client.get(snapshot_url(org), HTTP_IF_NONE_MATCH=first["ETag"])
+    assert again.status_code == 304
+    assert len(ctx.captured_queries) == 0
+
+    # The ETag comes from the cache key: a revalidation after the blob was
+    # evicted is still answered without building the tree.
+    get_cache().delete(snapshot_key(org.company.pk))
+    with CaptureQueriesContext(connection) as ctx:
+        cold = api_client.get(snapshot_url(org), HTTP_IF_NONE_MATCH=first["ETag"])
+    assert cold.status_code == 304
+    assert len(ctx.captured_queries) == 0
+
+    other.employees[0].name = "Elsewhere"
+    other.employees[0].save()
+    assert api_client.get(snapshot_url(org)).content == first.content
+
+    org.projects[0].assigned_employees.remove(org.employees[0])
+    changed = api_client.get(snapshot_url(org), HTTP_IF_NONE_MATCH=first["ETag"])
+    assert changed.status_code == 200
+    projects = json.loads(changed.content)["data"]["departments"][0]["projects"]
+    assert org.employees[0].pk not in projects[0]["assigned_employees"]
+
+
+@pytest.mark.django_db
+def test_snapshot_access(make_org, api_client):
+    org, other = make_org(), make_org()
+
+    api_client.force_authenticate(org.employee_user)
+    assert api_client.get(snapshot_url(org)).status_code == 403
+
+    api_client.force_authenticate(other.manager)
+    assert api_client.get(snapshot_url(org)).status_code == 404
+
+    api_client.force_authenticate(other.admin)
+    assert api_client.get(snapshot_url(org)).status_code == 200
+    assert api_client.get("/core/api/companies/999999/snapshot/").status_code == 404
@@ -0,0 +1,87 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from core.models import Employee
+
+
+@pytest.fixture
+def client_for(make_org, api_client):
+    org = make_org()
+    api_client.force_authenticate(user=org.manager)
+    return org, api_client
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("cache_timeout", [0, 300])
+def test_unchanged_list_returns_304(client_for, settings, cache_timeout):
+    settings.RESPONSE_CACHE_TIMEOUT = cache_timeout
+    org, client = client_for
+
+    first = client.get("/core/api/projects/")
+    assert first.status_code == 200
+    etag = first["ETag"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        again = client.get("/core/api/projects/", HTTP_IF_NONE_MATCH=etag)
+    assert again.status_code == 304
+    assert again.content == b""
+    assert len(ctx.captured_queries) <= 1
+
+    org.projects[0].assigned_employees.remove(org.employees[0])
+    changed = client.get("/core/api/projects/", HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_list_etag_tracks_deletes_and_counters(client_for, settings):
+    settings.RESPONSE_CACHE_TIMEOUT = 0
+    org, client = client_for
+
+    employees = client.get("/core/api/employees/")["ETag"]
+    company = client.get(f"/core/api/companies/{org.company.id}/")["ETag"]
+    project_url = f"/core/api/projects/{org.projects[0].id}/"
+    project = client.get(project_url)["ETag"]
+
+    # Deleting an assigned employee drops it from the project's assignments.
+    Employee.objects.filter(pk=org.employees[-1].pk).delete()
+
+    assert client.get("/core/api/employees/", HTTP_IF_NONE_MATCH=employees).status_code == 200
+    # employees_count changed, so the company representation did too.
+    assert (
+        client.get(f"/core/api/companies/{org.company.id}/", HTTP_IF_NONE_MATCH=company).status_code
+        == 200
+    )
+    assert client.get(project_url, HTTP_IF_NONE_MATCH=project).status_code == 200
+
+
+@pytest.mark.django_db
+def test_retrieve_honours_if_modified_since(client_for, settings):
+    settings.RESPONSE_CACHE_TIMEOUT = 0
+    org, client = client_for
+    url = f"/reviews/api/reviews/{org.reviews[0].id}/"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert "Authorization" in first["Vary"]
+
+    again = client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+    assert again.status_code == 304
+    assert again["ETag"] == first["ETag"]
+
+
+@pytest.mark.django_db
+def test_employee_etag_changes_daily(client_for, settings, monkeypatch):
+    settings.RESPONSE_CACHE_TIMEOUT = 0
+    org, client = client_for
+    url = f"/core/api/employees/{org.employees[1].id}/"
+    etag = client.get(url)["ETag"]
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date(2100, 1, 1)
+
+    monkeypatch.setattr("config.conditional.date", Tomorrow)
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
@@ -0,0 +1,77 @@
+import pytest
+from datetime import date
+from django.core.management import call_command
+from core.models import Company, Department, Employee, Project
+
+
+def refresh(*objs):
+    for obj in objs:
+        obj.refresh_from_db()
+
+
+@pytest.mark.django_db
+def test_counters_follow_create_move_and_delete():
+    acme = Company.objects.create(name="Acme")
+    globex = Company.objects.create(name="Globex")
+    it = Department.objects.create(company=acme, name="IT")
+    ops = Department.objects.create(company=globex, name="Ops")
+
+    emp = Employee.objects.create(
+        company=acme, department=it, name="Sara", email="sara@acme.com"
+    )
+    Project.objects.create(
+        company=acme,
+        department=it,
+        name="Apollo",
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 6, 1),
+    )
+    refresh(acme, globex, it, ops)
+    assert (acme.departments_count, acme.employees_count, acme.projects_count) == (1, 1, 1)
+    assert (it.employees_count, it.projects_count) == (1, 1)
+
+    emp = Employee.objects.get(pk=emp.pk)
+    emp.company, emp.department = globex, ops
+    emp.save()
+    refresh(acme, globex, it, ops)
+    assert (acme.employees_count, globex.employees_count) == (0, 1)
+    assert (it.employees_count, ops.employees_count) == (0, 1)
+
+    emp.delete()
+    refresh(globex, ops)
+    assert globex.employees_count == 0
+    assert ops.employees_count == 0
+
+
+@pytest.mark.django_db
+def test_company_list_reads_stored_counters():
+    from rest_framework.test import APIClient
+    from django.contrib.auth import get_user_model
+
+    acme = Company.objects.create(name="Acme")
+    it = Department.objects.create(company=acme, name="IT")
+    Employee.objects.create(company=acme, department=it, name="A", email="a@acme.com")
+    admin = get_user_model().objects.create_user(
+        email="admin@test.com", password="pass", role="ADMIN", username="admin"
+    )
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    row = client.get("/core/api/companies/").data["data"][0]
+    assert (row["departments_count"], row["employees_count"], row["projects_count"]) == (1, 1, 0)
+
+
+@pytest.mark.django_db
+def test_rebuild_counters_command_fixes_drift():
+    acme = Company.objects.create(name="Acme")
+    it = Department.objects.create(company=acme, name="IT")
+    Employee.objects.create(company=acme, department=it, name="A", email="a@acme.com")
+    Company.objects.filter(pk=acme.pk).update(employees_count=42)
+
+    with pytest.raises(SystemExit):
+        call_command("rebuild_counters", "--check")
+
+    call_command("rebuild_counters")
+    acme.refresh_from_db()
+    assert acme.employees_count == 1
+    call_command("rebuild_counters", "--check")
@@ -0,0 +1,142 @@
+import json
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from core.models import Company, Department, Employee
+
+
+def upload(name, text):
+    return SimpleUploadedFile(name, text.encode(), content_type="text/plain")
+
+
+@pytest.mark.django_db
+def test_csv_import_creates_rows_in_batches_and_reports_errors(make_org, api_client):
+    org = make_org(1)
+    other = Department.objects.create(
+        company=Company.objects.create(name="Other"), name="Ops"
+    )
+    dept = org.department.pk
+    csv_text = "\n".join(
+        [
+            "company,department,name,email,mobile,designation,hired_on",
+            f",{dept},Ann,ann@corp.com,1,Dev,2024-02-01",
+            f"{org.company.pk},{dept},Bob,bob@corp.com,2,Dev,",
+            f",{dept},Bob Again,bob@corp.com,3,Dev,",
+            f",{dept},Cat,not-an-email,4,Dev,",
+            f",{other.pk},Dan,dan@corp.com,5,Dev,",
+            f",{dept},Eve,emp0@{org.company.name}.com,6,Dev,",
+            f",{dept},Fay,fay@corp.com,7,Dev,01/02/2024",
+            f",{dept},Gus,gus@corp.com,8,Dev,",
+        ]
+    )
+
+    api_client.force_authenticate(org.manager)
+    response = api_client.post(
+        "/core/api/employees/import/",
+        {"file": upload("staff.csv", csv_text), "batch_size": 2},
+        format="multipart",
+    )
+
+    assert response.status_code == 200
+    report = response.data["data"]
+    assert (report["total_rows"], report["created"], report["failed"]) == (8, 3, 5)
+    assert {e["row"]: list(e["errors"]) for e in report["errors"]} == {
+        3: ["email"],
+        4: ["email"],
+        5: ["department"],
+        6: ["email"],
+        7: ["hired_on"],
+    }
+    assert Employee.objects.filter(email__in=["ann@corp.com", "bob@corp.com", "gus@corp.com"]).count() == 3
+
+    org.company.refresh_from_db()
+    org.department.refresh_from_db()
+    assert org.company.employees_count == 4
+    assert org.department.employees_count == 4
+
+
+@pytest.mark.django_db
+def test_jsonl_import(make_org, api_client):
+    org = make_org(1)
+    lines = [
+        json.dumps({"department": org.department.pk, "name": "Ann", "email": "ann@corp.com", "mobile": "1", "designation": "Dev"}),
+        "",
+        "{not json",
+    ]
+
+    api_client.force_authenticate(org.admin)
+    response = api_client.post(
+        "/core/api/employees/import/",
+        {"file": upload("staff.jsonl", "\n".join(lines))},
+        format="multipart",
+    )
+
+    report = response.data["data"]
+    assert (report["total_rows"], report["created"], report["failed"]) == (2, 1, 1)
+    assert Employee.objects.get(email="ann@corp.com").company_id == org.company.pk
+
+
+@pytest.mark.django_db
+def test_import_rejects_employees_and_unknown_formats(make_org, api_client):
+    org = make_org(1)
+
+    api_client.force_authenticate(org.employee_user)
+    response = api_client.post(
+        "/core/api/employees/import/", {"file": upload("a.csv", "")}, format="multipart"
+    )
+    assert response.status_code == 403
+
+    api_client.force_authenticate(org.admin)
+    response = api_client.post(
+        "/core/api/employees/import/", {"file": upload("a.xlsx", "")}, format="multipart"
+    )
+    assert response.status_code == 400
+
+    for batch_size in ("-5", "two"):
+        response = api_client.post(
+            "/core/api/employees/import/",
+            {"file": upload("a.csv", ""), "batch_size": batch_size},
+            format="multipart",
+        )
+        assert response.status_code == 400
+        assert response.data["message"] == "A positive integer is required."
+
+    latin1 = SimpleUploadedFile("a.csv", "name,email\nJosé,jose@corp.com\n".encode("latin-1"))
+    response = api_client.post(
+        "/core/api/employees/import/", {"file": latin1}, format="multipart"
+    )
+    assert response.status_code == 400
+    assert "UTF-8" in response.data["message"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "bad_field,reason",
+    [("Zoë".encode("latin-1"), "UTF-8"), (b'"' + b"x" * 200_000 + b'"', "CSV")],
+)
+def test_format_error_midway_reports_the_rows_already_imported(
+    make_org, api_client, bad_field, reason
+):
+    org = make_org(1)
+    dept = org.department.pk
+    # Well past the decoder's read buffer, so rows are imported before the
+    # bad line is reached.
+    good = b"".join(
+        f"{dept},Row {n},row{n}@corp.com,{n},Dev\n".encode() for n in range(500)
+    )
+    text = b"department,name,email,mobile,designation\n" + good
+    text += f"{dept},".encode() + bad_field + b",bad@corp.com,1,Dev\n"
+    api_client.force_authenticate(org.admin)
+
+    response = api_client.post(
+        "/core/api/employees/import/",
+        {"file": SimpleUploadedFile("staff.csv", text), "batch_size": 100},
+        format="multipart",
+    )
+
+    assert response.status_code == 200
+    report = response.data["data"]
+    assert report["created"] == report["total_rows"] == report["stopped"]["after_row"]
+    assert report["created"] > 0
+    assert reason in report["stopped"]["reason"]
+    assert f"Stopped after row {report['created']}" in response.data["message"]
+    assert Employee.objects.filter(email__startswith="row").count() == report["created"]
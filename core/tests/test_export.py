@@ -0,0 +1,45 @@
+import csv
+import io
+import json
+import pytest
+
+
+def body(response):
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+def test_employee_export_ndjson_is_scoped_and_filtered(make_org, api_client):
+    org = make_org(3)
+    make_org(2)
+
+    api_client.force_authenticate(org.manager)
+    response = api_client.get("/core/api/employees/export/")
+    rows = [json.loads(line) for line in body(response).splitlines()]
+
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert sorted(row["id"] for row in rows) == sorted(e.pk for e in org.employees)
+    assert rows[0]["hired_on"] == "2024-01-01"
+
+    response = api_client.get("/core/api/employees/export/?search=Employee 2")
+    assert [json.loads(line)["name"] for line in body(response).splitlines()] == ["Employee 2"]
+
+
+@pytest.mark.django_db
+def test_project_export_csv(make_org, api_client):
+    org = make_org(2)
+
+    api_client.force_authenticate(org.employee_user)
+    response = api_client.get("/core/api/projects/export/?output=csv")
+    rows = list(csv.DictReader(io.StringIO(body(response))))
+
+    assert response["Content-Disposition"] == 'attachment; filename="projects.csv"'
+    assert len(rows) == 2
+    assert rows[0]["assigned_employees"] == ";".join(str(e.pk) for e in org.employees[:3])
+
+
+@pytest.mark.django_db
+def test_export_rejects_unknown_output(make_org, api_client):
+    org = make_org(1)
+    api_client.force_authenticate(org.admin)
+    assert api_client.get("/core/api/employees/export/?output=xml").status_code == 400
@@ -0,0 +1,123 @@
+import base64
+import json
+import pytest
+from datetime import date
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from core.models import Company, Department, Employee
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+@pytest.fixture
+def admin_client():
+    company = Company.objects.create(name="TestCorp")
+    dept = Department.objects.create(company=company, name="IT")
+    for i in range(7):
+        Employee.objects.create(
+            company=company,
+            department=dept,
+            name=f"Emp {i % 3}",
+            email=f"emp{i}@corp.com",
+            hired_on=date(2024, 1, 1 + i % 2) if i % 4 else None,
+        )
+    admin = User.objects.create_user(
+        email="admin@test.com", password="pass", role="ADMIN", username="admin"
+    )
+    client = APIClient()
+    client.force_authenticate(user=admin)
+    return client
+
+
+def walk(client, url):
+    ids, cursors = [], []
+    response = client.get(url + "&cursor=")
+    while True:
+        assert response.status_code == 200
+        ids.extend(row["id"] for row in response.data["data"])
+        cursor = response.data["pagination"]["next_cursor"]
+        if not cursor:
+            return ids, cursors, response
+        cursors.append(cursor)
+        response = client.get(f"{url}&cursor={cursor}")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", ["id", "name", "-name", "hired_on", "-hired_on"])
+def test_keyset_walk_matches_full_ordering(admin_client, ordering):
+    field = ordering.lstrip("-")
+    direction = "desc" if ordering.startswith("-") else "asc"
+    expected_ids = list(
+        Employee.objects.order_by(
+            getattr(F(field), direction)(nulls_last=True), getattr(F("id"), direction)()
+        ).values_list("id", flat=True)
+    )
+
+    ids, _, _ = walk(admin_client, f"/core/api/employees/?per_page=2&ordering={ordering}")
+
+    assert ids == expected_ids
+
+
+@pytest.mark.django_db
+def test_keyset_previous_cursor_returns_prior_page(admin_client):
+    url = "/core/api/employees/?per_page=2&ordering=hired_on"
+    first = admin_client.get(url + "&cursor=")
+    second = admin_client.get(f"{url}&cursor={first.data['pagination']['next_cursor']}")
+    back = admin_client.get(
+        f"{url}&cursor={second.data['pagination']['previous_cursor']}"
+    )
+
+    assert [r["id"] for r in back.data["data"]] == [r["id"] for r in first.data["data"]]
+
+
+@pytest.mark.django_db
+def test_keyset_skips_count_and_keeps_envelope(admin_client):
+    with CaptureQueriesContext(connection) as ctx:
+        response = admin_client.get("/core/api/employees/?per_page=2&cursor=")
+
+    # Not even the conditional-GET validator counts the scope.
+    assert not [q for q in ctx.captured_queries if "COUNT(" in q["sql"].upper()]
+    pagination = response.data["pagination"]
+    assert pagination["total_count"] is None
+    assert pagination["per_page"] == 2
+    assert {"first_page", "last_page", "current_page"} <= set(pagination)
+
+
+@pytest.mark.django_db
+def test_keyset_page_etag_follows_its_rows(admin_client, settings):
+    settings.RESPONSE_CACHE_TIMEOUT = 0
+    url = "/core/api/employees/?per_page=2&cursor="
+    first = admin_client.get(url)
+    etag = first["ETag"]
+    assert not first.has_header("Last-Modified")
+
+    with CaptureQueriesContext(connection) as ctx:
+        again = admin_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert again.status_code == 304
+    assert len(ctx.captured_queries) <= 1
+
+    # A row off the page leaves it alone; one on the page changes it.
+    Employee.objects.filter(pk=first.data["data"][0]["id"] + 5).delete()
+    assert admin_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    Employee.objects.filter(pk=first.data["data"][0]["id"]).delete()
+    assert admin_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_returns_404(admin_client):
+    response = admin_client.get("/core/api/employees/?cursor=not-a-cursor")
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "payload",
+    [{"id": 1, "v": "notadate"}, {"id": 1, "v": [2024]}, {"id": "x"}, [1]],
+)
+def test_forged_cursor_returns_404(admin_client, payload):
+    raw = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+    response = admin_client.get(f"/core/api/employees/?ordering=hired_on&cursor={raw}")
+    assert response.status_code == 404
@@ -0,0 +1,119 @@
+import logging
+import re
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+
+from accounts.tokens import ClaimsRefreshToken
+from config import performance
+from config.performance import Histogram, registry
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+def series(view, method="GET"):
+    for row in registry.snapshot():
+        if (row["view"], row["method"]) == (view, method):
+            return row
+    raise AssertionError(f"no series for {view} {method}")
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    hist = Histogram((1, 2, 4))
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        hist.observe(value)
+
+    assert hist.counts == [1, 2, 1, 1]
+    assert hist.quantile(0.5) == pytest.approx(1.75)
+    assert hist.quantile(0.99) == 4
+    assert Histogram((1,)).quantile(0.5) is None
+
+
+@pytest.mark.django_db
+def test_request_is_recorded_per_view(make_org, api_client):
+    org = make_org()
+    api_client.force_authenticate(user=org.manager)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get("/core/api/employees/?per_page=2")
+
+    row = series("employee-list")
+    assert row["request_seconds"]["count"] == 1
+    assert row["db_queries"]["sum"] == len(ctx.captured_queries)
+    assert row["db_seconds"]["sum"] > 0
+    assert row["response_render_seconds"]["sum"] > 0
+    assert row["response_bytes"]["sum"] == len(response.content)
+
+
+@pytest.mark.django_db
+def test_metrics_endpoints_are_admin_only(make_org, api_client):
+    org = make_org()
+    api_client.force_authenticate(user=org.manager)
+    api_client.get("/core/api/companies/")
+
+    assert api_client.get("/api/metrics/").status_code == 403
+    assert api_client.get("/api/metrics/prometheus/").status_code == 403
+
+    api_client.force_authenticate(user=org.admin)
+    views = {row["view"] for row in api_client.get("/api/metrics/").data["data"]}
+    assert "company-list" in views
+
+    text = api_client.get("/api/metrics/prometheus/").content.decode()
+    assert "# TYPE http_request_seconds histogram" in text
+    assert 'http_request_seconds_count{view="company-list",method="GET"} 1' in text
+    assert 'http_db_queries_bucket{view="company-list",method="GET",le="+Inf"} 1' in text
+
+
+@pytest.mark.django_db
+def test_slow_request_logs_queries_with_call_sites(make_org, api_client, settings, caplog):
+    settings.PERFORMANCE_SLOW_REQUEST_MS = 0
+    org = make_org()
+    api_client.force_authenticate(user=org.manager)
+
+    with caplog.at_level(logging.WARNING, logger="performance"):
+        api_client.get(f"/core/api/projects/{org.projects[0].id}/")
+
+    message = caplog.records[-1].getMessage()
+    assert "GET /core/api/projects/" in message
+    assert "[project-detail]" in message
+    assert 'FROM "core_project"' in message
+    assert re.search(r"^\s+[\d.]+ms  \w+/\w+\.py:\d+ in \w+$", message, re.M)
+
+
+@pytest.mark.django_db
+def test_fast_requests_skip_the_stack_walk(make_org, api_client, settings, monkeypatch):
+    settings.RESPONSE_CACHE_TIMEOUT = 0
+    settings.PERFORMANCE_CALL_SITE_SAMPLE_RATE = 0
+    walks = []
+    monkeypatch.setattr(performance, "call_site", lambda: walks.append(1) or "site")
+    org = make_org()
+    api_client.force_authenticate(user=org.manager)
+
+    api_client.get("/core/api/employees/")
+    assert walks == []
+
+    settings.PERFORMANCE_CALL_SITE_SAMPLE_RATE = 1
+    api_client.get("/core/api/employees/")
+    assert walks
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_views_are_recorded(make_org):
+    org = make_org()
+    access = ClaimsRefreshToken.for_user(org.manager).access_token
+    response = async_to_sync(AsyncClient().get)(
+        "/async/core/api/employees/", headers={"Authorization": f"Bearer {access}"}
+    )
+    assert response.status_code == 200
+
+    row = series("async-employee-list")
+    assert row["db_queries"]["sum"] >= 1
+    assert row["response_bytes"]["sum"] == len(response.content)
@@ -0,0 +1,174 @@
+import itertools
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.assignments import AssignmentError, parse_employee_ids
+from core.models import Employee, Project
+
+
+def assigned(project):
+    return sorted(project.assigned_employees.values_list("id", flat=True))
+
+
+HIRES = itertools.count()
+
+
+def hire(org, count):
+    numbers = [next(HIRES) for _ in range(count)]
+    return [
+        Employee.objects.create(
+            company=org.company,
+            department=org.department,
+            name=f"Hire {n}",
+            email=f"hire{n}@{org.company.name}.com",
+        ).pk
+        for n in numbers
+    ]
+
+
+@pytest.mark.django_db
+def test_assign_inserts_only_missing_rows(make_org, api_client):
+    org = make_org()
+    project = org.projects[0]
+    already = org.employees[0].pk
+    new = hire(org, 3)
+    api_client.force_authenticate(org.manager)
+    before = Project.objects.get(pk=project.pk).updated_at
+
+    response = api_client.post(
+        f"/core/api/projects/{project.pk}/assign/",
+        {"employees": [already, *new, new[0]]},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert response.data["data"] == {"project": project.pk, "assigned": new}
+    assert assigned(project) == sorted([e.pk for e in org.employees] + new)
+    assert Project.objects.get(pk=project.pk).updated_at > before
+
+
+@pytest.mark.django_db
+def test_unassign_deletes_only_existing_rows(make_org, api_client):
+    org = make_org()
+    project = org.projects[0]
+    first, second, third = (e.pk for e in org.employees)
+    api_client.force_authenticate(org.manager)
+
+    response = api_client.post(
+        f"/core/api/projects/{project.pk}/unassign/",
+        {"employees": [first, third, 999999]},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert response.data["data"]["unassigned"] == [first, third]
+    assert assigned(project) == [second]
+
+
+@pytest.mark.django_db
+def test_assignment_queries_do_not_scale_with_ids(make_org, api_client):
+    org = make_org()
+    project = org.projects[0]
+    api_client.force_authenticate(org.manager)
+
+    counts = []
+    for size in (2, 40):
+        ids = hire(org, size)
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.post(
+                f"/core/api/projects/{project.pk}/assign/", {"employees": ids}, format="json"
+            )
+        assert response.status_code == 200
+        counts.append(len(ctx.captured_queries))
+
+    assert counts[0] == counts[1]
+
+
+@pytest.mark.django_db
+def test_employees_from_other_companies_are_rejected(make_org, api_client):
+    org, other = make_org(), make_org()
+    project = org.projects[0]
+    api_client.force_authenticate(org.manager)
+
+    response = api_client.post(
+        f"/core/api/projects/{project.pk}/assign/",
+        {"employees": [other.employees[0].pk, org.employees[0].pk]},
+        format="json",
+    )
+
+    assert response.status_code == 400
+    assert str(other.employees[0].pk) in response.data["message"]
+    assert assigned(project) == sorted(e.pk for e in org.employees)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("payload", [{}, {"employees": []}, {"employees": ["x"]}])
+def test_invalid_payloads_are_rejected(make_org, api_client, payload):
+    org = make_org()
+    api_client.force_authenticate(org.manager)
+    response = api_client.post(
+        f"/core/api/projects/{org.projects[0].pk}/assign/", payload, format="json"
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("offset, cast", [(0.9, float), (0, str)])
+def test_non_integer_ids_are_rejected(make_org, api_client, offset, cast):
+    org = make_org()
+    project = org.projects[-1]
+    project.assigned_employees.clear()
+    api_client.force_authenticate(org.manager)
+    pk = cast(org.employees[0].pk + offset)
+    response = api_client.post(
+        f"/core/api/projects/{project.pk}/assign/", {"employees": [pk]}, format="json"
+    )
+    assert response.status_code == 400
+    assert assigned(project) == []
+
+
+@pytest.mark.parametrize("value", [[True], [1, False], [1.0]])
+def test_parse_employee_ids_does_not_coerce(value):
+    with pytest.raises(AssignmentError):
+        parse_employee_ids(value)
+
+
+@pytest.mark.django_db
+def test_assignment_permissions(make_org, api_client):
+    org, other = make_org(), make_org()
+
+    api_client.force_authenticate(org.employee_user)
+    url = f"/core/api/projects/{org.projects[0].pk}/assign/"
+    payload = {"employees": [org.employees[0].pk]}
+    assert api_client.post(url, payload, format="json").status_code == 403
+
+    api_client.force_authenticate(other.manager)
+    assert api_client.post(url, payload, format="json").status_code == 404
+
+
+@pytest.mark.django_db
+def test_project_payload_resolves_employees_in_one_query(make_org, api_client):
+    org = make_org()
+    ids = hire(org, 20)
+    api_client.force_authenticate(org.manager)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.patch(
+            f"/core/api/projects/{org.projects[0].pk}/",
+            {"assigned_employees": ids},
+            format="json",
+        )
+
+    assert response.status_code == 200
+    assert response.data["data"]["assigned_employees"] == ids
+    lookups = [q for q in ctx.captured_queries if '"core_employee"."id" IN (' in q["sql"]]
+    assert len(lookups) == 1
+
+    response = api_client.patch(
+        f"/core/api/projects/{org.projects[0].pk}/",
+        {"assigned_employees": [ids[0], 999999]},
+        format="json",
+    )
+    assert response.status_code == 400
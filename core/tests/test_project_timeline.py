@@ -0,0 +1,142 @@
+from datetime import date, timedelta
+
+import pytest
+
+from core.counters import rebuild_counters
+from core.models import Company, Project
+from core.timeline import overallocations
+
+URL = "/core/api/projects/"
+
+
+def add_project(org, name, start, end, employees=()):
+    project = Project.objects.create(
+        company=org.company,
+        department=org.department,
+        name=name,
+        start_date=start,
+        end_date=end,
+    )
+    project.assigned_employees.set(employees)
+    return project
+
+
+def bound(org):
+    return Company.objects.get(pk=org.company.pk).max_project_days
+
+
+def test_sweep_reports_overlapping_pairs_and_peak():
+    d = date(2025, 1, 1)
+    rows = [
+        (1, "Ann", 10, d, d + timedelta(days=30)),
+        (1, "Ann", 11, d + timedelta(days=10), d + timedelta(days=20)),
+        (1, "Ann", 12, d + timedelta(days=15), d + timedelta(days=40)),
+        (1, "Ann", 13, d + timedelta(days=41), d + timedelta(days=50)),
+        (2, "Bob", 10, d, d + timedelta(days=30)),
+        (2, "Bob", 13, d + timedelta(days=30), d + timedelta(days=50)),
+        (3, "Cat", 10, d, d + timedelta(days=30)),
+        (3, "Cat", 13, d + timedelta(days=31), d + timedelta(days=50)),
+    ]
+
+    report = overallocations(iter(rows))
+
+    assert [(r["employee"], r["peak_projects"]) for r in report] == [(1, 3), (2, 2)]
+    assert [c["projects"] for c in report[0]["conflicts"]] == [[10, 11], [11, 12], [10, 12]]
+    assert report[0]["conflicts"][1] == {
+        "projects": [11, 12],
+        "from": d + timedelta(days=15),
+        "to": d + timedelta(days=20),
+    }
+    # Touching on the last/first day counts as double-booked.
+    assert report[1]["conflicts"] == [
+        {"projects": [10, 13], "from": d + timedelta(days=30), "to": d + timedelta(days=30)}
+    ]
+    assert overallocations(iter(rows), max_projects=2) == report[:1]
+
+
+@pytest.mark.django_db
+def test_span_bound_grows_on_save_and_rebuild_tightens_it(make_org):
+    org = make_org()
+    assert bound(org) == 364  # make_org projects run through 2025
+
+    long = add_project(org, "Long", date(2020, 1, 1), date(2021, 1, 1))
+    assert bound(org) == 366
+
+    long.name = "Renamed"
+    long.save()
+    long.end_date = date(2022, 1, 1)
+    long.save()
+    assert bound(org) == 731
+
+    long.delete()
+    assert bound(org) == 731
+    rebuild_counters()
+    assert bound(org) == 364
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("active_between=2024-06-01,2024-06-30", {"Old", "Decade"}),
+        ("active_between=2024-12-31,2025-01-01", {"Old", "Decade", "P0", "P1", "P2"}),
+        ("active_on=2026-01-01", {"Decade", "Later"}),
+        ("active_between=2030-01-01,2029-01-01", set()),
+        ("active_on=0001-01-02", set()),
+        ("active_between=0001-01-01,9999-12-31", {"Old", "Decade", "Later", "P0", "P1", "P2"}),
+    ],
+)
+def test_active_filters_match_overlap(make_org, api_client, query, expected):
+    org, other = make_org(), make_org()
+    add_project(org, "Old", date(2024, 1, 1), date(2024, 12, 31))
+    add_project(org, "Decade", date(2016, 1, 1), date(2026, 12, 31))
+    add_project(org, "Later", date(2026, 1, 1), date(2026, 3, 1))
+    add_project(other, "Elsewhere", date(2016, 1, 1), date(2026, 12, 31))
+
+    for user in (org.manager, org.admin):
+        api_client.force_authenticate(user)
+        response = api_client.get(f"{URL}?{query}&per_page=100")
+        rows = response.data["data"]
+        if user is org.admin:
+            # Admins see every company; the bound still covers "Elsewhere".
+            assert ("Elsewhere" in {r["name"] for r in rows}) == ("Decade" in expected)
+        names = {r["name"] for r in rows if r["company"] == org.company.pk}
+        assert {n.replace("Project ", "P") for n in names} == expected
+
+
+@pytest.mark.django_db
+def test_invalid_window_is_rejected(make_org, api_client):
+    org = make_org()
+    api_client.force_authenticate(org.manager)
+    assert api_client.get(f"{URL}?active_between=2025-01-01").status_code == 400
+
+
+@pytest.mark.django_db
+def test_overallocation_report(make_org, api_client):
+    org, other = make_org(), make_org()
+    first, second = org.employees[:2]
+    # make_org books employees 0-2 on the same three 2025 projects.
+    for project in org.projects[1:]:
+        project.assigned_employees.remove(second, org.employees[2])
+    add_project(org, "Next year", date(2026, 1, 1), date(2026, 6, 30), [second])
+    api_client.force_authenticate(org.manager)
+
+    report = api_client.get(f"{URL}overallocation/").data["data"]
+
+    assert [row["employee"] for row in report] == [first.pk]
+    assert report[0]["peak_projects"] == 3
+    assert len(report[0]["conflicts"]) == 3
+
+    window = api_client.get(
+        f"{URL}overallocation/?active_between=2026-01-01,2026-12-31"
+    ).data["data"]
+    assert window == []
+    assert api_client.get(f"{URL}overallocation/?max_projects=3").data["data"] == []
+    assert api_client.get(f"{URL}overallocation/?max_projects=0").status_code == 400
+
+    api_client.force_authenticate(other.manager)
+    employees = {row["employee"] for row in api_client.get(f"{URL}overallocation/").data["data"]}
+    assert employees == {e.pk for e in other.employees}
+
+    api_client.force_authenticate(org.employee_user)
+    assert api_client.get(f"{URL}overallocation/").status_code == 403
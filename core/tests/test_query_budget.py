@@ -0,0 +1,64 @@
+import pytest
+
+# (role, method, path, payload, budget) -- budgets hold for a 25-row tenant,
+# so anything that scales with the page size blows through them.
+BUDGETS = [
+    ("admin", "get", "/core/api/companies/", None, 2),
+    ("admin", "get", "/core/api/companies/{company}/", None, 1),
+    ("admin", "get", "/core/api/departments/", None, 2),
+    ("admin", "get", "/core/api/departments/{department}/", None, 1),
+    ("admin", "get", "/core/api/employees/", None, 2),
+    ("admin", "get", "/core/api/employees/?cursor=", None, 2),
+    ("admin", "get", "/core/api/employees/{employee}/", None, 1),
+    ("employee_user", "get", "/core/api/employees/me/", None, 1),
+    ("admin", "get", "/core/api/projects/", None, 3),
+    ("admin", "get", "/core/api/projects/?cursor=", None, 3),
+    ("admin", "get", "/core/api/projects/{project}/", None, 2),
+    ("manager", "get", "/core/api/projects/", None, 3),
+    ("employee_user", "get", "/core/api/projects/", None, 3),
+    (
+        "manager",
+        "post",
+        "/core/api/employees/",
+        {"name": "New", "email": "new@corp.com", "mobile": "1", "designation": "Dev"},
+        8,
+    ),
+    ("manager", "patch", "/core/api/employees/{employee}/", {"name": "Renamed"}, 6),
+    ("manager", "delete", "/core/api/employees/{employee}/", None, 7),
+    (
+        "manager",
+        "post",
+        "/core/api/projects/",
+        {"name": "New", "start_date": "2025-01-01", "end_date": "2025-02-01"},
+        14,
+    ),
+    ("manager", "patch", "/core/api/projects/{project}/", {"name": "Renamed"}, 5),
+    ("manager", "delete", "/core/api/projects/{project}/", None, 6),
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("role,method,path,payload,budget", BUDGETS)
+def test_core_query_budget(
+    make_org, api_client, assert_query_budget, role, method, path, payload, budget
+):
+    org = make_org(25)
+    ids = {
+        "company": org.company.pk,
+        "department": org.department.pk,
+        "employee": org.employees[-1].pk,
+        "project": org.projects[-1].pk,
+    }
+    if payload and method == "post":
+        payload = {
+            "company": org.company.pk,
+            "department": org.department.pk,
+            **payload,
+        }
+        if "start_date" in payload:
+            payload["assigned_employees"] = [e.pk for e in org.employees[:2]]
+
+    api_client.force_authenticate(getattr(org, role))
+    assert_query_budget(
+        api_client, method, path.format(**ids), budget, data=payload, format="json"
+    )
@@ -0,0 +1,77 @@
+import uuid
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+
+from config.renderers import FastJSONRenderer
+from config.response import CustomResponse
+
+
+def test_fast_renderer_matches_drf_byte_for_byte():
+    payload = {
+        "status_code": 200,
+        "data": [
+            {
+                "id": 1,
+                "name": "Zoë \u2028 \u03a9",
+                "hired_on": date(2024, 1, 2),
+                "created_at": datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+                "salary": Decimal("12.50"),
+                "token": uuid.UUID(int=7),
+                "label": gettext_lazy("Success"),
+                "error": ErrorDetail("bad", code="invalid"),
+                "nested": {1: None, "ok": True, "ratio": 0.25},
+                "tags": ("a", "b"),
+            }
+        ],
+        "message": "Success",
+    }
+
+    assert FastJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+
+def test_indented_requests_use_the_stock_renderer():
+    rendered = FastJSONRenderer().render({"a": 1}, "application/json; indent=2")
+    assert rendered == b'{\n  "a": 1\n}'
+
+
+@pytest.mark.parametrize(
+    "data,message",
+    [
+        ({"detail": "Not found."}, "Not found."),
+        ({"email": ["Taken."], "non_field_errors": ["Bad pair."]}, "Bad pair."),
+        ({"email": ["Taken."], "name": ["Required."]}, "Taken."),
+        ({"count": 3}, "3"),
+        ([{"ids": ["Unknown id."]}], "Unknown id."),
+        ([{"details": ["Row 2."]}], "Row 2."),
+        (["Plain."], "Plain."),
+        ("Boom", "Boom"),
+    ],
+)
+def test_error_message_extraction(data, message):
+    response = CustomResponse(data, status=400)
+    assert response.data == {"status_code": 400, "data": {}, "message": message}
+
+
+def test_success_response_keeps_data_and_default_message():
+    response = CustomResponse({"detail": "kept"}, status=200, pagination={"page": 1})
+    assert response.data == {
+        "status_code": 200,
+        "data": {"detail": "kept"},
+        "message": "Success",
+        "pagination": {"page": 1},
+    }
+
+
+@pytest.mark.django_db
+def test_api_responses_render_through_orjson(make_org, api_client):
+    org = make_org()
+    api_client.force_authenticate(user=org.manager)
+    response = api_client.get("/core/api/employees/?per_page=2")
+
+    assert response["Content-Type"] == "application/json"
+    assert response.content == JSONRenderer().render(response.data)
@@ -0,0 +1,60 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from config.cache import cache_stats
+
+
+@pytest.mark.django_db
+def test_second_read_is_served_from_cache(make_org, api_client):
+    org = make_org()
+    api_client.force_authenticate(user=org.manager)
+
+    first = api_client.get("/core/api/projects/?ordering=name")
+    with CaptureQueriesContext(connection) as ctx:
+        second = api_client.get("/core/api/projects/?ordering=name")
+
+    assert (first["X-Cache"], second["X-Cache"]) == ("MISS", "HIT")
+    assert second.data == first.data
+    assert len(ctx.captured_queries) == 0
+    assert cache_stats(["project"])["project"] == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+@pytest.mark.django_db
+def test_writes_invalidate_the_company(make_org, api_client):
+    org = make_org()
+    other = make_org()
+    api_client.force_authenticate(user=org.manager)
+    url = f"/core/api/projects/{org.projects[0].id}/"
+    api_client.get(url)
+    api_client.get("/core/api/departments/")
+
+    # A write in another company leaves this company's entries alone.
+    other.projects[0].name = "Elsewhere"
+    other.projects[0].save()
+    assert api_client.get(url)["X-Cache"] == "HIT"
+
+    org.projects[0].assigned_employees.remove(org.employees[0])
+    response = api_client.get(url)
+    assert response["X-Cache"] == "MISS"
+    assert org.employees[0].id not in response.data["data"]["assigned_employees"]
+
+    api_client.patch(f"/core/api/employees/{org.employees[1].id}/", {"name": "X"})
+    departments = api_client.get("/core/api/departments/")
+    assert departments["X-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_entries_are_not_shared_across_scopes(make_org, api_client):
+    org = make_org()
+    other = make_org()
+
+    api_client.force_authenticate(user=org.manager)
+    mine = api_client.get("/core/api/employees/")
+    api_client.force_authenticate(user=other.manager)
+    theirs = api_client.get("/core/api/employees/")
+    api_client.force_authenticate(user=org.employee_user)
+    own = api_client.get("/core/api/employees/")
+
+    assert theirs["X-Cache"] == own["X-Cache"] == "MISS"
+    assert {r["id"] for r in mine.data["data"]} != {r["id"] for r in theirs.data["data"]}
+    assert [r["id"] for r in own.data["data"]] == [org.employees[0].id]
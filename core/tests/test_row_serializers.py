@@ -0,0 +1,95 @@
+from datetime import date
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+
+from config.rows import RowSerializer
+from core.models import Employee, Project
+from core.serializers import (
+    EmployeeRowSerializer,
+    EmployeeSerializer,
+    ProjectRowSerializer,
+    ProjectSerializer,
+)
+
+
+@pytest.mark.django_db
+def test_employee_rows_match_model_serializer(make_org):
+    org = make_org()
+    Employee.objects.create(
+        company=org.company, department=org.department, name="No Date", hired_on=None
+    )
+    queryset = Employee.objects.order_by("id")
+
+    rows = EmployeeRowSerializer()
+    data = rows.serialize(rows.values(queryset))
+
+    assert data == EmployeeSerializer(queryset, many=True).data
+    assert [list(item) for item in data] == [
+        list(EmployeeSerializer.Meta.fields) for _ in data
+    ]
+    assert data[-1]["days_employed"] is None
+
+
+@pytest.mark.django_db
+def test_project_rows_match_model_serializer(make_org):
+    org = make_org()
+    empty = Project.objects.create(
+        company=org.company,
+        department=org.department,
+        name="Unstaffed",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 6, 30),
+    )
+    org.projects[0].assigned_employees.set(reversed(org.employees))
+    queryset = Project.objects.order_by("id")
+
+    rows = ProjectRowSerializer()
+    data = rows.serialize(rows.values(queryset))
+
+    assert data == ProjectSerializer(queryset, many=True).data
+    assert data[0]["assigned_employees"] == sorted(e.id for e in org.employees)
+    assert data[-1]["id"] == empty.id and data[-1]["assigned_employees"] == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url,model,serializer_class",
+    [
+        ("/core/api/employees/?per_page=2&ordering=-hired_on", Employee, EmployeeSerializer),
+        ("/core/api/employees/?search=employee&ordering=name", Employee, EmployeeSerializer),
+        ("/core/api/projects/?per_page=1&ordering=name", Project, ProjectSerializer),
+    ],
+)
+def test_list_pages_match_model_serializer(make_org, api_client, url, model, serializer_class):
+    org = make_org()
+    api_client.force_authenticate(user=org.manager)
+
+    seen, response = [], api_client.get(url + "&cursor=")
+    while True:
+        page = response.data["data"]
+        instances = model.objects.in_bulk([item["id"] for item in page])
+        assert page == serializer_class([instances[item["id"]] for item in page], many=True).data
+        seen.extend(item["id"] for item in page)
+        cursor = response.data["pagination"].get("next_cursor")
+        if not cursor:
+            break
+        response = api_client.get(f"{url}&cursor={cursor}")
+
+    assert len(seen) == len(set(seen)) > 1
+
+
+def test_unreadable_fields_are_rejected_at_compile_time():
+    class NestedSerializer(serializers.ModelSerializer):
+        company_name = serializers.CharField(source="company.name")
+
+        class Meta:
+            model = Employee
+            fields = ["id", "company_name"]
+
+    class NestedRows(RowSerializer):
+        serializer_class = NestedSerializer
+
+    with pytest.raises(ImproperlyConfigured):
+        NestedRows()
@@ -0,0 +1,95 @@
+import pytest
+from datetime import date
+from rest_framework.test import APIClient
+from core.models import Company, Department, Employee, Project
+from django.contrib.auth import get_user_model
+
+
+@pytest.fixture
+def setup():
+    company = Company.objects.create(name="Acme")
+    dept = Department.objects.create(company=company, name="IT")
+    people = {
+        name: Employee.objects.create(
+            company=company,
+            department=dept,
+            name=name,
+            email=email,
+            mobile="0100",
+            designation=designation,
+        )
+        for name, email, designation in [
+            ("Sara Ali", "sara@acme.com", "Backend Developer"),
+            ("Omar Sara", "omar@acme.com", "Designer"),
+            ("Mona Zaki", "mona@acme.com", "Developer"),
+        ]
+    }
+    Project.objects.create(
+        company=company,
+        department=dept,
+        name="Apollo",
+        description="Payments gateway rewrite",
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 6, 1),
+    )
+    admin = get_user_model().objects.create_user(
+        email="admin@test.com", password="pass", role="ADMIN", username="admin"
+    )
+    client = APIClient()
+    client.force_authenticate(user=admin)
+    return client, people
+
+
+def names(response):
+    assert response.status_code == 200, response.content
+    return [row["name"] for row in response.data["data"]]
+
+
+@pytest.mark.django_db
+def test_search_matches_prefixes_across_fields(setup):
+    client, _ = setup
+    assert set(names(client.get("/core/api/employees/?search=sar"))) == {
+        "Sara Ali",
+        "Omar Sara",
+    }
+    assert names(client.get("/core/api/employees/?search=mona@acme.com")) == ["Mona Zaki"]
+    assert names(client.get("/core/api/employees/?search=backend dev")) == ["Sara Ali"]
+    assert names(client.get("/core/api/projects/?search=payment")) == ["Apollo"]
+
+
+@pytest.mark.django_db
+def test_search_index_follows_update_and_delete(setup):
+    client, people = setup
+    mona = people["Mona Zaki"]
+    mona.name = "Mona Hassan"
+    mona.save()
+
+    assert names(client.get("/core/api/employees/?search=zaki")) == []
+    assert names(client.get("/core/api/employees/?search=hassan")) == ["Mona Hassan"]
+
+    mona.delete()
+    assert names(client.get("/core/api/employees/?search=hassan")) == []
+
+
+@pytest.mark.django_db
+def test_search_ranks_unless_ordering_is_given(setup):
+    client, _ = setup
+    # The shorter designation is the closer match, although it was created later.
+    assert names(client.get("/core/api/employees/?search=developer")) == [
+        "Mona Zaki",
+        "Sara Ali",
+    ]
+    assert names(client.get("/core/api/employees/?search=developer&ordering=-name")) == [
+        "Sara Ali",
+        "Mona Zaki",
+    ]
+    # Relevance cannot be encoded in a cursor: ask for an explicit ordering
+    # instead of silently paging in id order.
+    assert client.get("/core/api/employees/?search=sara&cursor=").status_code == 400
+    first = client.get("/core/api/employees/?search=developer&ordering=name&cursor=&per_page=1")
+    assert names(first) == ["Mona Zaki"]
+    cursor = first.data["pagination"]["next_cursor"]
+    second = client.get(
+        f"/core/api/employees/?search=developer&ordering=name&cursor={cursor}&per_page=1"
+    )
+    assert names(second) == ["Sara Ali"]
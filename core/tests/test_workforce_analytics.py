@@ -0,0 +1,113 @@
+from datetime import date, timedelta
+
+import pytest
+
+from core import analytics
+from core.analytics import bucket_counts, weighted_percentiles, workforce_stats
+from core.models import Department, Employee
+
+URL = "/core/api/employees/analytics/"
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_weighted_percentiles_use_nearest_rank(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(analytics, "np", None)
+    elif analytics.np is None:
+        pytest.skip("numpy is not installed")
+
+    # 10, 20, 20, 30, 30, 30, 30, 40, 40, 50
+    values, weights = [10, 20, 30, 40, 50], [1, 2, 4, 2, 1]
+    assert weighted_percentiles(values, weights, (0.1, 0.3, 0.5, 0.9, 1.0)) == [
+        10, 20, 30, 40, 50
+    ]
+    assert weighted_percentiles([], [], (0.5,)) == [None]
+
+
+def test_bucket_counts_split_on_upper_bounds():
+    assert bucket_counts([10, 365, 800, 4000], [1, 2, 3, 4], [365, 730, 1825, None]) == [
+        1, 2, 3, 4
+    ]
+
+
+@pytest.mark.django_db
+def test_workforce_stats(make_org):
+    org = make_org()
+    today = date(2025, 1, 1)
+    sales = Department.objects.create(company=org.company, name="Sales")
+    for n, (days, designation) in enumerate(
+        [(100, "Rep"), (500, "Rep"), (3000, "Lead"), (None, "Rep")]
+    ):
+        Employee.objects.create(
+            company=org.company,
+            department=sales,
+            name=f"Seller {n}",
+            email=f"seller{n}@corp.com",
+            designation=designation,
+            hired_on=today - timedelta(days=days) if days is not None else None,
+        )
+    make_org()  # another tenant, excluded by the queryset below
+
+    stats = workforce_stats(Employee.objects.filter(company=org.company), today)
+
+    it_days = (today - date(2024, 1, 1)).days
+    assert stats["employees"] == 7
+    assert stats["headcount_by_department"] == [
+        {"department": org.department.pk, "name": "IT", "employees": 3},
+        {"department": sales.pk, "name": "Sales", "employees": 4},
+    ]
+    assert stats["designations"] == [
+        {"designation": "Dev", "employees": 3},
+        {"designation": "Rep", "employees": 3},
+        {"designation": "Lead", "employees": 1},
+    ]
+    tenure = stats["tenure"]
+    assert (tenure["known"], tenure["unknown"]) == (6, 1)
+    assert tenure["percentiles_days"] == {"p50": it_days, "p90": 3000, "p95": 3000}
+    assert tenure["mean_days"] == round((100 + 500 + 3000 + 3 * it_days) / 6, 1)
+    assert [b["employees"] for b in tenure["buckets"]] == [1, 4, 0, 1]
+    # make_org assigns its three employees to each of its three projects.
+    assert stats["project_load"] == {
+        "mean": round(9 / 7, 2),
+        "max": 3,
+        "distribution": [
+            {"projects": 0, "employees": 4},
+            {"projects": 3, "employees": 3},
+        ],
+    }
+
+
+@pytest.mark.django_db
+def test_analytics_endpoint_follows_list_scoping(make_org, api_client):
+    org, other = make_org(), make_org()
+
+    api_client.force_authenticate(org.manager)
+    response = api_client.get(URL)
+    assert response.status_code == 200
+    assert response.data["data"]["employees"] == 3
+
+    filtered = api_client.get(URL, {"search": "Employee 1"})
+    assert filtered.data["data"]["employees"] == 1
+
+    api_client.force_authenticate(org.employee_user)
+    assert api_client.get(URL).data["data"]["employees"] == 1
+
+    api_client.force_authenticate(other.admin)
+    assert api_client.get(URL).data["data"]["employees"] == 6
+
+
+@pytest.mark.django_db
+def test_empty_scope_returns_empty_stats(make_org, api_client):
+    org = make_org()
+    assert workforce_stats(Employee.objects.none())["project_load"] == {
+        "mean": None,
+        "max": None,
+        "distribution": [],
+    }
+
+    org.manager.company = None
+    org.manager.save()
+    api_client.force_authenticate(org.manager)
+    response = api_client.get(URL)
+    assert response.status_code == 200
+    assert response.data["data"]["employees"] == 0
@@ -0,0 +1,113 @@
+# core/timeline.py
+"""
+Project date ranges: overlap queries and staffing conflicts.
+
+A project ``[start_date, end_date]`` overlaps the window ``[begin, end]``
+when ``start_date <= end`` and ``end_date >= begin``. On its own that
+predicate walks every project that started before ``end``. Each company
+keeps an upper bound on its projects' length (``max_project_days``), so an
+overlapping project must also start on or after ``begin - bound``; the
+query becomes one range scan of the ``(company, start_date, id)`` index,
+O(log n + k) for the k projects starting inside the widened window.
+"""
+from datetime import date, timedelta
+from heapq import heappop, heappush
+from itertools import groupby
+from operator import itemgetter
+
+from django.db import transaction
+from django.db.models import F, Max
+
+from .models import Company, Project
+
+
+def span_bound(company_id=None):
+    """``max_project_days`` of ``company_id``, or the largest of any company."""
+    companies = Company.objects.all()
+    if company_id is not None:
+        companies = companies.filter(pk=company_id)
+    return companies.aggregate(bound=Max("max_project_days"))["bound"] or 0
+
+
+def overlapping(queryset, begin, end, bound):
+    """Projects in ``queryset`` active on any day of ``[begin, end]``."""
+    # Clamped: for windows near date.min the subtraction would overflow.
+    earliest = begin - timedelta(days=min(bound, (begin - date.min).days))
+    return queryset.filter(
+        start_date__gte=earliest,
+        start_date__lte=end,
+        end_date__gte=begin,
+    )
+
+
+def widen_span_bound(company_id, days):
+    """Raise the company's ``max_project_days`` to ``days`` if it is lower."""
+    Company.objects.filter(pk=company_id, max_project_days__lt=days).update(
+        max_project_days=days
+    )
+
+
+def longest_projects():
+    """``{company id: longest project in days}`` from the projects table."""
+    rows = (
+        Project.objects.order_by()
+        .values("company_id")
+        .annotate(longest=Max(F("end_date") - F("start_date")))
+    )
+    return {row["company_id"]: max(row["longest"].days, 0) for row in rows}
+
+
+def tighten_span_bounds():
+    """
+    Reset every company's ``max_project_days`` to its longest project.
+
+    The company rows are locked first: a project saved meanwhile either
+    committed before ``longest_projects()`` reads it, or its
+    ``widen_span_bound`` waits for the lock and widens the bound again
+    afterwards. Either way the bound never ends up below a project.
+    """
+    with transaction.atomic():
+        list(Company.objects.select_for_update().order_by("pk").values_list("pk"))
+        longest = longest_projects()
+        Company.objects.exclude(pk__in=longest).update(max_project_days=0)
+        for company_id, days in longest.items():
+            Company.objects.filter(pk=company_id).update(max_project_days=days)
+
+
+def overallocations(assignments, max_projects=1):
+    """
+    Sweep each employee's assignments in start order and report everyone
+    on more than ``max_projects`` projects on some day.
+
+    ``assignments`` yields ``(employee id, employee name, project id, start,
+    end)`` ordered by employee, then start date. A heap of the end dates of
+    the projects still running gives the concurrency at each start, and
+    every project in it overlaps the one starting: O(m log m) for m
+    assignments plus one entry per conflicting pair.
+    """
+    report = []
+    for (employee_id, name), rows in groupby(assignments, key=itemgetter(0, 1)):
+        running, peak, conflicts = [], 0, []
+        for _, _, project_id, start, end in rows:
+            while running and running[0][0] < start:
+                heappop(running)
+            for other_end, other_id in running:
+                conflicts.append(
+                    {
+                        "projects": [other_id, project_id],
+                        "from": start,
+                        "to": min(end, other_end),
+                    }
+                )
+            heappush(running, (end, project_id))
+            peak = max(peak, len(running))
+        if peak > max_projects:
+            report.append(
+                {
+                    "employee": employee_id,
+                    "name": name,
+                    "peak_projects": peak,
+                    "conflicts": conflicts,
+                }
+            )
+    return report
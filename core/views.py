@@ -1,20 +1,46 @@
 # core/views.py
-from rest_framework import viewsets, mixins, permissions, filters
+from rest_framework import viewsets, mixins, filters
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count
+from django.db.models import Prefetch
 from .models import Company, Department, Employee, Project
 from .serializers import (
     CompanySerializer,
     DepartmentSerializer,
+    EmployeeRowSerializer,
     EmployeeSerializer,
+    ProjectRowSerializer,
     ProjectSerializer,
 )
+from accounts.permissions import ScopedPermission
+from accounts.scope import get_scope
+from config.cache import cache_response
+from config.conditional import conditional_response, not_modified, set_validators
+from config.export import ExportMixin
 from config.response import CustomResponse
-from config.pagination import CustomPagination
+from config.pagination import CustomPagination, KeysetPagination
+from .analytics import workforce_stats
+from .assignments import (
+    AssignmentError,
+    assign_employees,
+    parse_employee_ids,
+    unassign_employees,
+)
+from .filters import ProjectFilter
+from .importers import EmployeeImporter, ImportFormatError, iter_rows, upload_type
+from .search import FullTextSearchFilter, RankedOrderingFilter
+from .snapshot import company_snapshot, snapshot_etag, snapshot_key
+from .timeline import overallocations
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import HttpResponse
+from jobs.queue import enqueue
+from uuid import uuid4
 from rest_framework.decorators import action
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.generics import get_object_or_404
+from rest_framework.parsers import FormParser, MultiPartParser
 
-class BaseRBACPermission(permissions.IsAuthenticated):
+class BaseRBACPermission(ScopedPermission):
     # can extend for create/update/delete checks per role
     pass
 
@@ -28,24 +54,49 @@ class CompanyViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = CustomPagination
     ordering = ["created_at"]
 
+    scope_company_attr = "id"
+
     def get_queryset(self):
-        qs = Company.objects.annotate(
-            departments_count=Count("departments", distinct=True),
-            employees_count=Count("employees", distinct=True),
-            projects_count=Count("projects", distinct=True),
+        return get_scope(self.request).filter(Company.objects.all(), "id")
+
+    @action(detail=True, methods=["get"])
+    def snapshot(self, request, pk=None):
+        """
+        Company -> departments -> employees/projects in one response, served
+        from a per-company cache that any write under the company invalidates.
+        """
+        scope = get_scope(request)
+        if scope.is_employee:
+            raise PermissionDenied("Employees cannot view the company snapshot.")
+        try:
+            company_id = int(pk)
+        except ValueError:
+            raise NotFound()
+        if not scope.can_access(company_id):
+            raise NotFound()
+
+        key = snapshot_key(company_id)
+        etag = snapshot_etag(key)
+        response = not_modified(request, etag, None)
+        if response is not None:
+            return response
+
+        blob = company_snapshot(company_id, key)
+        if blob is None:
+            raise NotFound()
+        return set_validators(
+            HttpResponse(blob, content_type="application/json"), etag, None
         )
-        user = self.request.user
-        if user.role == "ADMIN":
-            return qs
-        if user.company_id:
-            return qs.filter(id=user.company_id)
-        return qs.none()
 
+    @cache_response
+    @conditional_response
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
         return CustomResponse(data=serializer.data, status=200)
 
+    @cache_response
+    @conditional_response
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
@@ -81,22 +132,17 @@ class DepartmentViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ["created_at"]
 
     def get_queryset(self):
-        qs = Department.objects.annotate(
-            employees_count=Count("employees", distinct=True),
-            projects_count=Count("projects", distinct=True),
-        )
-        user = self.request.user
-        if user.role == "ADMIN":
-            return qs
-        if user.company_id:
-            return qs.filter(company_id=user.company_id)
-        return qs.none()
+        return get_scope(self.request).filter(Department.objects.all())
 
+    @cache_response
+    @conditional_response
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
         return CustomResponse(data=serializer.data, status=200)
 
+    @cache_response
+    @conditional_response
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
@@ -116,128 +162,218 @@ class DepartmentViewSet(viewsets.ReadOnlyModelViewSet):
         return CustomResponse(data=serializer.data, status=200)
 
 
-class EmployeeViewSet(viewsets.ModelViewSet):
+class EmployeeViewSet(ExportMixin, viewsets.ModelViewSet):
     queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
+    # List pages are serialized from .values() rows (config/rows.py).
+    row_serializer_class = EmployeeRowSerializer
     permission_classes = [BaseRBACPermission]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
+        FullTextSearchFilter,
+        RankedOrderingFilter,
     ]
     filterset_fields = ["company", "department", "designation"]
     search_fields = ["name", "email", "mobile", "designation"]
     ordering_fields = ["name", "hired_on"]
     ordering = ["id"]
-    pagination_class = CustomPagination
+    pagination_class = KeysetPagination
+    # days_employed changes daily without touching updated_at.
+    conditional_daily = True
+
+    def get_queryset(self):
+        return get_scope(self.request).filter(super().get_queryset())
 
     @action(detail=False, methods=["get"])
     def me(self, request):
-        emp = Employee.objects.filter(user=request.user).first()
+        emp = Employee.objects.filter(user_id=request.user.pk).first()
         if not emp:
             return CustomResponse(data="No employee record found.", status=404)
         serializer = self.get_serializer(emp)
         return CustomResponse(serializer.data, status=200)
 
+    @action(detail=False, methods=["get"])
+    @cache_response
+    def analytics(self, request):
+        """
+        Headcount by department, designation mix, tenure distribution and
+        project load for the employees this user may list, after the list
+        filters (``?department=``, ``?designation=``, ``?search=`` ...).
+        """
+        queryset = self.filter_queryset(self.get_list_queryset())
+        return CustomResponse(data=workforce_stats(queryset), status=200)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser, FormParser],
+    )
+    def import_employees(self, request):
+        """
+        Bulk-create employees from a CSV or JSONL upload (``file``). Rows are
+        streamed and written in ``batch_size`` chunks; the response carries a
+        per-row error report. With ``background=true`` the upload is queued
+        instead and the response (202) carries the job id; the report ends up
+        in the job's ``result`` (``/jobs/api/jobs/<id>/``).
+        """
+        scope = get_scope(request)
+        if not (scope.is_admin or scope.is_manager):
+            raise PermissionDenied("Not allowed.")
+
+        upload = request.FILES.get("file")
+        if not upload:
+            return CustomResponse(
+                data={"file": "A CSV or JSONL file is required."}, status=400
+            )
+
+        try:
+            batch_size = int(request.data.get("batch_size") or 0) or None
+            if batch_size is not None and batch_size < 1:
+                raise ValueError(batch_size)
+        except ValueError:
+            return CustomResponse(
+                data={"batch_size": "A positive integer is required."}, status=400
+            )
+        if batch_size:
+            batch_size = min(batch_size, settings.EMPLOYEE_IMPORT_MAX_BATCH_SIZE)
+
+        if str(request.data.get("background", "")).lower() in ("1", "true", "yes"):
+            return self.queue_import(scope, upload, batch_size)
+
+        importer = EmployeeImporter(scope, batch_size=batch_size)
+        try:
+            report = importer.run(iter_rows(upload, request.data.get("file_type")))
+        except ImportFormatError as exc:
+            return CustomResponse(data={"file": str(exc)}, status=400)
+
+        message = f"Imported {report['created']} of {report['total_rows']} rows."
+        stopped = report["stopped"]
+        if stopped:
+            message += f" Stopped after row {stopped['after_row']}: {stopped['reason']}"
+        return CustomResponse(data=report, status=200, message=message)
+
+    def queue_import(self, scope, upload, batch_size):
+        try:
+            file_type = upload_type(upload, self.request.data.get("file_type"))
+        except ImportFormatError as exc:
+            return CustomResponse(data={"file": str(exc)}, status=400)
+
+        path = default_storage.save(
+            f"{settings.JOBS_UPLOAD_DIR}/{uuid4().hex}.{file_type}", upload
+        )
+        job = enqueue(
+            "core.import_employees",
+            {
+                "path": path,
+                "scope": [scope.role, scope.company_id, scope.user_id],
+                "file_type": file_type,
+                "batch_size": batch_size,
+            },
+            created_by_id=scope.user_id,
+            company_id=scope.company_id,
+        )
+        return CustomResponse(
+            data={"job": job.pk, "status": job.status},
+            status=202,
+            message="Import queued.",
+        )
+
     def perform_create(self, serializer):
-        user = self.request.user
-        if user.role not in ["ADMIN", "MANAGER"]:
+        scope = get_scope(self.request)
+        if not (scope.is_admin or scope.is_manager):
             raise PermissionDenied("Not allowed.")
 
-        if user.role == "MANAGER":
-            if serializer.validated_data.get("company") != user.company:
-                raise PermissionDenied(
-                    "Managers can only create employees in their company."
-                )
+        if scope.is_manager:
+            company = serializer.validated_data.get("company")
+            scope.check_company(
+                getattr(company, "id", None),
+                "Managers can only create employees in their company.",
+            )
         serializer.save()
 
     def perform_update(self, serializer):
-        user = self.request.user
-        instance = self.get_object()
+        scope = get_scope(self.request)
+        instance = serializer.instance
         validated_data = serializer.validated_data
 
+        def changes(field):
+            if field not in validated_data:
+                return False
+            new_value = validated_data[field]
+            return getattr(new_value, "pk", None) != getattr(instance, f"{field}_id")
+
         # Employee rules
-        if user.role == "EMPLOYEE":
-            if instance.user != user:
+        if scope.is_employee:
+            if instance.user_id != scope.user_id:
                 raise PermissionDenied("Employees can only update their own record.")
 
             # Check if restricted fields are being *changed*
-            restricted_fields = ["company", "department", "user"]
-            for field in restricted_fields:
-                if field in validated_data:
-                    new_value = validated_data[field]
-                    old_value = getattr(instance, field)
-                    if new_value != old_value:
-                        raise PermissionDenied(f"Employees cannot change {field}.")
+            for field in ["company", "department", "user"]:
+                if changes(field):
+                    raise PermissionDenied(f"Employees cannot change {field}.")
 
         # Manager rules
-        elif user.role == "MANAGER":
-            if instance.company != user.company:
-                raise PermissionDenied("Managers can only update employees in their company.")
+        elif scope.is_manager:
+            scope.check_company(
+                instance.company_id,
+                "Managers can only update employees in their company.",
+            )
 
-            if "company" in validated_data and validated_data["company"] != instance.company:
+            if changes("company"):
                 raise PermissionDenied("Managers cannot change an employee's company.")
 
-            if "department" in validated_data and validated_data["department"] != instance.department:
+            if changes("department"):
                 raise PermissionDenied("Managers cannot change an employee's department.")
 
-            if "user" in validated_data:
-                new_user = validated_data["user"]
-                if new_user.company != user.company:
-                    raise PermissionDenied(
-                        "Managers can only assign users from their own company."
-                    )
+            if validated_data.get("user") is not None:
+                scope.check_company(
+                    validated_data["user"].company_id,
+                    "Managers can only assign users from their own company.",
+                )
 
         # Admin → unrestricted
 
         serializer.save()
 
     def perform_destroy(self, instance):
-        user = self.request.user
-
-        # If user is EMPLOYEE
-        if user.role == "EMPLOYEE":
-            # Block deleting themselves
-            if instance.user == user:
-                raise PermissionDenied("Employees cannot delete themselves.")
-
-        if user.role == "MANAGER":
-            if instance.company != user.company:
-                raise PermissionDenied(
-                    "Managers can only delete employees in their own company."
-                )
+        scope = get_scope(self.request)
+
+        # Employees cannot delete themselves
+        if scope.is_employee and instance.user_id == scope.user_id:
+            raise PermissionDenied("Employees cannot delete themselves.")
+
+        if scope.is_manager:
+            scope.check_company(
+                instance.company_id,
+                "Managers can only delete employees in their own company.",
+            )
 
         # If passes checks → delete
         instance.delete()
 
+    def get_list_queryset(self):
+        return get_scope(self.request).filter_own(Employee.objects.all(), "user_id")
+
+    @cache_response
+    @conditional_response
     def list(self, request, *args, **kwargs):
-        user = request.user
-
-        # Role-based filtering
-        if user.role == "ADMIN":
-            queryset = Employee.objects.all()
-        elif user.role == "MANAGER" and user.company_id:
-            queryset = Employee.objects.filter(company_id=user.company_id)
-        elif user.role == "EMPLOYEE":
-            queryset = Employee.objects.filter(user=user)
-        else:
-            queryset = Employee.objects.none()
-
-        queryset = self.filter_queryset(queryset)
+        rows = self.row_serializer_class(self.get_serializer_context())
+        queryset = rows.values(self.filter_queryset(self.get_list_queryset()))
         page = self.paginate_queryset(queryset)
 
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
             pagination_data = self.paginator.get_pagination_meta()
             return CustomResponse(
-                data=serializer.data,
+                data=rows.serialize(page),
                 status=200,
                 pagination=pagination_data,
             )
 
-        serializer = self.get_serializer(queryset, many=True)
-        return CustomResponse(data=serializer.data, status=200)
+        return CustomResponse(data=rows.serialize(queryset), status=200)
 
+    @cache_response
+    @conditional_response
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
@@ -262,59 +398,59 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         )
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
-    queryset = Project.objects.all()
+class ProjectViewSet(ExportMixin, viewsets.ModelViewSet):
+    # assigned_employees only needs ids; one prefetch query per page.
+    queryset = Project.objects.prefetch_related(
+        Prefetch("assigned_employees", queryset=Employee.objects.only("id").order_by("id"))
+    )
     serializer_class = ProjectSerializer
+    row_serializer_class = ProjectRowSerializer
     permission_classes = [BaseRBACPermission]
-    pagination_class = CustomPagination
+    pagination_class = KeysetPagination
 
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
-    ]
-    filterset_fields = [
-        "company",
-        "department",
-        "start_date",
-        "end_date",
-        "assigned_employees",
+        FullTextSearchFilter,
+        RankedOrderingFilter,
     ]
+    # Exact-match fields plus active_between/active_on overlap filters.
+    filterset_class = ProjectFilter
     search_fields = ["name", "description"]
     ordering_fields = ["name", "start_date", "end_date"]
+    ordering = ["id"]
+
+    def get_queryset(self):
+        return get_scope(self.request).filter(super().get_queryset())
 
+    def get_list_queryset(self):
+        return self.get_queryset()
+
+    @cache_response
+    @conditional_response
     def list(self, request, *args, **kwargs):
-        user = request.user
-        # Role-based filtering
-        if user.role == "ADMIN":
-            queryset = Project.objects.all()
-        elif user.role in ["MANAGER", "EMPLOYEE"]:
-            queryset = Project.objects.filter(company_id=user.company_id)
-        else:  # no company
-            queryset = Project.objects.none()
-
-        queryset = self.filter_queryset(queryset)
+        rows = self.row_serializer_class(self.get_serializer_context())
+        queryset = rows.values(self.filter_queryset(self.get_list_queryset()))
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
             pagination_data = self.paginator.get_pagination_meta()
             return CustomResponse(
-                data=serializer.data,
+                data=rows.serialize(page),
                 status=200,
                 pagination=pagination_data,
             )
 
-        serializer = self.get_serializer(queryset, many=True)
-        return CustomResponse(data=serializer.data, status=200)
+        return CustomResponse(data=rows.serialize(queryset), status=200)
 
+    @cache_response
+    @conditional_response
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
         return CustomResponse(data=serializer.data, status=200)
 
     def create(self, request, *args, **kwargs):
-        user = request.user
-        if user.role not in ["ADMIN", "MANAGER"]:
+        scope = get_scope(request)
+        if not (scope.is_admin or scope.is_manager):
             raise PermissionDenied("You do not have permission to create projects.")
 
         serializer = self.get_serializer(
@@ -326,14 +462,16 @@ class ProjectViewSet(viewsets.ModelViewSet):
         return CustomResponse(data=serializer.data, status=201)
 
     def update(self, request, *args, **kwargs):
-        user = request.user
+        scope = get_scope(request)
         instance = self.get_object()
 
-        if user.role == "EMPLOYEE":
+        if scope.is_employee:
             raise PermissionDenied("Employees cannot update projects.")
 
-        if user.role == "MANAGER" and instance.company_id != user.company_id:
-            raise PermissionDenied("You cannot update projects from another company.")
+        if scope.is_manager:
+            scope.check_company(
+                instance.company_id, "You cannot update projects from another company."
+            )
 
         serializer = self.get_serializer(
             instance, data=request.data, partial=True, context={"request": request}
@@ -343,14 +481,83 @@ class ProjectViewSet(viewsets.ModelViewSet):
         return CustomResponse(data=serializer.data, status=200)
 
     def destroy(self, request, *args, **kwargs):
-        user = request.user
+        scope = get_scope(request)
         instance = self.get_object()
 
-        if user.role == "EMPLOYEE":
+        if scope.is_employee:
             raise PermissionDenied("Employees cannot delete projects.")
 
-        if user.role == "MANAGER" and instance.company_id != user.company_id:
-            raise PermissionDenied("You cannot delete projects from another company.")
+        if scope.is_manager:
+            scope.check_company(
+                instance.company_id, "You cannot delete projects from another company."
+            )
 
         instance.delete()
         return CustomResponse(message="Project deleted successfully", status=204)
+
+    @action(detail=False, methods=["get"])
+    def overallocation(self, request):
+        """
+        Employees on more than ``max_projects`` (default 1) projects at once,
+        with each overlapping pair. Only the projects the list would return
+        are considered, so ``?active_between=`` and the other list filters
+        narrow the report.
+        """
+        scope = get_scope(request)
+        if not (scope.is_admin or scope.is_manager):
+            raise PermissionDenied("Only admins and managers can view staffing conflicts.")
+
+        value = request.query_params.get("max_projects", "1")
+        if not value.isdigit() or int(value) < 1:
+            return CustomResponse(
+                data={"max_projects": "A positive integer is required."}, status=400
+            )
+
+        projects = self.filter_queryset(self.get_list_queryset()).order_by().values("id")
+        assignments = (
+            Project.assigned_employees.through.objects.filter(project_id__in=projects)
+            .order_by("employee_id", "project__start_date", "project_id")
+            .values_list(
+                "employee_id",
+                "employee__name",
+                "project_id",
+                "project__start_date",
+                "project__end_date",
+            )
+        )
+        report = overallocations(assignments.iterator(), int(value))
+        return CustomResponse(data=report, status=200)
+
+    def get_assignment_project(self):
+        scope = get_scope(self.request)
+        if scope.is_employee:
+            raise PermissionDenied("Employees cannot change project assignments.")
+
+        # Only the company is needed; skip the assigned_employees prefetch.
+        queryset = scope.filter(Project.objects.only("id", "company_id"))
+        project = get_object_or_404(queryset, pk=self.kwargs["pk"])
+        self.check_object_permissions(self.request, project)
+        return project
+
+    def change_assignments(self, request, change, verb):
+        project = self.get_assignment_project()
+        try:
+            ids = parse_employee_ids(request.data.get("employees"))
+            changed = change(project, ids)
+        except AssignmentError as exc:
+            return CustomResponse(data={"employees": str(exc)}, status=400)
+        return CustomResponse(
+            data={"project": project.pk, verb: changed},
+            status=200,
+            message=f"{len(changed)} of {len(ids)} employees {verb}.",
+        )
+
+    @action(detail=True, methods=["post"])
+    def assign(self, request, pk=None):
+        """Add ``employees`` (a list of ids) to the project."""
+        return self.change_assignments(request, assign_employees, "assigned")
+
+    @action(detail=True, methods=["post"])
+    def unassign(self, request, pk=None):
+        """Remove ``employees`` (a list of ids) from the project."""
+        return self.change_assignments(request, unassign_employees, "unassigned")
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'jobs'
+
+    def ready(self):
+        # Registers every app's @task functions (<app>/tasks.py).
+        from django.utils.module_loading import autodiscover_modules
+
+        autodiscover_modules("tasks")
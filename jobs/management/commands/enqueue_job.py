@@ -0,0 +1,36 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.queue import TASKS, enqueue
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue a registered task, e.g. from cron: "
+        "`manage.py enqueue_job accounts.prune_tokens`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("task", help="Registered task name.")
+        parser.add_argument(
+            "--payload", default="{}", help="Keyword arguments for the task, as JSON."
+        )
+        parser.add_argument(
+            "--delay", type=int, default=0, help="Seconds before the job is due."
+        )
+
+    def handle(self, *args, **options):
+        if options["task"] not in TASKS:
+            raise CommandError(
+                f"Unknown task {options['task']!r}; registered: {', '.join(sorted(TASKS))}."
+            )
+        try:
+            payload = json.loads(options["payload"])
+        except ValueError as exc:
+            raise CommandError(f"--payload is not valid JSON: {exc}")
+        if not isinstance(payload, dict):
+            raise CommandError("--payload must be a JSON object.")
+
+        job = enqueue(options["task"], payload, delay=options["delay"])
+        self.stdout.write(self.style.SUCCESS(f"Queued {job}."))
@@ -0,0 +1,45 @@
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs on a local process pool. Stops after the "
+        "running jobs finish on SIGINT/SIGTERM."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=settings.JOBS_WORKER_PROCESSES,
+            help="Pool size; 0 runs jobs in this process.",
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=settings.JOBS_POLL_SECONDS,
+            help="Seconds to wait between polls when the queue is empty.",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no job is due instead of waiting for more.",
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            processes=options["processes"],
+            poll=options["poll"],
+            log=self.stdout.write,
+        )
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, worker.stop)
+
+        self.stdout.write(f"Worker {worker.id} started ({worker.processes} processes).")
+        processed = worker.run(burst=options["burst"])
+        self.stdout.write(self.style.SUCCESS(f"Worker stopped after {processed} jobs."))
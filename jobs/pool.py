@@ -0,0 +1,34 @@
+# jobs/pool.py
+"""
+Entry points for the worker's pool processes. They are spawned fresh and
+unpickle these functions before Django is set up, so this module must not
+import models at import time.
+"""
+
+
+def setup_process():
+    import signal
+
+    import django
+
+    # Ctrl-C reaches the whole process group; the parent stops taking jobs
+    # and lets the ones in flight finish.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    django.setup()
+
+
+def execute(job_id, token):
+    """Run one claimed job; returns its new status, or None if it was lost."""
+    from django.db import close_old_connections
+
+    from .models import Job
+    from .queue import run_job
+
+    close_old_connections()
+    try:
+        job = Job.objects.filter(
+            pk=job_id, claimed_by=token, status=Job.Status.RUNNING
+        ).first()
+        return run_job(job) if job else None
+    finally:
+        close_old_connections()
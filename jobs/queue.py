@@ -0,0 +1,177 @@
+# jobs/queue.py
+"""
+A small job queue on the project's own database.
+
+Tasks are plain functions registered with ``@task`` in an app's
+``tasks.py``. ``enqueue()`` writes a Job row, inside the caller's
+transaction when there is one, so a job never runs for work that rolled
+back. ``manage.py run_jobs`` claims due rows and runs them; a failing job
+is retried with exponential backoff until ``max_attempts`` is used up.
+"""
+import logging
+import random
+from datetime import timedelta
+from typing import Callable, NamedTuple
+from uuid import uuid4
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger("jobs")
+
+Status = Job.Status
+
+
+class Task(NamedTuple):
+    func: Callable
+    max_attempts: int
+
+
+TASKS = {}
+
+
+def task(name, max_attempts=None):
+    """
+    Register ``func(**payload)`` as ``name``. Its return value, which must
+    be JSON-serializable, is stored as the job's result.
+    """
+
+    def register(func):
+        TASKS[name] = Task(func, max_attempts or settings.JOBS_MAX_ATTEMPTS)
+        return func
+
+    return register
+
+
+def enqueue(name, payload=None, *, created_by_id=None, company_id=None, delay=0):
+    """
+    Queue a call of the registered task ``name``; returns the Job. The owner
+    is passed by id (``scope.user_id``): under claims tokens the request user
+    is not a User instance.
+    """
+    if name not in TASKS:
+        raise KeyError(f"Unknown task {name!r}.")
+    return Job.objects.create(
+        task=name,
+        payload=payload or {},
+        max_attempts=TASKS[name].max_attempts,
+        run_after=timezone.now() + timedelta(seconds=delay),
+        created_by_id=created_by_id,
+        company_id=company_id,
+    )
+
+
+def claim(worker_id, limit=1):
+    """
+    Mark up to ``limit`` due jobs as running for this worker and return
+    them. The UPDATE only takes rows that are still QUEUED, so two workers
+    racing for a job cannot both get it, on SQLite or Postgres alike.
+    """
+    now = timezone.now()
+    due = list(
+        Job.objects.filter(status=Status.QUEUED, run_after__lte=now)
+        .order_by("run_after", "id")
+        .values_list("id", flat=True)[:limit]
+    )
+    if not due:
+        return []
+    token = f"{worker_id}:{uuid4().hex}"
+    claimed = Job.objects.filter(pk__in=due, status=Status.QUEUED).update(
+        status=Status.RUNNING,
+        claimed_by=token,
+        claimed_at=now,
+        attempts=F("attempts") + 1,
+        updated_at=now,
+    )
+    if not claimed:
+        return []
+    return list(Job.objects.filter(claimed_by=token, status=Status.RUNNING).order_by("id"))
+
+
+def backoff(attempt):
+    """Seconds before retry ``attempt`` + 1: doubling, capped, with jitter."""
+    base = settings.JOBS_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+    return min(base, settings.JOBS_RETRY_BACKOFF_MAX_SECONDS) * random.uniform(1, 1.2)
+
+
+def finish(job, **values):
+    # Scoped to our claim: if the job was requeued as stale and claimed
+    # again, the late outcome of this run is dropped.
+    now = timezone.now()
+    return Job.objects.filter(pk=job.pk, claimed_by=job.claimed_by).update(
+        updated_at=now, **values
+    )
+
+
+def fail(job, error, retry=True):
+    """Requeue ``job`` with backoff, or fail it on its last attempt."""
+    if retry and job.attempts < job.max_attempts:
+        delay = backoff(job.attempts)
+        logger.warning("Job %s (%s) failed, retrying in %.0fs: %s", job.pk, job.task, delay, error)
+        finish(
+            job,
+            status=Status.QUEUED,
+            claimed_by="",
+            run_after=timezone.now() + timedelta(seconds=delay),
+            error=error,
+        )
+        return Status.QUEUED
+    # Called from an except block, so the traceback is logged too.
+    logger.exception("Job %s (%s) failed for good: %s", job.pk, job.task, error)
+    finish(job, status=Status.FAILED, error=error, finished_at=timezone.now())
+    return Status.FAILED
+
+
+def release(token, error):
+    """
+    Record a run that ended without an outcome (the pool process died, or
+    saving the outcome failed) as a failed attempt. Returns the new status,
+    or None when the job is no longer ours.
+    """
+    job = Job.objects.filter(claimed_by=token, status=Status.RUNNING).first()
+    return fail(job, error) if job else None
+
+
+def run_job(job):
+    """Run a claimed job and record its outcome; returns the new status."""
+    registered = TASKS.get(job.task)
+    try:
+        if registered is None:
+            raise LookupError(f"Unknown task {job.task!r}.")
+        result = registered.func(**job.payload)
+    except Exception as exc:
+        return fail(job, f"{type(exc).__name__}: {exc}", retry=registered is not None)
+
+    finish(
+        job,
+        status=Status.SUCCEEDED,
+        result=result,
+        error="",
+        finished_at=timezone.now(),
+    )
+    return Status.SUCCEEDED
+
+
+def requeue_stale(seconds=None):
+    """
+    Hand jobs whose worker died mid-run back to the queue, or fail them when
+    that was their last attempt. Returns ``(requeued, failed)``.
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(
+        status=Status.RUNNING,
+        claimed_at__lt=now - timedelta(seconds=seconds or settings.JOBS_STALE_SECONDS),
+    )
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=Status.FAILED,
+        error="Worker stopped before the job finished.",
+        finished_at=now,
+        updated_at=now,
+    )
+    requeued = stale.update(
+        status=Status.QUEUED, claimed_by="", run_after=now, updated_at=now
+    )
+    return requeued, failed
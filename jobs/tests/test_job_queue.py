@@ -0,0 +1,257 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import OperationalError
+from django.utils import timezone
+
+from core.models import Employee
+from jobs import queue, worker
+from jobs.models import Job
+from jobs.queue import claim, enqueue, requeue_stale, run_job, task
+from jobs.pool import execute
+from jobs.worker import Worker
+from reviews.models import EmployeeReview
+
+URL = "/jobs/api/jobs/"
+calls = []
+
+
+@task("tests.record")
+def record(value):
+    calls.append(value)
+    return {"value": value}
+
+
+@task("tests.flaky", max_attempts=3)
+def flaky(failures):
+    calls.append("flaky")
+    if len(calls) <= failures:
+        raise RuntimeError("boom")
+    return "ok"
+
+
+@pytest.fixture(autouse=True)
+def reset_calls(settings):
+    settings.JOBS_RETRY_BACKOFF_SECONDS = 10
+    calls.clear()
+
+
+def make_due(job):
+    Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+
+
+@pytest.mark.django_db
+def test_worker_runs_due_jobs_in_order():
+    first = enqueue("tests.record", {"value": 1})
+    later = enqueue("tests.record", {"value": 3}, delay=60)
+    enqueue("tests.record", {"value": 2})
+
+    assert Worker(processes=0).run(burst=True) == 2
+    assert calls == [1, 2]
+
+    first.refresh_from_db()
+    assert (first.status, first.attempts, first.result) == (Job.Status.SUCCEEDED, 1, {"value": 1})
+    assert first.finished_at is not None
+    assert Job.objects.get(pk=later.pk).status == Job.Status.QUEUED
+
+    with pytest.raises(KeyError):
+        enqueue("tests.missing")
+
+
+@pytest.mark.django_db
+def test_failed_jobs_back_off_then_fail(monkeypatch):
+    monkeypatch.setattr(queue.random, "uniform", lambda a, b: 1)
+    job = enqueue("tests.flaky", {"failures": 5})
+
+    before = timezone.now()
+    assert Worker(processes=0).run(burst=True) == 1
+    job.refresh_from_db()
+    assert (job.status, job.attempts, job.error) == (Job.Status.QUEUED, 1, "RuntimeError: boom")
+    assert timedelta(seconds=10) <= job.run_after - before < timedelta(seconds=11)
+
+    make_due(job)
+    Worker(processes=0).run(burst=True)
+    job.refresh_from_db()
+    assert job.run_after - timezone.now() > timedelta(seconds=19)
+
+    make_due(job)
+    Worker(processes=0).run(burst=True)
+    job.refresh_from_db()
+    assert (job.status, job.attempts) == (Job.Status.FAILED, 3)
+    assert calls == ["flaky"] * 3
+    assert queue.backoff(20) == 3600
+
+
+@pytest.mark.django_db
+def test_retry_succeeds():
+    job = enqueue("tests.flaky", {"failures": 1})
+    Worker(processes=0).run(burst=True)
+    make_due(job)
+    Worker(processes=0).run(burst=True)
+    job.refresh_from_db()
+    assert (job.status, job.attempts, job.result, job.error) == (
+        Job.Status.SUCCEEDED, 2, "ok", ""
+    )
+
+
+@pytest.mark.django_db
+def test_a_job_is_claimed_once(monkeypatch):
+    # Pool processes recycle their connection per job; the test's must stay.
+    monkeypatch.setattr("django.db.close_old_connections", lambda: None)
+    job = enqueue("tests.record", {"value": 1})
+    [claimed] = claim("a", 5)
+    assert claim("b", 5) == []
+
+    # The pool process only runs the job under the claim it was given.
+    assert execute(job.pk, "someone else") is None
+    assert execute(job.pk, claimed.claimed_by) == Job.Status.SUCCEEDED
+    assert calls == [1]
+
+
+@pytest.mark.django_db
+def test_stale_jobs_are_requeued_and_late_results_dropped():
+    retry = enqueue("tests.record", {"value": 1})
+    done = enqueue("tests.record", {"value": 2})
+    Job.objects.filter(pk=done.pk).update(max_attempts=1)
+    stale = claim("dead", 2)
+    Job.objects.update(claimed_at=timezone.now() - timedelta(hours=1))
+
+    assert requeue_stale() == (1, 1)
+    assert Job.objects.get(pk=done.pk).status == Job.Status.FAILED
+    assert Job.objects.get(pk=retry.pk).status == Job.Status.QUEUED
+
+    # The dead worker's run finishing late does not clobber the new state.
+    run_job(stale[0])
+    assert Job.objects.get(pk=retry.pk).status == Job.Status.QUEUED
+
+
+@pytest.mark.django_db
+def test_lost_runs_are_released_and_the_worker_goes_on(monkeypatch):
+    lost = enqueue("tests.record", {"value": 1})
+    enqueue("tests.record", {"value": 2})
+    run_job = worker.run_job
+
+    def locked_once(job):
+        if job.pk == lost.pk:
+            raise OperationalError("database is locked")
+        return run_job(job)
+
+    monkeypatch.setattr(worker, "run_job", locked_once)
+    assert Worker(processes=0).run(burst=True) == 2
+
+    lost.refresh_from_db()
+    assert (lost.status, lost.attempts) == (Job.Status.QUEUED, 1)
+    assert lost.error == "OperationalError: database is locked"
+    assert calls == [2]
+
+
+@pytest.mark.django_db
+def test_a_broken_pool_is_replaced(monkeypatch):
+    job = enqueue("tests.record", {"value": 1})
+    pools = []
+
+    def pool(self):
+        pools.append(ThreadPoolExecutor(1))
+        return pools[-1]
+
+    def oom_killed(job_id, token):
+        raise BrokenProcessPool("A process in the process pool was terminated abruptly")
+
+    monkeypatch.setattr(Worker, "pool", pool)
+    monkeypatch.setattr(worker, "execute", oom_killed)
+    monkeypatch.setattr(worker.connections, "close_all", lambda: None)
+    Worker(processes=2).run(burst=True)
+
+    assert len(pools) == 2
+    job.refresh_from_db()
+    assert (job.status, job.attempts) == (Job.Status.QUEUED, 1)
+    assert job.error.startswith("BrokenProcessPool")
+
+
+@pytest.mark.django_db
+def test_status_endpoint_shows_own_jobs(make_org, api_client):
+    org = make_org()
+    mine = enqueue("tests.record", {"value": 1}, created_by_id=org.manager.pk)
+    theirs = enqueue("tests.record", {"value": 2}, created_by_id=org.employee_user.pk)
+
+    api_client.force_authenticate(org.manager)
+    response = api_client.get(URL)
+    assert [row["id"] for row in response.data["data"]] == [mine.pk]
+    assert api_client.get(f"{URL}{theirs.pk}/").status_code == 404
+    assert api_client.get(f"{URL}{mine.pk}/").data["data"]["status"] == "QUEUED"
+
+    api_client.force_authenticate(org.admin)
+    assert [row["id"] for row in api_client.get(URL).data["data"]] == [theirs.pk, mine.pk]
+    assert api_client.get(URL, {"status": "succeeded"}).data["data"] == []
+
+
+@pytest.mark.django_db
+def test_background_import(make_org, api_client, settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    org = make_org(1)
+    rows = f",{org.department.pk},Ann,ann@corp.com,1,Dev,\n,{org.department.pk},Bob,bad,2,Dev,"
+    text = "company,department,name,email,mobile,designation,hired_on\n" + rows
+    api_client.force_authenticate(org.manager)
+
+    response = api_client.post(
+        "/core/api/employees/import/",
+        {"file": SimpleUploadedFile("staff.csv", text.encode()), "background": "true"},
+        format="multipart",
+    )
+    assert response.status_code == 202
+    job_id = response.data["data"]["job"]
+    assert not Employee.objects.filter(email="ann@corp.com").exists()
+
+    Worker(processes=0).run(burst=True)
+
+    job = api_client.get(f"{URL}{job_id}/").data["data"]
+    assert job["status"] == "SUCCEEDED"
+    assert (job["result"]["created"], job["result"]["failed"]) == (1, 1)
+    assert Employee.objects.filter(email="ann@corp.com").exists()
+    assert not list((tmp_path / settings.JOBS_UPLOAD_DIR).iterdir())
+
+    api_client.force_authenticate(None)
+    token = api_client.post(
+        "/accounts/api/login/",
+        {"email_or_username": org.manager.email, "password": "pass"},
+        format="json",
+    ).data["data"]["access"]
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    queued = api_client.post(
+        "/core/api/employees/import/",
+        {"file": SimpleUploadedFile("more.csv", text.encode()), "background": "true"},
+        format="multipart",
+    )
+    assert queued.status_code == 202
+    assert Job.objects.get(pk=queued.data["data"]["job"]).created_by_id == org.manager.pk
+    assert api_client.get(f"{URL}{queued.data['data']['job']}/").status_code == 200
+
+    bad = api_client.post(
+        "/core/api/employees/import/",
+        {"file": SimpleUploadedFile("staff.xls", b""), "background": "1"},
+        format="multipart",
+    )
+    assert bad.status_code == 400
+
+
+@pytest.mark.django_db
+def test_review_reminders(make_org):
+    org = make_org()
+    now = timezone.now()
+    soon, later = org.employees[:2]
+    for employee, when in ((soon, now + timedelta(hours=3)), (later, now + timedelta(days=3))):
+        EmployeeReview.objects.create(
+            employee=employee,
+            current_stage=EmployeeReview.Stage.REVIEW_SCHEDULED,
+            review_date=when,
+        )
+
+    job = enqueue("reviews.send_review_reminders")
+    Worker(processes=0).run(burst=True)
+
+    assert Job.objects.get(pk=job.pk).result == {"sent": 1}
+    assert [m.to for m in mail.outbox] == [[soon.email]]
@@ -0,0 +1,49 @@
+# jobs/views.py
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+
+from accounts.scope import get_scope
+from config.pagination import CustomPagination
+from config.response import CustomResponse
+
+from .models import Job
+from .serializers import JobSerializer
+
+
+class JobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Status of background jobs, e.g. the ``job`` id returned by a queued
+    import. Users see the jobs they started; admins see every job.
+    """
+
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+    # Scoped by owner in get_queryset; a job's company says nothing about
+    # who may read it.
+    permission_classes = [IsAuthenticated]
+    pagination_class = CustomPagination
+    ordering = ["-id"]
+
+    def get_queryset(self):
+        queryset = super().get_queryset().order_by(*self.ordering)
+        scope = get_scope(self.request)
+        if scope.is_admin:
+            return queryset
+        return queryset.filter(created_by_id=scope.user_id)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        status = request.query_params.get("status")
+        if status:
+            queryset = queryset.filter(status=status.upper())
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return CustomResponse(
+            data=serializer.data,
+            status=200,
+            pagination=self.paginator.get_pagination_meta(),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        serializer = self.get_serializer(self.get_object())
+        return CustomResponse(data=serializer.data, status=200)
@@ -0,0 +1,136 @@
+# jobs/worker.py
+import logging
+import os
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from .models import Job
+from .pool import execute, setup_process
+from .queue import claim, release, requeue_stale, run_job
+
+logger = logging.getLogger("jobs")
+
+
+class Worker:
+    """
+    Claims due jobs and runs them on a pool of ``processes`` processes, or
+    in this process when ``processes`` is 0. Jobs in flight get their claim
+    refreshed every poll, so only a dead worker's jobs ever look stale.
+    """
+
+    def __init__(self, processes=1, poll=None, log=None):
+        self.processes = processes
+        self.poll = poll if poll is not None else settings.JOBS_POLL_SECONDS
+        self.id = f"{socket.gethostname()}:{os.getpid()}"
+        self.log = log or logger.info
+        self.stopping = False
+        self.processed = 0
+
+    def stop(self, *args):
+        self.stopping = True
+
+    def run(self, burst=False):
+        """Work until ``stop()``, or until the queue is empty with ``burst``."""
+        if not self.processes:
+            return self.run_inline(burst)
+
+        # Spawned children open their own connections; close ours so
+        # nothing half-used is left behind in the parent either.
+        connections.close_all()
+        executor = self.pool()
+        running = {}
+        last_sweep = 0.0
+        try:
+            while not self.stopping:
+                last_sweep = self.maintain(running.values(), last_sweep)
+                broken = False
+                for job in claim(self.id, self.processes - len(running)):
+                    try:
+                        running[executor.submit(execute, job.pk, job.claimed_by)] = job.claimed_by
+                    except BrokenProcessPool as exc:
+                        broken = True
+                        self.lost(job.claimed_by, exc)
+
+                if running:
+                    done, _ = wait(running, timeout=self.poll, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        token = running.pop(future)
+                        try:
+                            self.report(future.result())
+                        except BrokenProcessPool as exc:
+                            broken = True
+                            self.lost(token, exc)
+                        except Exception as exc:
+                            self.lost(token, exc)
+
+                if broken:
+                    # A pool process died (e.g. OOM-killed) and took the
+                    # pool with it; whatever was still on it is lost too.
+                    for token in running.values():
+                        self.lost(token, BrokenProcessPool("A pool process died."))
+                    running.clear()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = self.pool()
+                elif not running:
+                    if burst:
+                        break
+                    time.sleep(self.poll)
+        finally:
+            executor.shutdown(wait=True)
+        return self.processed
+
+    def pool(self):
+        return ProcessPoolExecutor(
+            self.processes, mp_context=get_context("spawn"), initializer=setup_process
+        )
+
+    def run_inline(self, burst):
+        last_sweep = 0.0
+        while not self.stopping:
+            last_sweep = self.maintain((), last_sweep)
+            jobs = claim(self.id, 1)
+            if not jobs:
+                if burst:
+                    break
+                time.sleep(self.poll)
+                continue
+            try:
+                self.report(run_job(jobs[0]))
+            except Exception as exc:
+                self.lost(jobs[0].claimed_by, exc)
+        return self.processed
+
+    def maintain(self, tokens, last_sweep):
+        """Refresh our claims and, now and then, requeue dead workers' jobs."""
+        tokens = list(tokens)
+        if tokens:
+            Job.objects.filter(claimed_by__in=tokens, status=Job.Status.RUNNING).update(
+                claimed_at=timezone.now()
+            )
+        now = time.monotonic()
+        if now - last_sweep < settings.JOBS_STALE_SECONDS / 2:
+            return last_sweep
+        requeued, failed = requeue_stale()
+        if requeued or failed:
+            self.log(f"Recovered stale jobs: {requeued} requeued, {failed} failed.")
+        return now
+
+    def lost(self, token, exc):
+        """A run raised instead of recording its outcome; keep working."""
+        logger.error("Job run %s was lost", token, exc_info=exc)
+        try:
+            self.report(release(token, f"{type(exc).__name__}: {exc}"))
+        except Exception:
+            # Still unrecorded: the stale sweep hands it back later.
+            logger.exception("Could not release job run %s", token)
+
+    def report(self, status):
+        if status is not None:
+            self.processed += 1
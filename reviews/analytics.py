@@ -0,0 +1,74 @@
+# reviews/analytics.py
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import ReviewStageSummary, ReviewStageTransition
+
+PERCENTILES = (0.5, 0.9, 0.95)
+
+# Nearest-rank percentiles: the smallest dwell whose CUME_DIST reaches p.
+# The window function and the conditional MINs run in the database, so the
+# log is scanned once per grouping level however large it gets.
+SUMMARY_SQL = """
+WITH ranked AS (
+    SELECT company_id, {department} AS department_id, from_stage, dwell_seconds,
+           CUME_DIST() OVER (
+               PARTITION BY company_id, {department}, from_stage
+               ORDER BY dwell_seconds
+           ) AS cume
+    FROM {table}
+    WHERE created_at >= %s
+)
+SELECT company_id, department_id, from_stage, COUNT(*), AVG(dwell_seconds),
+       {percentiles}
+FROM ranked
+GROUP BY company_id, department_id, from_stage
+"""
+
+
+def summary_sql(per_department):
+    percentiles = ", ".join(
+        f"MIN(CASE WHEN cume >= {p} THEN dwell_seconds END)" for p in PERCENTILES
+    )
+    return SUMMARY_SQL.format(
+        table=connection.ops.quote_name(ReviewStageTransition._meta.db_table),
+        department="department_id" if per_department else "NULL",
+        percentiles=percentiles,
+    )
+
+
+def refresh_stage_summary(days):
+    """
+    Rebuild ReviewStageSummary from the transitions of the last ``days``
+    days: one row per (company, department, stage) and one company-wide row
+    per (company, stage). Returns the number of rows written.
+    """
+    now = timezone.now()
+    since = now - timedelta(days=days)
+    rows = []
+    with connection.cursor() as cursor:
+        for per_department in (True, False):
+            cursor.execute(summary_sql(per_department), [since])
+            rows.extend(cursor.fetchall())
+
+    summaries = [
+        ReviewStageSummary(
+            company_id=company_id,
+            department_id=department_id,
+            stage=stage,
+            window_days=days,
+            transitions=transitions,
+            avg_seconds=avg,
+            p50_seconds=p50,
+            p90_seconds=p90,
+            p95_seconds=p95,
+            refreshed_at=now,
+        )
+        for company_id, department_id, stage, transitions, avg, p50, p90, p95 in rows
+    ]
+    with transaction.atomic():
+        ReviewStageSummary.objects.all().delete()
+        ReviewStageSummary.objects.bulk_create(summaries, batch_size=1000)
+    return len(summaries)
@@ -0,0 +1,7 @@
+from config.async_api import read_routes
+from reviews.views import EmployeeReviewViewSet
+
+# Async (ASGI) twins of the read endpoints in reviews.urls.
+urlpatterns = [
+    *read_routes("reviews", EmployeeReviewViewSet, "review", retrieve_envelope=False),
+]
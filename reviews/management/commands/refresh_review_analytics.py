@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from reviews.analytics import refresh_stage_summary
+
+
+class Command(BaseCommand):
+    help = "Rebuild the review stage dwell-time summary behind the analytics endpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.REVIEW_ANALYTICS_WINDOW_DAYS,
+            help="Only summarise transitions from the last N days.",
+        )
+
+    def handle(self, *args, **options):
+        written = refresh_stage_summary(options["days"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Review analytics refreshed ({written} rows).")
+        )
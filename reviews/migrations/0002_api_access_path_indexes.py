@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-18 09:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_api_access_path_indexes'),
+        ('reviews', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employeereview',
+            index=models.Index(fields=['employee', 'current_stage'], name='reviews_emp_stage_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employeereview',
+            index=models.Index(fields=['current_stage', 'id'], name='reviews_stage_idx'),
+        ),
+    ]
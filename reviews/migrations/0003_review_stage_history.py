@@ -0,0 +1,63 @@
+# Generated by Django 5.2.5 on 2026-10-18 09:50
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def backfill_stage_changed_at(apps, schema_editor):
+    # The real entry time of the current stage is unknown for existing
+    # reviews; the last update is the closest thing we have.
+    EmployeeReview = apps.get_model("reviews", "EmployeeReview")
+    EmployeeReview.objects.update(stage_changed_at=models.F("updated_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_api_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employeereview',
+            name='stage_changed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.RunPython(backfill_stage_changed_at, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='ReviewStageSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('company_id', models.BigIntegerField()),
+                ('department_id', models.BigIntegerField(null=True)),
+                ('stage', models.CharField(choices=[('PENDING_REVIEW', 'Pending Review'), ('REVIEW_SCHEDULED', 'Review Scheduled'), ('FEEDBACK_PROVIDED', 'Feedback Provided'), ('UNDER_APPROVAL', 'Under Approval'), ('REVIEW_APPROVED', 'Review Approved'), ('REVIEW_REJECTED', 'Review Rejected')], max_length=40)),
+                ('window_days', models.PositiveIntegerField()),
+                ('transitions', models.PositiveIntegerField()),
+                ('avg_seconds', models.FloatField()),
+                ('p50_seconds', models.PositiveIntegerField()),
+                ('p90_seconds', models.PositiveIntegerField()),
+                ('p95_seconds', models.PositiveIntegerField()),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['company_id', 'department_id', 'stage'], name='reviews_summary_scope_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ReviewStageTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('company_id', models.BigIntegerField()),
+                ('department_id', models.BigIntegerField()),
+                ('from_stage', models.CharField(choices=[('PENDING_REVIEW', 'Pending Review'), ('REVIEW_SCHEDULED', 'Review Scheduled'), ('FEEDBACK_PROVIDED', 'Feedback Provided'), ('UNDER_APPROVAL', 'Under Approval'), ('REVIEW_APPROVED', 'Review Approved'), ('REVIEW_REJECTED', 'Review Rejected')], max_length=40)),
+                ('to_stage', models.CharField(choices=[('PENDING_REVIEW', 'Pending Review'), ('REVIEW_SCHEDULED', 'Review Scheduled'), ('FEEDBACK_PROVIDED', 'Feedback Provided'), ('UNDER_APPROVAL', 'Under Approval'), ('REVIEW_APPROVED', 'Review Approved'), ('REVIEW_REJECTED', 'Review Rejected')], max_length=40)),
+                ('dwell_seconds', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('review', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='stage_log', to='reviews.employeereview')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['company_id', 'department_id', 'from_stage', 'created_at'], name='reviews_log_scope_idx'), models.Index(fields=['created_at'], name='reviews_log_created_idx')],
+            },
+        ),
+    ]
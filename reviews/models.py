@@ -1,5 +1,8 @@
 # reviews/models.py
-from django.db import models
+from typing import NamedTuple
+
+from django.db import models, transaction
+from django.utils import timezone
 from core.models import Employee
 from django.conf import settings
 
@@ -38,44 +41,300 @@ class EmployeeReview(models.Model):
         related_name="approved_reviews",
     )
 
+    # When current_stage was entered; the dwell time logged on the next move.
+    stage_changed_at = models.DateTimeField(default=timezone.now, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # RBAC joins through employee (company_id) and filters by stage.
+            models.Index(
+                fields=["employee", "current_stage"], name="reviews_emp_stage_idx"
+            ),
+            models.Index(fields=["current_stage", "id"], name="reviews_stage_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if "_stage_log" not in self.__dict__:
+            return super().save(*args, **kwargs)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.write_stage_log()
+
+    def transition(self, action, **values):
+        """
+        Persist ``action`` as ``UPDATE ... WHERE id = %s AND current_stage =
+        <source>`` writing only the stage, timestamps and ``values``, and log
+        it. Raises ``ValueError`` when the guard fails on the loaded row and
+        ``TransitionConflict`` when another request moved the review first.
+        """
+        transition = TRANSITIONS[action]
+        if self.current_stage != transition.source:
+            raise ValueError(transition.error)
+
+        now = timezone.now()
+        # No savepoint: the UPDATE and its log row commit or fail together
+        # with whatever transaction the caller is in.
+        with transaction.atomic(savepoint=False):
+            updated = EmployeeReview.objects.filter(
+                pk=self.pk, current_stage=transition.source
+            ).update(
+                current_stage=transition.target,
+                stage_changed_at=now,
+                updated_at=now,
+                **values,
+            )
+            if updated:
+                self._advance(action, at=now, **values)
+                self.updated_at = now
+                self.write_stage_log()
+        if not updated:
+            raise TransitionConflict(CONFLICT_MESSAGE)
+
+    def write_stage_log(self):
+        pending = self.__dict__.pop("_stage_log", None)
+        if pending:
+            ReviewStageTransition.objects.bulk_create(pending)
+
     # Simple state machine guard methods
+    def _advance(self, action, at=None, **values):
+        transition = TRANSITIONS[action]
+        if self.current_stage != transition.source:
+            raise ValueError(transition.error)
+        at = at or timezone.now()
+        # Written with the next save() (or by transition()).
+        self.__dict__.setdefault("_stage_log", []).append(
+            ReviewStageTransition.entry(
+                self.pk,
+                self.employee.company_id,
+                self.employee.department_id,
+                self.current_stage,
+                transition.target,
+                self.stage_changed_at,
+                at,
+            )
+        )
+        for field, value in values.items():
+            setattr(self, field, value)
+        self.current_stage = transition.target
+        self.stage_changed_at = at
+
     def schedule(self, date, by_user):
-        if self.current_stage != self.Stage.PENDING_REVIEW:
-            raise ValueError("Can schedule only from Pending Review.")
-        self.review_date = date
-        self.submitted_by = by_user
-        self.current_stage = self.Stage.REVIEW_SCHEDULED
+        self._advance("schedule", review_date=date, submitted_by=by_user)
 
     def provide_feedback(self, text, by_user):
-        if self.current_stage != self.Stage.REVIEW_SCHEDULED:
-            raise ValueError("Can provide feedback only after scheduling.")
-        self.feedback = text
-        self.submitted_by = by_user
-        self.current_stage = self.Stage.FEEDBACK_PROVIDED
+        self._advance("provide_feedback", feedback=text, submitted_by=by_user)
 
     def submit_for_approval(self):
-        if self.current_stage != self.Stage.FEEDBACK_PROVIDED:
-            raise ValueError("Submit for approval only after feedback.")
-        self.current_stage = self.Stage.UNDER_APPROVAL
+        self._advance("submit_for_approval")
 
     def approve(self, manager_user):
-        if self.current_stage != self.Stage.UNDER_APPROVAL:
-            raise ValueError("Can approve only when under approval.")
-        self.approved_by = manager_user
-        self.current_stage = self.Stage.REVIEW_APPROVED
+        self._advance("approve", approved_by=manager_user)
 
     def reject(self, manager_user):
-        if self.current_stage != self.Stage.UNDER_APPROVAL:
-            raise ValueError("Can reject only when under approval.")
-        self.approved_by = manager_user
-        self.current_stage = self.Stage.REVIEW_REJECTED
+        self._advance("reject", approved_by=manager_user)
 
     def rework_feedback(self, text, by_user):
-        if self.current_stage != self.Stage.REVIEW_REJECTED:
-            raise ValueError("Rework only after rejection.")
-        self.feedback = text
-        self.submitted_by = by_user
-        self.current_stage = self.Stage.FEEDBACK_PROVIDED
+        self._advance("rework_feedback", feedback=text, submitted_by=by_user)
+
+
+class ReviewStageTransition(models.Model):
+    """
+    Append-only log of stage changes. Company and department are copied
+    from the employee at transition time, so analytics never join back to
+    the employee table and history survives moves and deletes.
+    """
+
+    # No constraint or cascade: the log outlives deleted reviews, and
+    # deleting employees stays a fast delete.
+    review = models.ForeignKey(
+        EmployeeReview,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="stage_log",
+    )
+    company_id = models.BigIntegerField()
+    department_id = models.BigIntegerField()
+    from_stage = models.CharField(max_length=40, choices=EmployeeReview.Stage.choices)
+    to_stage = models.CharField(max_length=40, choices=EmployeeReview.Stage.choices)
+    # Seconds spent in from_stage.
+    dwell_seconds = models.PositiveIntegerField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["company_id", "department_id", "from_stage", "created_at"],
+                name="reviews_log_scope_idx",
+            ),
+            models.Index(fields=["created_at"], name="reviews_log_created_idx"),
+        ]
+
+    @classmethod
+    def entry(cls, review_id, company_id, department_id, from_stage, to_stage, entered_at, at):
+        dwell = (at - entered_at).total_seconds() if entered_at else 0
+        return cls(
+            review_id=review_id,
+            company_id=company_id,
+            department_id=department_id,
+            from_stage=from_stage,
+            to_stage=to_stage,
+            dwell_seconds=max(int(dwell), 0),
+            created_at=at,
+        )
+
+
+class ReviewStageSummary(models.Model):
+    """
+    Stage dwell-time percentiles and throughput per department, plus one
+    company-wide row (``department_id`` NULL) per stage. Rebuilt from
+    ReviewStageTransition by ``manage.py refresh_review_analytics``.
+    """
+
+    company_id = models.BigIntegerField()
+    department_id = models.BigIntegerField(null=True)
+    stage = models.CharField(max_length=40, choices=EmployeeReview.Stage.choices)
+    window_days = models.PositiveIntegerField()
+    transitions = models.PositiveIntegerField()
+    avg_seconds = models.FloatField()
+    p50_seconds = models.PositiveIntegerField()
+    p90_seconds = models.PositiveIntegerField()
+    p95_seconds = models.PositiveIntegerField()
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["company_id", "department_id", "stage"],
+                name="reviews_summary_scope_idx",
+            ),
+        ]
+
+
+class TransitionConflict(Exception):
+    pass
+
+
+CONFLICT_MESSAGE = "Review was changed by another request."
+
+
+class Transition(NamedTuple):
+    source: str
+    target: str
+    error: str
+
+
+Stage = EmployeeReview.Stage
+
+# action -> allowed source stage, resulting stage and the guard's message.
+TRANSITIONS = {
+    "schedule": Transition(
+        Stage.PENDING_REVIEW,
+        Stage.REVIEW_SCHEDULED,
+        "Can schedule only from Pending Review.",
+    ),
+    "provide_feedback": Transition(
+        Stage.REVIEW_SCHEDULED,
+        Stage.FEEDBACK_PROVIDED,
+        "Can provide feedback only after scheduling.",
+    ),
+    "submit_for_approval": Transition(
+        Stage.FEEDBACK_PROVIDED,
+        Stage.UNDER_APPROVAL,
+        "Submit for approval only after feedback.",
+    ),
+    "approve": Transition(
+        Stage.UNDER_APPROVAL,
+        Stage.REVIEW_APPROVED,
+        "Can approve only when under approval.",
+    ),
+    "reject": Transition(
+        Stage.UNDER_APPROVAL,
+        Stage.REVIEW_REJECTED,
+        "Can reject only when under approval.",
+    ),
+    "rework_feedback": Transition(
+        Stage.REVIEW_REJECTED,
+        Stage.FEEDBACK_PROVIDED,
+        "Rework only after rejection.",
+    ),
+}
+
+BULK_UPDATE_BATCH_SIZE = 500
+
+
+def bulk_transition(queryset, action, values, ids=None):
+    """
+    Move the reviews in ``queryset`` (narrowed to ``ids`` when given, else to
+    those in the action's source stage) through ``action``. Guards are checked against one read of ``(id, stage)``; the
+    write is a conditional ``UPDATE ... WHERE current_stage = <source>`` per
+    batch, so a review moved by someone else in between is reported rather
+    than overwritten. Each applied transition is logged. Returns ``{id: error message or None}`` in input order.
+    """
+    transition = TRANSITIONS[action]
+    if ids is not None:
+        queryset = queryset.filter(id__in=ids)
+    else:
+        # Without ids the action applies to whatever is ready for it; the
+        # rest of the department is not a failure.
+        queryset = queryset.filter(current_stage=transition.source)
+    rows = {
+        row[0]: row
+        for row in queryset.order_by("id").values_list(
+            "id",
+            "current_stage",
+            "stage_changed_at",
+            "employee__company_id",
+            "employee__department_id",
+        )
+    }
+
+    results = {}
+    for pk in ids if ids is not None else rows:
+        if pk not in rows:
+            results[pk] = "Not found."
+        elif rows[pk][1] != transition.source:
+            results[pk] = transition.error
+        else:
+            results[pk] = None
+
+    eligible = [pk for pk, error in results.items() if error is None]
+    now = timezone.now()
+    with transaction.atomic(savepoint=False):
+        changed = 0
+        for start in range(0, len(eligible), BULK_UPDATE_BATCH_SIZE):
+            changed += EmployeeReview.objects.filter(
+                id__in=eligible[start : start + BULK_UPDATE_BATCH_SIZE],
+                current_stage=transition.source,
+            ).update(
+                current_stage=transition.target,
+                stage_changed_at=now,
+                updated_at=now,
+                **values,
+            )
+
+        if changed < len(eligible):
+            # Lost some rows to a concurrent transition; ours carry ``now``.
+            ours = set(
+                EmployeeReview.objects.filter(
+                    id__in=eligible, current_stage=transition.target, updated_at=now
+                ).values_list("id", flat=True)
+            )
+            for pk in eligible:
+                if pk not in ours:
+                    results[pk] = CONFLICT_MESSAGE
+
+        ReviewStageTransition.objects.bulk_create(
+            [
+                ReviewStageTransition.entry(
+                    pk, company_id, department_id, stage, transition.target, entered_at, now
+                )
+                for pk, stage, entered_at, company_id, department_id in (
+                    rows[pk] for pk in eligible if results[pk] is None
+                )
+            ],
+            batch_size=BULK_UPDATE_BATCH_SIZE,
+        )
+    return results
@@ -1,6 +1,7 @@
 # reviews/serializers.py
+from django.conf import settings
 from rest_framework import serializers
-from .models import EmployeeReview
+from .models import TRANSITIONS, EmployeeReview, ReviewStageSummary
 
 
 class EmployeeReviewSerializer(serializers.ModelSerializer):
@@ -18,3 +19,47 @@ class EmployeeReviewSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["submitted_by", "approved_by", "created_at", "updated_at"]
+
+
+class ReviewStageSummarySerializer(serializers.ModelSerializer):
+    throughput_per_day = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReviewStageSummary
+        fields = [
+            "company_id",
+            "department_id",
+            "stage",
+            "window_days",
+            "transitions",
+            "throughput_per_day",
+            "avg_seconds",
+            "p50_seconds",
+            "p90_seconds",
+            "p95_seconds",
+            "refreshed_at",
+        ]
+
+    def get_throughput_per_day(self, obj):
+        return round(obj.transitions / obj.window_days, 2) if obj.window_days else None
+
+
+class TransitionSerializer(serializers.Serializer):
+    review_date = serializers.DateTimeField(required=False, allow_null=True)
+    feedback = serializers.CharField(required=False, allow_blank=True, default="")
+
+
+class BulkTransitionSerializer(TransitionSerializer):
+    action = serializers.ChoiceField(choices=list(TRANSITIONS))
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=settings.REVIEW_BULK_MAX_IDS,
+    )
+    department = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        if ("ids" in attrs) == ("department" in attrs):
+            raise serializers.ValidationError("Send either ids or department.")
+        return attrs
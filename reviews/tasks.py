@@ -0,0 +1,45 @@
+# reviews/tasks.py
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import send_mass_mail
+from django.utils import timezone
+
+from jobs.queue import task
+
+from .analytics import refresh_stage_summary
+from .models import EmployeeReview
+
+
+@task("reviews.refresh_review_analytics")
+def refresh_review_analytics(days=None):
+    return {"rows": refresh_stage_summary(days or settings.REVIEW_ANALYTICS_WINDOW_DAYS)}
+
+
+# Not retried: send_mass_mail may fail after some messages went out, and a
+# rerun would send those again.
+@task("reviews.send_review_reminders", max_attempts=1)
+def send_review_reminders(days=None):
+    """Email employees whose review is scheduled within the next ``days``."""
+    now = timezone.now()
+    reviews = (
+        EmployeeReview.objects.filter(
+            current_stage=EmployeeReview.Stage.REVIEW_SCHEDULED,
+            review_date__gte=now,
+            review_date__lt=now + timedelta(days=days or settings.REVIEW_REMINDER_DAYS),
+        )
+        .exclude(employee__email="")
+        .order_by("review_date")
+        .values_list("employee__name", "employee__email", "review_date")
+    )
+    messages = [
+        (
+            "Upcoming performance review",
+            f"Hi {name},\n\nYour review is scheduled for "
+            f"{timezone.localtime(when):%Y-%m-%d %H:%M}.",
+            None,
+            [email],
+        )
+        for name, email, when in reviews.iterator()
+    ]
+    return {"sent": send_mass_mail(messages) if messages else 0}
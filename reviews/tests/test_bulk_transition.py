@@ -0,0 +1,89 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import EmployeeReview
+
+URL = "/reviews/api/reviews/bulk_transition/"
+Stage = EmployeeReview.Stage
+
+
+@pytest.mark.django_db
+def test_manager_approves_a_department_in_one_call(make_org, api_client):
+    org = make_org(size=6)
+    ready = [review.id for review in org.reviews[:5]]
+    EmployeeReview.objects.filter(id__in=ready).update(current_stage=Stage.UNDER_APPROVAL)
+    api_client.force_authenticate(user=org.manager)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.post(
+            URL, {"action": "approve", "department": org.department.id}, format="json"
+        )
+
+    assert response.status_code == 200, response.content
+    assert len(ctx.captured_queries) <= 3
+    # Reviews not yet under approval are left out rather than failed.
+    assert (response.data["data"]["updated"], response.data["data"]["failed"]) == (5, 0)
+    assert [r["id"] for r in response.data["data"]["results"]] == ready
+    approved = EmployeeReview.objects.filter(id__in=ready)
+    assert set(approved.values_list("current_stage", "approved_by")) == {
+        (Stage.REVIEW_APPROVED, org.manager.id)
+    }
+
+    # Named explicitly, the same review is reported.
+    response = api_client.post(
+        URL, {"action": "approve", "ids": [org.reviews[5].id]}, format="json"
+    )
+    assert response.data["data"]["results"] == [
+        {"id": org.reviews[5].id, "ok": False, "error": "Can approve only when under approval."}
+    ]
+
+
+@pytest.mark.django_db
+def test_ids_outside_scope_are_reported_not_found(make_org, api_client):
+    org = make_org()
+    other = make_org()
+    api_client.force_authenticate(user=org.manager)
+
+    response = api_client.post(
+        URL,
+        {
+            "action": "schedule",
+            "ids": [org.reviews[0].id, other.reviews[0].id],
+            "review_date": "2025-09-10T10:00:00Z",
+        },
+        format="json",
+    )
+
+    assert [(r["id"], r["ok"], r["error"]) for r in response.data["data"]["results"]] == [
+        (org.reviews[0].id, True, None),
+        (other.reviews[0].id, False, "Not found."),
+    ]
+    review = EmployeeReview.objects.get(id=org.reviews[0].id)
+    assert review.current_stage == Stage.REVIEW_SCHEDULED
+    assert review.review_date is not None
+    assert EmployeeReview.objects.get(id=other.reviews[0].id).current_stage == Stage.PENDING_REVIEW
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"action": "approve"},
+        {"action": "fly", "ids": [1]},
+        {"action": "approve", "ids": [1], "department": 1},
+    ],
+)
+def test_bulk_transition_validates_payload(make_org, api_client, payload):
+    org = make_org()
+    api_client.force_authenticate(user=org.manager)
+    assert api_client.post(URL, payload, format="json").status_code == 400
+
+
+@pytest.mark.django_db
+def test_employees_cannot_bulk_transition(make_org, api_client):
+    org = make_org()
+    api_client.force_authenticate(user=org.employee_user)
+    response = api_client.post(
+        URL, {"action": "approve", "ids": [org.reviews[0].id]}, format="json"
+    )
+    assert response.status_code == 403
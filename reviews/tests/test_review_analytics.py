@@ -0,0 +1,85 @@
+import pytest
+from datetime import timedelta
+from django.core.management import call_command
+from django.utils import timezone
+from reviews.models import EmployeeReview, ReviewStageTransition
+
+Stage = EmployeeReview.Stage
+URL = "/reviews/api/reviews/analytics/"
+
+
+def log(org, dwell_values, stage=Stage.UNDER_APPROVAL, days_ago=1):
+    at = timezone.now() - timedelta(days=days_ago)
+    ReviewStageTransition.objects.bulk_create(
+        ReviewStageTransition(
+            review_id=org.reviews[0].id,
+            company_id=org.company.id,
+            department_id=org.department.id,
+            from_stage=stage,
+            to_stage=Stage.REVIEW_APPROVED,
+            dwell_seconds=dwell,
+            created_at=at,
+        )
+        for dwell in dwell_values
+    )
+
+
+@pytest.mark.django_db
+def test_transitions_are_logged_with_dwell_time(make_org, api_client):
+    org = make_org()
+    review = org.reviews[0]
+    EmployeeReview.objects.filter(pk=review.pk).update(
+        stage_changed_at=timezone.now() - timedelta(hours=2)
+    )
+    api_client.force_authenticate(user=org.manager)
+
+    api_client.post(f"/reviews/api/reviews/{review.pk}/schedule/", {}, format="json")
+    api_client.post(
+        "/reviews/api/reviews/bulk_transition/",
+        {"action": "provide_feedback", "ids": [review.pk], "feedback": "ok"},
+        format="json",
+    )
+
+    entries = list(
+        ReviewStageTransition.objects.filter(review=review)
+        .order_by("id")
+        .values_list("from_stage", "to_stage", "company_id", "department_id", "dwell_seconds")
+    )
+    assert [e[:4] for e in entries] == [
+        (Stage.PENDING_REVIEW, Stage.REVIEW_SCHEDULED, org.company.id, org.department.id),
+        (Stage.REVIEW_SCHEDULED, Stage.FEEDBACK_PROVIDED, org.company.id, org.department.id),
+    ]
+    assert 7190 <= entries[0][4] <= 7210
+    assert entries[1][4] < 60
+
+
+@pytest.mark.django_db
+def test_refresh_computes_percentiles_per_department_and_company(make_org, api_client):
+    org = make_org()
+    other = make_org()
+    log(org, range(10, 101, 10))
+    log(org, [5000], days_ago=400)  # outside the window
+    log(other, [1, 2, 3])
+
+    call_command("refresh_review_analytics", "--days", "30")
+
+    api_client.force_authenticate(user=org.manager)
+    rows = api_client.get(URL).data["data"]
+    assert {row["department_id"] for row in rows} == {None, org.department.id}
+    for row in rows:
+        assert row["company_id"] == org.company.id
+        assert row["stage"] == Stage.UNDER_APPROVAL
+        assert row["transitions"] == 10
+        assert (row["p50_seconds"], row["p90_seconds"], row["p95_seconds"]) == (50, 90, 100)
+        assert row["avg_seconds"] == 55
+        assert row["throughput_per_day"] == round(10 / 30, 2)
+
+    filtered = api_client.get(URL, {"department": org.department.id}).data["data"]
+    assert [row["department_id"] for row in filtered] == [org.department.id]
+
+
+@pytest.mark.django_db
+def test_employees_cannot_read_analytics(make_org, api_client):
+    org = make_org()
+    api_client.force_authenticate(user=org.employee_user)
+    assert api_client.get(URL).status_code == 403
@@ -0,0 +1,16 @@
+import json
+import pytest
+
+
+@pytest.mark.django_db
+def test_review_export_uses_list_scope(make_org, api_client):
+    org = make_org(2)
+    make_org(2)
+
+    api_client.force_authenticate(org.manager)
+    response = api_client.get("/reviews/api/reviews/export/")
+    lines = b"".join(response.streaming_content).decode().splitlines()
+
+    assert sorted(json.loads(line)["id"] for line in lines) == sorted(
+        r.pk for r in org.reviews
+    )
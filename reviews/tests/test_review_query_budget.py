@@ -0,0 +1,33 @@
+import pytest
+
+BUDGETS = [
+    ("admin", "get", "/reviews/api/reviews/", None, 2),
+    ("admin", "get", "/reviews/api/reviews/?cursor=", None, 2),
+    ("manager", "get", "/reviews/api/reviews/", None, 2),
+    ("manager", "get", "/reviews/api/reviews/{review}/", None, 1),
+    ("employee_user", "get", "/reviews/api/reviews/", None, 2),
+    ("manager", "post", "/reviews/api/reviews/", {"employee": "{employee}"}, 2),
+    (
+        "manager",
+        "post",
+        "/reviews/api/reviews/{review}/schedule/",
+        {"review_date": "2025-09-10T10:00:00Z"},
+        3,
+    ),
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("role,method,path,payload,budget", BUDGETS)
+def test_review_query_budget(
+    make_org, api_client, assert_query_budget, role, method, path, payload, budget
+):
+    org = make_org(25)
+    ids = {"review": org.reviews[-1].pk, "employee": org.employees[-1].pk}
+    if payload:
+        payload = {key: str(value).format(**ids) for key, value in payload.items()}
+
+    api_client.force_authenticate(getattr(org, role))
+    assert_query_budget(
+        api_client, method, path.format(**ids), budget, data=payload, format="json"
+    )
@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+from django.db import connection, connections
+from reviews.models import EmployeeReview, TransitionConflict
+
+Stage = EmployeeReview.Stage
+
+
+def race(review_id, actions, user):
+    """Run each action from its own thread and connection, all at once."""
+    barrier = threading.Barrier(len(actions))
+    outcomes = []
+
+    def worker(action):
+        try:
+            review = EmployeeReview.objects.get(pk=review_id)
+            barrier.wait()
+            try:
+                review.transition(action, approved_by=user)
+                outcomes.append(action)
+            except TransitionConflict:
+                outcomes.append("conflict")
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker, args=(action,)) for action in actions]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_approve_and_reject_only_one_wins(make_org):
+    if connection.vendor != "sqlite":
+        pytest.skip("exercises SQLite WAL locking")
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        assert cursor.fetchone()[0] == "wal"
+
+    org = make_org()
+    for review in org.reviews:
+        EmployeeReview.objects.filter(pk=review.pk).update(current_stage=Stage.UNDER_APPROVAL)
+
+        outcomes = race(review.pk, ["approve", "reject"] * 4, org.manager)
+
+        winners = [o for o in outcomes if o != "conflict"]
+        assert len(outcomes) == 8 and len(winners) == 1
+        final = EmployeeReview.objects.get(pk=review.pk)
+        expected = Stage.REVIEW_APPROVED if winners[0] == "approve" else Stage.REVIEW_REJECTED
+        assert final.current_stage == expected
+
+
+@pytest.mark.django_db
+def test_stale_review_reports_conflict_over_http(make_org, api_client):
+    org = make_org()
+    review = org.reviews[0]
+    EmployeeReview.objects.filter(pk=review.pk).update(current_stage=Stage.UNDER_APPROVAL)
+    api_client.force_authenticate(user=org.manager)
+
+    assert api_client.post(f"/reviews/api/reviews/{review.pk}/approve/").status_code == 201
+    response = api_client.post(f"/reviews/api/reviews/{review.pk}/reject/")
+    assert response.status_code == 400
+    assert response.data["message"] == "Can reject only when under approval."
+
+    stale = EmployeeReview.objects.get(pk=review.pk)
+    stale.current_stage = Stage.UNDER_APPROVAL
+    with pytest.raises(TransitionConflict):
+        stale.transition("reject", approved_by=org.manager)
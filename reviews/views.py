@@ -1,95 +1,202 @@
 # reviews/views.py
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
-from .models import EmployeeReview
-from .serializers import EmployeeReviewSerializer
+from .models import (
+    EmployeeReview,
+    ReviewStageSummary,
+    TransitionConflict,
+    bulk_transition,
+)
+from .serializers import (
+    BulkTransitionSerializer,
+    EmployeeReviewSerializer,
+    ReviewStageSummarySerializer,
+    TransitionSerializer,
+)
+from accounts.permissions import ScopedPermission
+from accounts.scope import get_scope
+from config.conditional import conditional_response
+from config.export import ExportMixin
 from config.response import CustomResponse
+from config.pagination import KeysetPagination
 from rest_framework.exceptions import PermissionDenied
 
-class EmployeeReviewViewSet(viewsets.ModelViewSet):
+class EmployeeReviewViewSet(ExportMixin, viewsets.ModelViewSet):
     queryset = EmployeeReview.objects.select_related("employee")
     serializer_class = EmployeeReviewSerializer
+    permission_classes = [ScopedPermission]
+    pagination_class = KeysetPagination
+    ordering = ["id"]
+    scope_company_attr = "employee.company_id"
 
     def get_queryset(self):
-        user = self.request.user
-        qs = super().get_queryset()
-        if user.role == "ADMIN":
-            return qs
-        if user.role == "MANAGER" and user.company_id:
-            return qs.filter(employee__company_id=user.company_id)
-        if user.role == "EMPLOYEE" and user.company_id:
-            return qs.filter(
-                employee__company_id=user.company_id, user=user
+        # Employees only see reviews about themselves.
+        return get_scope(self.request).filter_own(
+            super().get_queryset(),
+            user_field="employee__user_id",
+            company_field="employee__company_id",
+        )
+
+    def get_list_queryset(self):
+        return self.get_queryset().order_by(*self.ordering)
+
+    @conditional_response
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_list_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            pagination_data = self.paginator.get_pagination_meta()
+            return CustomResponse(
+                data=serializer.data,
+                status=200,
+                pagination=pagination_data,
             )
-        return qs.none()
+
+        serializer = self.get_serializer(queryset, many=True)
+        return CustomResponse(data=serializer.data, status=200)
+
+    @conditional_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
 
     def perform_create(self, serializer):
-        user = self.request.user
-        if user.role == "ADMIN":
+        scope = get_scope(self.request)
+        if scope.is_admin:
             serializer.save()
-        elif user.role == "MANAGER":
+        elif scope.is_manager:
             # Managers can only create for employees in their company
-            emp = serializer.validated_data["employee"]
-            if emp.company_id != user.company_id:
-                raise PermissionDenied("Managers can only create reviews for employees in their own company.")
+            scope.check_company(
+                serializer.validated_data["employee"].company_id,
+                "Managers can only create reviews for employees in their own company.",
+            )
             serializer.save()
         else:
             raise PermissionDenied("Employees cannot create reviews.")
 
     def _check_admin_or_manager(self, review):
-        user = self.request.user
-        if user.role == "ADMIN":
+        scope = get_scope(self.request)
+        if scope.is_admin:
             return
-        if user.role == "MANAGER" and review.employee.company_id == user.company_id:
+        if scope.is_manager and scope.can_access(review.employee.company_id):
             return
         raise PermissionDenied(
             "Only admin or manager of the same company can perform this action."
         )
 
-    @action(detail=True, methods=["post"])
-    def schedule(self, request, pk=None):
+    @action(detail=False, methods=["get"])
+    def analytics(self, request):
+        """
+        Stage dwell-time percentiles and throughput per company and
+        department, read from the summary table that
+        ``refresh_review_analytics`` maintains. Rows with a null
+        ``department_id`` are company-wide.
+        """
+        scope = get_scope(request)
+        if not (scope.is_admin or scope.is_manager):
+            raise PermissionDenied("Only admins and managers can view review analytics.")
+
+        queryset = scope.filter(ReviewStageSummary.objects.all())
+        for param in ("company", "department"):
+            value = request.query_params.get(param)
+            if value:
+                if not value.isdigit():
+                    return CustomResponse(
+                        data={param: "A valid integer is required."}, status=400
+                    )
+                queryset = queryset.filter(**{f"{param}_id": int(value)})
+
+        queryset = queryset.order_by("company_id", "department_id", "stage")
+        serializer = ReviewStageSummarySerializer(queryset, many=True)
+        return CustomResponse(data=serializer.data, status=200)
+
+    @action(detail=False, methods=["post"])
+    def bulk_transition(self, request):
+        """
+        Apply one workflow action to many reviews: ``{"action": "approve",
+        "ids": [...]}`` or ``{"action": "approve", "department": <id>}``.
+        Responds with a per-review result.
+        """
+        scope = get_scope(request)
+        if not (scope.is_admin or scope.is_manager):
+            raise PermissionDenied(
+                "Only admin or manager of the same company can perform this action."
+            )
+
+        serializer = BulkTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        queryset = self.get_queryset()
+        if "department" in data:
+            queryset = queryset.filter(employee__department_id=data["department"])
+
+        results = bulk_transition(
+            queryset,
+            data["action"],
+            self.transition_values(data["action"], data),
+            ids=data.get("ids"),
+        )
+        updated = sum(error is None for error in results.values())
+        return CustomResponse(
+            data={
+                "updated": updated,
+                "failed": len(results) - updated,
+                "results": [
+                    {"id": pk, "ok": error is None, "error": error}
+                    for pk, error in results.items()
+                ],
+            },
+            status=200,
+            message=f"{updated} of {len(results)} reviews updated.",
+        )
+
+    def transition_values(self, action, data):
+        user_id = self.request.user.pk
+        if action == "schedule":
+            return {"review_date": data.get("review_date"), "submitted_by_id": user_id}
+        if action in ("provide_feedback", "rework_feedback"):
+            return {"feedback": data.get("feedback", ""), "submitted_by_id": user_id}
+        if action in ("approve", "reject"):
+            return {"approved_by_id": user_id}
+        return {}
+
+    def apply_transition(self, request, action):
         review = self.get_object()
         self._check_admin_or_manager(review)  # guard
-        review.schedule(request.data.get("review_date"), request.user)
-        review.save()
-        return CustomResponse(data=EmployeeReviewSerializer(review).data ,status=201)
+
+        serializer = TransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            review.transition(
+                action, **self.transition_values(action, serializer.validated_data)
+            )
+        except TransitionConflict as exc:
+            return CustomResponse(data={"detail": str(exc)}, status=409)
+        except ValueError as exc:
+            return CustomResponse(data={"detail": str(exc)}, status=400)
+        return CustomResponse(data=EmployeeReviewSerializer(review).data, status=201)
+
+    @action(detail=True, methods=["post"])
+    def schedule(self, request, pk=None):
+        return self.apply_transition(request, "schedule")
 
     @action(detail=True, methods=["post"])
     def provide_feedback(self, request, pk=None):
-        review = self.get_object()
-        self._check_admin_or_manager(review)
-        review.provide_feedback(request.data.get("feedback", ""), request.user)
-        review.save()
-        return CustomResponse(data=EmployeeReviewSerializer(review).data, status=201)
+        return self.apply_transition(request, "provide_feedback")
 
     @action(detail=True, methods=["post"])
     def submit_for_approval(self, request, pk=None):
-        review = self.get_object()
-        self._check_admin_or_manager(review)
-        review.submit_for_approval()
-        review.save()
-        return CustomResponse(data=EmployeeReviewSerializer(review).data, status=201)
+        return self.apply_transition(request, "submit_for_approval")
 
     @action(detail=True, methods=["post"])
     def approve(self, request, pk=None):
-        review = self.get_object()
-        self._check_admin_or_manager(review)
-        review.approve(request.user)
-        review.save()
-        return CustomResponse(data=EmployeeReviewSerializer(review).data, status=201)
+        return self.apply_transition(request, "approve")
 
     @action(detail=True, methods=["post"])
     def reject(self, request, pk=None):
-        review = self.get_object()
-        self._check_admin_or_manager(review)
-        review.reject(request.user)
-        review.save()
-        return CustomResponse(data=EmployeeReviewSerializer(review).data, status=201)
+        return self.apply_transition(request, "reject")
 
     @action(detail=True, methods=["post"])
     def rework_feedback(self, request, pk=None):
-        review = self.get_object()
-        self._check_admin_or_manager(review)
-        review.rework_feedback(request.data.get("feedback", ""), request.user)
-        review.save()
-        return CustomResponse(data=EmployeeReviewSerializer(review).data, status=201)
+        return self.apply_transition(request, "rework_feedback")